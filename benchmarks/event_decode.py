@@ -0,0 +1,265 @@
+"""Per-event routing overhead: inline dict parsing vs decoded records.
+
+"before" is the if/elif chain BridgeSubscriber used to run for every event
+and every bridge. "after" decodes each event once with
+``agent_tether.events.decode_event`` and dispatches the record through the
+subscriber's handler table. The bridge does nothing, so the numbers are pure
+overhead.
+
+- pipeline: store queue -> consumer -> bridge for one session. Events with
+  nothing to deliver are now dropped on arrival instead of waking the
+  consumer.
+- fan-out xN: routing the same events to a session bound to N bridges. The
+  old chain re-parses (and rebuilds the ApprovalRequest) per bridge and
+  calls them one after another; the subscriber delivers to a single bridge
+  inline and to several concurrently, one task each, so a slow bridge
+  doesn't hold up the others. Every delivery goes through
+  ``BridgeManager.deliver`` (health, breaker), which the old chain skipped.
+
+Usage:
+    python benchmarks/event_decode.py [--events 200000] [--bridges 1 3] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+import structlog
+
+from agent_tether.base import ApprovalRequest, BridgeConfig, BridgeInterface
+from agent_tether.events import decode_event
+from agent_tether.manager import BridgeManager
+from agent_tether.subscriber import BridgeSubscriber
+
+# A turn's worth of events: mostly intermediate steps, one final output, a
+# couple of state changes and the occasional approval.
+MIX = [
+    {"type": "session_state", "data": {"state": "RUNNING"}},
+    *[{"type": "output", "data": {"text": "thinking", "final": False, "kind": "step"}}] * 5,
+    {
+        "type": "permission_request",
+        "data": {"request_id": "req_1", "tool_name": "Bash", "tool_input": {"cmd": "ls -la"}},
+    },
+    {"type": "output", "data": {"text": "Done. Here is the summary.", "final": True}},
+    {"type": "output_final", "data": {"text": "blob"}},
+    {"type": "session_state", "data": {"state": "AWAITING_INPUT"}},
+]
+
+# Events published before the benchmark yields to the consumer, like a store
+# emitting a burst of steps.
+BURST = 64
+
+
+class NullBridge(BridgeInterface):
+    """Bridge whose callbacks do nothing."""
+
+    def __init__(self) -> None:
+        super().__init__(BridgeConfig())
+
+    async def on_output(self, session_id, text, metadata=None):
+        pass
+
+    async def on_approval_request(self, session_id, request):
+        pass
+
+    async def on_status_change(self, session_id, status, metadata=None):
+        pass
+
+    async def create_thread(self, session_id, session_name):
+        return {}
+
+
+async def legacy_route(session_id: str, bridge: BridgeInterface, event: dict) -> None:
+    """The pre-decoding routing chain, kept verbatim for comparison."""
+    event_type = event.get("type")
+    data = event.get("data", {})
+    if data.get("is_history"):
+        return
+    if event_type == "output":
+        if data.get("final"):
+            text = data.get("text", "")
+            if text:
+                await bridge.on_output(session_id, text)
+    elif event_type == "output_final":
+        pass
+    elif event_type == "permission_request":
+        tool_input = data.get("tool_input", {})
+        tool_name = data.get("tool_name", "Permission request")
+        if (
+            isinstance(tool_input, dict)
+            and str(tool_name).startswith("AskUserQuestion")
+            and isinstance(tool_input.get("questions"), list)
+            and tool_input["questions"]
+            and isinstance(tool_input["questions"][0], dict)
+        ):
+            q = tool_input["questions"][0]
+            header = str(q.get("header") or "Question")
+            question = str(q.get("question") or "")
+            options = q.get("options") or []
+            labels: list[str] = []
+            lines: list[str] = [question.strip()] if question else []
+            for i, opt in enumerate(options, start=1):
+                if not isinstance(opt, dict):
+                    continue
+                label = str(opt.get("label") or "").strip()
+                desc = str(opt.get("description") or "").strip()
+                if not label:
+                    continue
+                labels.append(label)
+                if desc:
+                    lines.append(f"{i}. {label} - {desc}")
+                else:
+                    lines.append(f"{i}. {label}")
+
+            request = ApprovalRequest(
+                kind="choice",
+                request_id=data.get("request_id", ""),
+                title=header,
+                description="\n".join([l for l in lines if l]).strip(),
+                options=labels,
+            )
+        else:
+            description = (
+                json.dumps(tool_input) if isinstance(tool_input, dict) else str(tool_input)
+            )
+            request = ApprovalRequest(
+                kind="permission",
+                request_id=data.get("request_id", ""),
+                title=tool_name,
+                description=description,
+                options=["Allow", "Deny"],
+            )
+        await bridge.on_approval_request(session_id, request)
+    elif event_type == "session_state":
+        state = data.get("state", "")
+        if state == "RUNNING":
+            await bridge.on_typing(session_id)
+        elif state == "AWAITING_INPUT":
+            await bridge.on_typing_stopped(session_id)
+        elif state == "ERROR":
+            await bridge.on_typing_stopped(session_id)
+            await bridge.on_status_change(session_id, "error")
+    elif event_type == "error":
+        msg = data.get("message", "Unknown error")
+        await bridge.on_status_change(session_id, "error", {"message": msg})
+
+
+async def pipeline_before(events: list[dict]) -> float:
+    """Old consumer loop: wake per store event, parse and route inline."""
+    bridge = NullBridge()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def consume() -> None:
+        for _ in range(len(events)):
+            await legacy_route("sess", bridge, await queue.get())
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    for i, event in enumerate(events, 1):
+        queue.put_nowait(event)
+        if i % BURST == 0:
+            await asyncio.sleep(0)
+    await consumer
+    return time.perf_counter() - start
+
+
+async def pipeline_after(events: list[dict]) -> float:
+    """BridgeSubscriber: decode on arrival, dispatch records via the handler table."""
+    bridge = NullBridge()
+    manager = BridgeManager()
+    manager.register_bridge("bench", bridge)
+    queues: dict[str, asyncio.Queue] = {}
+    subscriber = BridgeSubscriber(
+        manager,
+        lambda sid: queues.setdefault(sid, asyncio.Queue()),
+        lambda sid, q: None,
+    )
+    subscriber.subscribe("sess", "bench")
+    queue = queues["sess"]
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    for i, event in enumerate(events, 1):
+        queue.put_nowait(event)
+        if i % BURST == 0:
+            await asyncio.sleep(0)
+    while subscriber.queue_depth("sess"):
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    await subscriber.stop()
+    return elapsed
+
+
+async def fanout_before(events: list[dict], bridges: list[BridgeInterface]) -> float:
+    """Each bridge parses every event again."""
+    start = time.perf_counter()
+    for event in events:
+        for bridge in bridges:
+            await legacy_route("sess", bridge, event)
+    return time.perf_counter() - start
+
+
+async def fanout_after(events: list[dict], bridges: list[BridgeInterface]) -> float:
+    """Each event is decoded once and the subscriber fans the record out."""
+    manager = BridgeManager()
+    for i, bridge in enumerate(bridges):
+        manager.register_bridge(f"bench{i}", bridge)
+        manager.bind_session("sess", [f"bench{j}" for j in range(i + 1)])
+    subscriber = BridgeSubscriber(manager, lambda sid: asyncio.Queue(), lambda s, q: None)
+    subscriber.subscribe("sess")
+    route = subscriber._route_event
+    start = time.perf_counter()
+    for event in events:
+        record = decode_event(event)
+        if record is None:
+            continue
+        await route("sess", record)
+    elapsed = time.perf_counter() - start
+    await subscriber.stop()
+    return elapsed
+
+
+def best(repeat: int, fn, *args) -> float:
+    """Fastest of ``repeat`` runs, in seconds."""
+    return min(asyncio.run(fn(*args)) for _ in range(repeat))
+
+
+def row(label: str, before: float, after: float, n: int) -> None:
+    b, a = before / n * 1e9, after / n * 1e9
+    print(f"{label:<14}  {b:>15.0f}  {a:>14.0f}  {b / a:>6.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000, help="store events per run")
+    parser.add_argument("--bridges", type=int, nargs="+", default=[1, 3])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, best is kept")
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    events = (MIX * (args.events // len(MIX) + 1))[: args.events]
+    n = len(events)
+    print(f"{'':<14}  {'before ns/event':>15}  {'after ns/event':>14}  {'speedup':>7}")
+    row(
+        "pipeline",
+        best(args.repeat, pipeline_before, events),
+        best(args.repeat, pipeline_after, events),
+        n,
+    )
+    for count in args.bridges:
+        bridges = [NullBridge() for _ in range(count)]
+        row(
+            f"fan-out x{count}",
+            best(args.repeat, fanout_before, events, bridges),
+            best(args.repeat, fanout_after, events, bridges),
+            n,
+        )
+
+
+if __name__ == "__main__":
+    main()
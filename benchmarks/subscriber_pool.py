@@ -0,0 +1,186 @@
+"""Compare BridgeSubscriber's per-session tasks against the worker pool.
+
+For each session count, subscribes every session, publishes a burst of final
+output events to all of them and waits until the bridge has seen every event.
+Reports live asyncio tasks, memory held by the subscriptions and throughput.
+
+Modes:
+
+- before: the original ``_consume`` loop, one task per session reading the
+  store queue directly (``LegacySubscriber`` below).
+- per-task: the current subscriber with ``workers=0``.
+- pool(N): the current subscriber with a pool of N workers.
+
+Usage:
+    python benchmarks/subscriber_pool.py [--events 20] [--workers 8] [--sessions 10 1000 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+import tracemalloc
+
+import structlog
+
+from agent_tether.base import BridgeConfig, BridgeInterface
+from agent_tether.manager import BridgeManager
+from agent_tether.subscriber import BridgeSubscriber
+
+
+class CountingBridge(BridgeInterface):
+    """Bridge that only counts deliveries."""
+
+    def __init__(self, expected: int) -> None:
+        super().__init__(BridgeConfig())
+        self.count = 0
+        self.expected = expected
+        self.done = asyncio.Event()
+
+    async def on_output(self, session_id, text, metadata=None):
+        self.count += 1
+        if self.count >= self.expected:
+            self.done.set()
+
+    async def on_approval_request(self, session_id, request):
+        pass
+
+    async def on_status_change(self, session_id, status, metadata=None):
+        pass
+
+    async def create_thread(self, session_id, session_name):
+        return {}
+
+
+class LegacySubscriber:
+    """The original one-task-per-session subscriber, kept for comparison.
+
+    Only the ``output`` branch of its routing chain is kept; the benchmark
+    publishes nothing else.
+    """
+
+    def __init__(self, bridge_manager, new_subscriber, remove_subscriber) -> None:
+        self._bridge_manager = bridge_manager
+        self._new_subscriber = new_subscriber
+        self._remove_subscriber = remove_subscriber
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._queues: dict[str, asyncio.Queue] = {}
+
+    def subscribe(self, session_id: str, platform: str) -> None:
+        if session_id in self._tasks:
+            return
+        queue = self._new_subscriber(session_id)
+        self._queues[session_id] = queue
+        task = asyncio.create_task(self._consume(session_id, platform, queue))
+        self._tasks[session_id] = task
+
+    async def stop(self) -> None:
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        self._queues.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _consume(self, session_id: str, platform: str, queue: asyncio.Queue) -> None:
+        bridge = self._bridge_manager.get_bridge(platform)
+        if not bridge:
+            return
+        try:
+            while True:
+                event = await queue.get()
+                event_type = event.get("type")
+                data = event.get("data", {})
+                if data.get("is_history"):
+                    continue
+                try:
+                    if event_type == "output":
+                        if data.get("final"):
+                            text = data.get("text", "")
+                            if text:
+                                await bridge.on_output(session_id, text)
+                except Exception:
+                    pass
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._remove_subscriber(session_id, queue)
+
+
+class Store:
+    """Minimal in-memory store handing out one queue per session."""
+
+    def __init__(self) -> None:
+        self.queues: dict[str, asyncio.Queue] = {}
+
+    def new_subscriber(self, session_id: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        self.queues[session_id] = queue
+        return queue
+
+    def remove_subscriber(self, session_id: str, queue: asyncio.Queue) -> None:
+        self.queues.pop(session_id, None)
+
+
+async def run(sessions: int, events: int, workers: int | None) -> dict:
+    """Benchmark one mode; ``workers`` None runs the legacy subscriber."""
+    bridge = CountingBridge(expected=sessions * events)
+    manager = BridgeManager()
+    manager.register_bridge("bench", bridge)
+    store = Store()
+    subscriber: BridgeSubscriber | LegacySubscriber
+    if workers is None:
+        subscriber = LegacySubscriber(manager, store.new_subscriber, store.remove_subscriber)
+    else:
+        subscriber = BridgeSubscriber(
+            manager, store.new_subscriber, store.remove_subscriber, workers=workers
+        )
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for i in range(sessions):
+        subscriber.subscribe(f"sess_{i}", "bench")
+    await asyncio.sleep(0)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    tasks = len(asyncio.all_tasks()) - 1  # minus this coroutine's task
+
+    event = {"type": "output", "data": {"text": "x", "final": True}}
+    start = time.perf_counter()
+    for _ in range(events):
+        for queue in store.queues.values():
+            queue.put_nowait(event)
+    await bridge.done.wait()
+    elapsed = time.perf_counter() - start
+
+    await subscriber.stop()
+    return {
+        "tasks": tasks,
+        "memory_kib": (after - before) / 1024,
+        "events_per_s": bridge.count / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20, help="events per session")
+    parser.add_argument("--workers", type=int, default=8, help="pool size")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[10, 1_000, 10_000])
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    print(f"{'sessions':>8}  {'mode':<10}  {'tasks':>6}  {'memory KiB':>10}  {'events/s':>10}")
+    for sessions in args.sessions:
+        modes = (("before", None), ("per-task", 0), (f"pool({args.workers})", args.workers))
+        for label, workers in modes:
+            r = asyncio.run(run(sessions, args.events, workers))
+            print(
+                f"{sessions:>8}  {label:<10}  {r['tasks']:>6}  "
+                f"{r['memory_kib']:>10.1f}  {r['events_per_s']:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
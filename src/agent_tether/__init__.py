@@ -6,14 +6,19 @@ from agent_tether.base import (
     BridgeCallbacks,
     BridgeConfig,
     BridgeInterface,
+    DeliveryError,
     GetSessionDirectory,
     GetSessionInfo,
     HumanInput,
     OnSessionBound,
 )
-from agent_tether.manager import BridgeManager
+from agent_tether.cursors import CursorStore
+from agent_tether.dead_letter import DeadLetter
+from agent_tether.health import HealthSnapshot
+from agent_tether.manager import BridgeManager, PlatformResult
+from agent_tether.outbound import OutboundDispatcher
 from agent_tether.runner.protocol import Runner, RunnerEvents, RunnerUnavailableError
-from agent_tether.subscriber import BridgeSubscriber
+from agent_tether.subscriber import BridgeSubscriber, SubscribeManyResult, SubscriberStats
 
 __all__ = [
     # Core types
@@ -22,13 +27,21 @@ __all__ = [
     "BridgeCallbacks",
     "BridgeConfig",
     "BridgeInterface",
+    "DeliveryError",
     "GetSessionDirectory",
     "GetSessionInfo",
     "HumanInput",
     "OnSessionBound",
     # Manager and subscriber
     "BridgeManager",
+    "PlatformResult",
+    "HealthSnapshot",
+    "OutboundDispatcher",
     "BridgeSubscriber",
+    "SubscriberStats",
+    "SubscribeManyResult",
+    "CursorStore",
+    "DeadLetter",
     # Runner protocol
     "Runner",
     "RunnerEvents",
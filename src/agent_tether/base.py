@@ -10,18 +10,36 @@ import asyncio
 import structlog
 import os
 import time
+import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import json
 import re
 from pathlib import Path
-from typing import Callable, Awaitable, Literal
+from typing import TYPE_CHECKING, Any, Callable, Awaitable, Hashable, Literal, TypeVar
 
 from pydantic import BaseModel
 
+from agent_tether import markdown as md
+from agent_tether.outbound import OutboundDispatcher, PacingPolicy, TransientFn
+
+if TYPE_CHECKING:
+    from agent_tether.events import Event
+
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
+
+class DeliveryError(RuntimeError):
+    """Raised by a bridge's outgoing hooks when a message could not be sent.
+
+    Platform bridges raise it once the outbound dispatcher has given up on
+    a call, so ``BridgeManager`` counts the failure and ``BridgeSubscriber``
+    can dead-letter the event instead of it being dropped.
+    """
+
 
 @dataclass
 class BridgeConfig:
@@ -175,6 +193,8 @@ class BridgeInterface(ABC):
         self._get_session_directory = get_session_directory
         self._get_session_info = get_session_info
         self._on_session_bound = on_session_bound
+        # Told about every binding before the host's on_session_bound
+        self._session_bound_listeners: list[OnSessionBound] = []
         # External session cache and pagination
         self._cached_external: list[dict] = []
         self._external_query: str | None = None
@@ -193,6 +213,8 @@ class BridgeInterface(ABC):
         self._auto_approve_flush_tasks: dict[str, asyncio.Task] = {}
         # Delay before flushing buffered auto-approve notifications (seconds)
         self._auto_approve_flush_delay: float = 1.5
+        # Outgoing platform calls; BridgeManager swaps in a shared one
+        self._dispatcher = OutboundDispatcher()
 
     # ------------------------------------------------------------------
     # Formatting helpers (shared across bridges)
@@ -260,30 +282,47 @@ class BridgeInterface(ABC):
                 out.append(low)
         return " ".join(out)
 
-    def format_tool_input_markdown(
+    def format_tool_input(
         self,
         raw: str,
         *,
-        truncate: int = 400,
-        truncate_code: int = 1400,
-        max_chars: int = 2000,
-    ) -> str:
-        """Format tool_input JSON as readable markdown for Slack/Discord.
-
-        This is best-effort formatting; if parsing fails, returns the raw string.
+        truncate: int | None = 400,
+        truncate_code: int | None = 1400,
+        max_chars: int | None = 2000,
+        max_text: int | None = 2000,
+    ) -> tuple[md.Document, bool]:
+        """Format tool_input JSON as a document each bridge renders in its own markup.
+
+        Each field is a bold label and its value: paths as inline code,
+        commands and file contents as code blocks. Input that isn't a JSON
+        object is kept as plain text.
+
+        Args:
+            raw: The tool_input JSON.
+            truncate: Maximum characters per value, or None for no limit.
+            truncate_code: Maximum characters per code block value.
+            max_chars: Approximate maximum length; later fields are dropped.
+            max_text: Maximum length of input that isn't a JSON object.
+
+        Returns:
+            (document, was_truncated).
         """
         try:
             obj = json.loads(raw) if isinstance(raw, str) else raw
         except Exception:
-            return str(raw)
+            obj = None
 
         if not isinstance(obj, dict):
-            return str(raw)
+            text = str(raw)
+            if max_text is not None and len(text) > max_text:
+                return md.Document(((md.TEXT, text[:max_text] + "..."),)), True
+            return md.Document(((md.TEXT, text),)), False
 
         path_keys = {"file_path", "path", "notebook_path"}
         code_block_keys = {"command", "old_string", "new_string", "content", "new_source"}
 
-        lines: list[str] = []
+        tokens: list[md.Token] = []
+        truncated = False
         total = 0
         for key, value in obj.items():
             key_s = str(key)
@@ -295,26 +334,49 @@ class BridgeInterface(ABC):
                 v = self._humanize_enum_value(value)
 
             limit = truncate_code if key_s in code_block_keys else truncate
-            if len(v) > limit:
+            if limit is not None and len(v) > limit:
                 v = v[:limit] + "..."
+                truncated = True
 
-            # Prevent closing the code block early.
-            v = v.replace("```", "``\\`")
-
+            size = len(label) + len(v) + 2
+            if max_chars is not None and total + size > max_chars and tokens:
+                tokens.append((md.TEXT, "\n...(truncated)"))
+                truncated = True
+                break
+            if tokens:
+                tokens.append((md.TEXT, "\n"))
+            tokens += [(md.STRONG, None), (md.TEXT, label), (md.STRONG_END, None)]
             if key_s in path_keys:
-                part = f"{label}: `{v}`"
+                tokens += [(md.TEXT, ": "), (md.CODE, v)]
             elif key_s in code_block_keys:
-                part = f"{label}:\n```\n{v}\n```"
+                tokens += [(md.TEXT, ":\n"), (md.CODE_BLOCK, v)]
             else:
-                part = f"{label}: {v}"
+                tokens.append((md.TEXT, f": {v}"))
+            total += size + 1
 
-            if total + len(part) > max_chars and lines:
-                lines.append("...(truncated)")
-                break
-            lines.append(part)
-            total += len(part) + 1
+        return md.Document(tuple(tokens)), truncated
+
+    def format_tool_input_markdown(
+        self,
+        raw: str,
+        *,
+        truncate: int = 400,
+        truncate_code: int = 1400,
+        max_chars: int = 2000,
+    ) -> str:
+        """Format tool_input JSON as readable markdown for Discord.
 
-        return "\n".join(lines).strip()
+        See :meth:`format_tool_input`; input that isn't a JSON object is returned
+        as is, up to ``max_chars``.
+        """
+        doc, _ = self.format_tool_input(
+            raw,
+            truncate=truncate,
+            truncate_code=truncate_code,
+            max_chars=max_chars,
+            max_text=max_chars,
+        )
+        return md.render_markdown(doc).strip()
 
     async def _create_session_via_api(
         self,
@@ -667,12 +729,98 @@ class BridgeInterface(ABC):
     # Optional lifecycle hooks (override as needed)
     # ------------------------------------------------------------------
 
+    async def start(self) -> None:
+        """Connect to the platform. Override in platform bridges."""
+
+    async def stop(self) -> None:
+        """Disconnect from the platform. Override in platform bridges."""
+
+    def set_dispatcher(self, dispatcher: OutboundDispatcher) -> None:
+        """Route this bridge's outgoing calls through a shared dispatcher.
+
+        ``BridgeManager.register_bridge`` does this so every registered
+        bridge counts against one global in-flight cap.
+        """
+        self._dispatcher = dispatcher
+
+    def add_session_bound_listener(self, listener: OnSessionBound) -> None:
+        """Also call ``listener`` whenever this bridge binds a session to a thread.
+
+        Listeners run before the host's ``on_session_bound`` callback, which
+        is not called twice if it was added as a listener too.
+        ``BridgeManager.register_bridge`` does this to keep its routing index
+        current.
+        """
+        if listener not in self._session_bound_listeners:
+            self._session_bound_listeners.append(listener)
+
+    async def _session_bound(self, session_id: str, platform: str, thread_id: str | None) -> None:
+        """Report a new binding to the listeners and the host's callback."""
+        for listener in self._session_bound_listeners:
+            await listener(session_id, platform, thread_id)
+        callback = self._on_session_bound
+        if callback is not None and callback not in self._session_bound_listeners:
+            await callback(session_id, platform, thread_id)
+
+    async def _dispatch(
+        self,
+        call: Callable[[], Awaitable[T]],
+        *,
+        session_id: str | None = None,
+        key: Hashable = None,
+        policy: PacingPolicy | None = None,
+        weight: float = 1.0,
+        idempotency_key: str | None = None,
+        transient: TransientFn | None = None,
+    ) -> T:
+        """Send an outgoing platform call through the outbound dispatcher."""
+        return await self._dispatcher.submit(
+            call,
+            session_id=session_id,
+            key=key,
+            policy=policy,
+            weight=weight,
+            idempotency_key=idempotency_key,
+            transient=transient,
+        )
+
+    @staticmethod
+    def _message_key(session_id: str, metadata: dict[str, Any] | None = None) -> str:
+        """Idempotency key for one logical outgoing message.
+
+        Uses ``metadata["idempotency_key"]`` or the event's ``seq`` when the
+        caller passed one, so delivering the same event again maps to the
+        same key; ``BridgeSubscriber`` always passes the former. Otherwise
+        the key is unique to this call.
+        """
+        metadata = metadata or {}
+        explicit = metadata.get("idempotency_key")
+        if explicit is not None:
+            return str(explicit)
+        seq = metadata.get("seq")
+        if seq is not None:
+            return f"{session_id}:{seq}"
+        return f"{session_id}:{uuid.uuid4().hex}"
+
     async def on_typing(self, session_id: str) -> None:
         """Show a typing indicator. Override if platform supports it."""
 
     async def on_typing_stopped(self, session_id: str) -> None:
         """Stop the typing indicator. Override if platform supports it."""
 
+    async def on_events(self, session_id: str, events: list[Event]) -> None:
+        """Handle a burst of decoded store events for a session in one call.
+
+        ``BridgeSubscriber(max_batch=N)`` hands everything that is ready for a
+        session to this hook at once when a bridge overrides it, so the bridge
+        can build one message or API call from many events. The default
+        delivers each event through the per-event hooks.
+        """
+        from agent_tether.events import deliver_event
+
+        for event in events:
+            await deliver_event(session_id, self, event)
+
     def set_pending_permission(self, session_id: str, request: ApprovalRequest) -> None:
         """Track a pending permission request for a session."""
         self._pending_permissions[session_id] = request
@@ -832,7 +980,12 @@ class BridgeInterface(ABC):
 
     @abstractmethod
     async def on_output(self, session_id: str, text: str, metadata: dict | None = None) -> None:
-        """Handle agent output text."""
+        """Handle agent output text.
+
+        Raises:
+            DeliveryError: The message could not be sent. The same applies
+                to ``on_approval_request`` and ``on_status_change``.
+        """
         pass
 
     @abstractmethod
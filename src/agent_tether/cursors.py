@@ -0,0 +1,116 @@
+"""Persisted delivery cursors for resumable subscriptions.
+
+Stores that stamp events with a monotonically increasing ``seq`` let the
+subscriber remember, per session, the last sequence number it delivered.
+After a restart ``BridgeSubscriber.subscribe(..., since=cursor)`` resumes
+from there: anything at or below the cursor is skipped and history replayed
+past it is delivered.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from agent_tether.base import BridgeConfig
+
+logger = structlog.get_logger(__name__)
+
+# File name used under BridgeConfig.data_dir
+CURSORS_FILENAME = "cursors.json"
+
+
+class CursorStore:
+    """Persists the last delivered sequence number per session.
+
+    Cursors only move forward. Writes are debounced: advancing a cursor marks
+    the store dirty and schedules a save ``flush_delay`` seconds later, so a
+    burst of deliveries costs one write. Call :meth:`flush` on shutdown.
+
+    Args:
+        path: JSON file to persist to.
+        flush_delay: Seconds to wait before writing after a cursor moves.
+            0 writes on every change.
+    """
+
+    def __init__(self, path: str | Path, *, flush_delay: float = 1.0) -> None:
+        self._path = Path(path)
+        self._flush_delay = max(0.0, flush_delay)
+        self._cursors: dict[str, int] = {}
+        self._dirty = False
+        self._timer: asyncio.TimerHandle | None = None
+
+    @classmethod
+    def for_config(cls, config: BridgeConfig, **kwargs: Any) -> CursorStore:
+        """Create a store at ``cursors.json`` under ``config.data_dir``, loaded."""
+        store = cls(Path(config.data_dir) / CURSORS_FILENAME, **kwargs)
+        store.load()
+        return store
+
+    def load(self) -> None:
+        """Load cursors from disk."""
+        if not self._path.exists():
+            return
+        try:
+            raw = json.loads(self._path.read_text("utf-8"))
+            if not isinstance(raw, dict):
+                return
+            for session_id, seq in raw.items():
+                if isinstance(seq, int) and not isinstance(seq, bool):
+                    self._cursors[str(session_id)] = seq
+            logger.info("Loaded delivery cursors", count=len(self._cursors))
+        except Exception:
+            logger.exception("Failed to load delivery cursors", path=str(self._path))
+
+    def save(self) -> None:
+        """Write cursors to disk now."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._cursors, indent=2, sort_keys=True) + "\n", "utf-8")
+            tmp.replace(self._path)
+            self._dirty = False
+        except Exception:
+            logger.exception("Failed to save delivery cursors", path=str(self._path))
+
+    def flush(self) -> None:
+        """Write pending changes, if any."""
+        if self._dirty:
+            self.save()
+
+    def get(self, session_id: str) -> int | None:
+        """Last delivered sequence number for a session, or None."""
+        return self._cursors.get(session_id)
+
+    def advance(self, session_id: str, seq: int) -> None:
+        """Record delivery up to ``seq``. Ignored if the cursor is already past it."""
+        current = self._cursors.get(session_id)
+        if current is not None and seq <= current:
+            return
+        self._cursors[session_id] = seq
+        self._mark_dirty()
+
+    def remove(self, session_id: str) -> None:
+        """Forget a session's cursor."""
+        if self._cursors.pop(session_id, None) is not None:
+            self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self._timer is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or not self._flush_delay:
+            self.save()
+            return
+        self._timer = loop.call_later(self._flush_delay, self.save)
@@ -0,0 +1,188 @@
+"""Dead-letter queue for bridge deliveries that failed.
+
+``BridgeSubscriber`` parks events whose delivery raised here, one queue per
+bridge, and retries them with exponential backoff until they go through or
+run out of attempts. The most recent exhausted letters stay in the queue for
+inspection and manual replay.
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+from dataclasses import dataclass, field
+
+from agent_tether.events import Event
+
+
+@dataclass
+class DeadLetter:
+    """A failed delivery waiting to be retried.
+
+    Attributes:
+        id: Identifier, unique within the process.
+        platform: The bridge the event was meant for.
+        session_id: The session the event belongs to.
+        event: The decoded event to redeliver.
+        attempts: Delivery attempts so far, including the original one.
+        error: The most recent failure.
+        failed_at: Wall-clock time of the original failure.
+        next_attempt_at: ``time.monotonic()`` deadline of the next automatic
+            retry, or None once attempts are exhausted.
+        seqs: Sequence numbers of the store events the letter delivers.
+            Coalesced output covers several.
+        idempotency_key: Key the failed delivery was sent under. Retries
+            reuse it, so parts of the event that did go out aren't sent
+            again.
+    """
+
+    id: int
+    platform: str
+    session_id: str
+    event: Event
+    attempts: int
+    error: str
+    failed_at: float = field(default_factory=time.time)
+    next_attempt_at: float | None = None
+    seqs: tuple[int, ...] = ()
+    idempotency_key: str | None = None
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether automatic retries have given up on this letter."""
+        return self.next_attempt_at is None
+
+
+_ids = itertools.count(1)
+
+
+class DeadLetterQueue:
+    """Failed deliveries for one bridge, retried with exponential backoff.
+
+    The n-th retry is scheduled ``base_delay * 2 ** (n - 1)`` seconds after
+    the failure that preceded it, capped at ``max_delay``.
+
+    Args:
+        platform: The bridge this queue belongs to.
+        max_attempts: Total delivery attempts, the original one included,
+            before a letter is marked exhausted.
+        base_delay: Seconds before the first retry.
+        max_delay: Upper bound for the backoff.
+        max_exhausted: Exhausted letters to keep; beyond that the one that
+            ran out of retries longest ago is dropped.
+
+    Attributes:
+        dropped: Exhausted letters dropped to stay within ``max_exhausted``.
+    """
+
+    def __init__(
+        self,
+        platform: str,
+        *,
+        max_attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        max_exhausted: int = 100,
+    ) -> None:
+        self.platform = platform
+        self.dropped = 0
+        self._max_attempts = max(1, max_attempts)
+        self._base_delay = max(0.0, base_delay)
+        self._max_delay = max(self._base_delay, max_delay)
+        self._max_exhausted = max(0, max_exhausted)
+        self._letters: dict[int, DeadLetter] = {}
+        self._exhausted: dict[int, None] = {}  # ids, in the order they ran out
+
+    def __len__(self) -> int:
+        return len(self._letters)
+
+    def add(
+        self,
+        session_id: str,
+        event: Event,
+        error: BaseException | str,
+        seqs: tuple[int, ...] = (),
+        idempotency_key: str | None = None,
+    ) -> DeadLetter:
+        """Park an event after its first failed delivery."""
+        letter = DeadLetter(
+            id=next(_ids),
+            platform=self.platform,
+            session_id=session_id,
+            event=event,
+            attempts=1,
+            error=_describe(error),
+            seqs=seqs,
+            idempotency_key=idempotency_key,
+        )
+        self._letters[letter.id] = letter
+        self._schedule(letter)
+        return letter
+
+    def failed(self, letter: DeadLetter, error: BaseException | str) -> None:
+        """Record another failed attempt and schedule the next one."""
+        letter.attempts += 1
+        letter.error = _describe(error)
+        self._schedule(letter)
+
+    def delivered(self, letter: DeadLetter) -> None:
+        """Remove a letter that went through."""
+        self._letters.pop(letter.id, None)
+        self._exhausted.pop(letter.id, None)
+
+    def due(self, now: float | None = None) -> list[DeadLetter]:
+        """Letters whose next automatic retry is due, oldest first."""
+        if now is None:
+            now = time.monotonic()
+        return [
+            letter
+            for letter in self._letters.values()
+            if letter.next_attempt_at is not None and letter.next_attempt_at <= now
+        ]
+
+    def next_due_at(self) -> float | None:
+        """Monotonic time of the earliest scheduled retry, if any."""
+        pending = [
+            letter.next_attempt_at
+            for letter in self._letters.values()
+            if letter.next_attempt_at is not None
+        ]
+        return min(pending) if pending else None
+
+    def letters(
+        self, *, session_id: str | None = None, ids: list[int] | None = None
+    ) -> list[DeadLetter]:
+        """Letters in the queue, oldest first, optionally filtered."""
+        return [
+            letter
+            for letter in self._letters.values()
+            if (session_id is None or letter.session_id == session_id)
+            and (ids is None or letter.id in ids)
+        ]
+
+    def discard(self, *, session_id: str | None = None, ids: list[int] | None = None) -> int:
+        """Drop letters without delivering them. Returns how many were dropped."""
+        dropped = self.letters(session_id=session_id, ids=ids)
+        for letter in dropped:
+            del self._letters[letter.id]
+            self._exhausted.pop(letter.id, None)
+        return len(dropped)
+
+    def _schedule(self, letter: DeadLetter) -> None:
+        if letter.attempts >= self._max_attempts:
+            letter.next_attempt_at = None
+            self._exhausted[letter.id] = None
+            while len(self._exhausted) > self._max_exhausted:
+                oldest = next(iter(self._exhausted))
+                del self._exhausted[oldest]
+                del self._letters[oldest]
+                self.dropped += 1
+            return
+        delay = min(self._base_delay * 2 ** (letter.attempts - 1), self._max_delay)
+        letter.next_attempt_at = time.monotonic() + delay
+
+
+def _describe(error: BaseException | str) -> str:
+    if isinstance(error, BaseException):
+        return f"{type(error).__name__}: {error}"
+    return error
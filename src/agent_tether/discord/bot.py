@@ -1,9 +1,10 @@
 """Discord bridge implementation with command handling and session threading."""
 
 import asyncio
+import functools
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import structlog
 
@@ -11,22 +12,32 @@ from agent_tether.base import (
     ApprovalRequest,
     BridgeCallbacks,
     BridgeConfig,
+    DeliveryError,
     GetSessionDirectory,
     GetSessionInfo,
     OnSessionBound,
     _EXTERNAL_MAX_FETCH,
 )
+from agent_tether.discord.formatting import split_message
 from agent_tether.discord.pairing_state import (
     DiscordPairingState,
     load_or_create as load_pairing_state,
     save as save_pairing_state,
 )
+from agent_tether.outbound import APPROVAL_WEIGHT, Lane, is_transient
+from agent_tether.ratelimit import RateLimiter, RateLimiterStats, default_retry_after
 from agent_tether.text_command_bridge import TextCommandBridge
 
 logger = structlog.get_logger(__name__)
 
 _DISCORD_MSG_LIMIT = 2000
 
+# Discord's message-create bucket allows 5 messages per 5 seconds per channel
+# (threads are channels), plus a global 50 requests/s per bot.
+_CHANNEL_MESSAGES_PER_SECOND = 1
+_CHANNEL_MESSAGE_BURST = 5
+_GLOBAL_REQUESTS_PER_SECOND = 50
+
 
 @dataclass
 class DiscordConfig:
@@ -42,6 +53,10 @@ class DiscordBridge(TextCommandBridge):
 
     Commands (in main channel): !help, !status, !list, !attach, !stop, !usage
     Session input: messages in session threads are forwarded as input.
+
+    Args:
+        rate_limiter: Optional limiter for outgoing messages. Defaults to
+            one enforcing Discord's global and per-channel limits.
     """
 
     def __init__(
@@ -54,6 +69,7 @@ class DiscordBridge(TextCommandBridge):
         get_session_directory: GetSessionDirectory | None = None,
         get_session_info: GetSessionInfo | None = None,
         on_session_bound: OnSessionBound | None = None,
+        rate_limiter: RateLimiter | None = None,
     ):
         dc = discord_config or DiscordConfig()
         data_dir = (config or BridgeConfig()).data_dir or "."
@@ -68,6 +84,7 @@ class DiscordBridge(TextCommandBridge):
         self._bot_token = bot_token
         self._channel_id = channel_id
         self._client: Any = None
+        self._client_task: asyncio.Task[None] | None = None
         self._thread_ids: dict[str, int] = {}  # session_id -> thread_id
         # Pairing / allowlist
         self._pairing_required = dc.require_pairing
@@ -78,6 +95,16 @@ class DiscordBridge(TextCommandBridge):
         self._pairing_code: str | None = None
         # Background typing indicator loops: session_id -> asyncio.Task
         self._typing_tasks: dict[str, asyncio.Task] = {}
+        # Outbound messages are paced per channel/thread bucket
+        self._limiter = rate_limiter or RateLimiter(
+            rate=_GLOBAL_REQUESTS_PER_SECOND,
+            key_rate=_CHANNEL_MESSAGES_PER_SECOND,
+            key_burst=_CHANNEL_MESSAGE_BURST,
+            retry_after=_discord_retry_after,
+        )
+        # Held while a multi-part message is going out, so deliveries to a
+        # thread don't interleave: thread_id -> lane. Dropped once unused.
+        self._send_locks: dict[int, Lane] = {}
         self._fixed_pairing_code = dc.pairing_code
 
         fixed_code = self._fixed_pairing_code
@@ -119,7 +146,14 @@ class DiscordBridge(TextCommandBridge):
                     pass
 
     async def start(self) -> None:
-        """Initialize and start Discord client."""
+        """Initialize and start Discord client.
+
+        Returns once the client has logged in and connected to the gateway.
+
+        Raises:
+            Exception: Login or connection failed (e.g.
+                ``discord.LoginFailure`` for a bad token).
+        """
         try:
             import discord
         except ImportError:
@@ -129,18 +163,29 @@ class DiscordBridge(TextCommandBridge):
         intents = discord.Intents.default()
         intents.message_content = True
         self._client = discord.Client(intents=intents)
+        ready = asyncio.Event()
 
         @self._client.event
         async def on_ready() -> None:
+            ready.set()
             logger.info("Discord client ready", user=self._client.user)
 
         @self._client.event
         async def on_message(message: Any) -> None:
             await self._handle_message(message)
 
-        asyncio.create_task(self._client.start(self._bot_token))
-
-        logger.info("Discord bridge initialized and starting", channel_id=self._channel_id)
+        self._client_task = asyncio.create_task(self._client.start(self._bot_token))
+        waiter = asyncio.create_task(ready.wait())
+        try:
+            await asyncio.wait({self._client_task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+        if not ready.is_set():
+            # start() only returns early if login or the connection failed.
+            self._client_task.result()
+            raise RuntimeError("Discord client stopped before it was ready")
+
+        logger.info("Discord bridge initialized and started", channel_id=self._channel_id)
         if not self._channel_id and self._pairing_code:
             logger.warning(
                 "Discord bridge not configured with a control channel. Run !setup <code> in the desired channel.",
@@ -156,6 +201,8 @@ class DiscordBridge(TextCommandBridge):
         """Stop Discord client."""
         if self._client:
             await self._client.close()
+        if self._client_task and not self._client_task.done():
+            self._client_task.cancel()
         logger.info("Discord bridge stopped")
 
     # ------------------------------------------------------------------
@@ -180,12 +227,14 @@ class DiscordBridge(TextCommandBridge):
     async def _send_not_paired(self, message: Any) -> None:
         """Send a 'not authorized' message."""
         if not self._pairing_required:
-            await message.channel.send(
-                "🔒 Not authorized. Pairing is not required, but an allowlist/pairing may be configured."
+            await self._reply(
+                message,
+                "🔒 Not authorized. Pairing is not required, but an allowlist/pairing may be configured.",
             )
             return
-        await message.channel.send(
-            "🔒 Not paired. DM the bot: `!pair <code>` (pairing code is in the Tether server logs)."
+        await self._reply(
+            message,
+            "🔒 Not paired. DM the bot: `!pair <code>` (pairing code is in the Tether server logs).",
         )
 
     def _ensure_pairing_state_loaded(self) -> None:
@@ -292,8 +341,8 @@ class DiscordBridge(TextCommandBridge):
         elif cmd == "!setup":
             await self._cmd_setup(message, args)
         else:
-            await message.channel.send(
-                f"Unknown command: {cmd}\nUse !help for available commands."
+            await self._reply(
+                message, f"Unknown command: {cmd}\nUse !help for available commands."
             )
 
     # ------------------------------------------------------------------
@@ -316,23 +365,23 @@ class DiscordBridge(TextCommandBridge):
             "!help — Show this help\n\n"
             "Send a text message in a session thread to forward it as input."
         )
-        await message.channel.send(text)
+        await self._reply(message, text)
 
     async def _cmd_setup(self, message: Any, args: str) -> None:
         """Configure the current channel as the bot's control channel."""
         code = (args or "").strip()
         if not code:
-            await message.channel.send("Usage: `!setup <code>`")
+            await self._reply(message, "Usage: `!setup <code>`")
             return
 
         self._ensure_pairing_state_loaded()
         if not self._pairing_code or code != self._pairing_code:
-            await message.channel.send("Invalid setup code.")
+            await self._reply(message, "Invalid setup code.")
             return
 
         channel_id = getattr(getattr(message, "channel", None), "id", None)
         if not channel_id:
-            await message.channel.send("Could not read this channel id.")
+            await self._reply(message, "Could not read this channel id.")
             return
 
         self._channel_id = int(channel_id)
@@ -347,8 +396,8 @@ class DiscordBridge(TextCommandBridge):
 
         save_pairing_state(path=self._pairing_state_path, state=self._pairing_state)
 
-        await message.channel.send(
-            "✅ Setup complete. This channel is now the control channel. Try `!help`."
+        await self._reply(
+            message, "✅ Setup complete. This channel is now the control channel. Try `!help`."
         )
 
     async def _cmd_pair(self, message: Any, args: str) -> None:
@@ -359,24 +408,24 @@ class DiscordBridge(TextCommandBridge):
             return
 
         if not (self._pairing_required or self._fixed_pairing_code):
-            await message.channel.send(
-                "Pairing is not enabled. Set `DISCORD_REQUIRE_PAIRING=1` to enforce it."
+            await self._reply(
+                message, "Pairing is not enabled. Set `DISCORD_REQUIRE_PAIRING=1` to enforce it."
             )
             return
 
         code = (args or "").strip()
         if not code:
-            await message.channel.send("Usage: `!pair <code>`")
+            await self._reply(message, "Usage: `!pair <code>`")
             return
 
         self._ensure_pairing_state_loaded()
         if not self._pairing_code or code != self._pairing_code:
-            await message.channel.send("Invalid pairing code.")
+            await self._reply(message, "Invalid pairing code.")
             return
 
         user_id = getattr(message.author, "id", None)
         if not user_id:
-            await message.channel.send("Could not read your Discord user id.")
+            await self._reply(message, "Could not read your Discord user id.")
             return
 
         self._paired_user_ids.add(int(user_id))
@@ -384,16 +433,17 @@ class DiscordBridge(TextCommandBridge):
         self._pairing_state.paired_user_ids = set(self._paired_user_ids)
         save_pairing_state(path=self._pairing_state_path, state=self._pairing_state)
 
-        await message.channel.send("✅ Paired. You can now use Tether commands.")
+        await self._reply(message, "✅ Paired. You can now use Tether commands.")
 
     async def _cmd_pair_status(self, message: Any) -> None:
         """Handle !pair-status."""
         user_id = getattr(getattr(message, "author", None), "id", None)
         authorized = self._is_authorized_user_id(user_id)
-        await message.channel.send(
+        await self._reply(
+            message,
             f"Pairing required: {self._pairing_required}\n"
             f"Authorized: {authorized}\n"
-            f"Your user id: {user_id}"
+            f"Your user id: {user_id}",
         )
 
     async def _cmd_new(self, message: Any, args: str) -> None:
@@ -410,10 +460,10 @@ class DiscordBridge(TextCommandBridge):
         try:
             adapter, directory = await self._parse_new_args(args, base_session_id=base_session_id)
         except ValueError as e:
-            await message.channel.send(str(e))
+            await self._reply(message, str(e))
             return
         except Exception as e:
-            await message.channel.send(f"Invalid directory: {e}")
+            await self._reply(message, f"Invalid directory: {e}")
             return
 
         dir_short = directory.rstrip("/").rsplit("/", 1)[-1] or "Session"
@@ -432,16 +482,16 @@ class DiscordBridge(TextCommandBridge):
                 session_name=session_name,
             )
         except Exception as e:
-            await message.channel.send(f"Failed to create session: {e}")
+            await self._reply(message, f"Failed to create session: {e}")
             return
 
-        await message.channel.send(f"✅ New {agent_label} session created in {dir_short}.")
+        await self._reply(message, f"✅ New {agent_label} session created in {dir_short}.")
         try:
             thread_id = int(session.get("platform_thread_id") or 0)
         except Exception:
             thread_id = 0
         if thread_id:
-            await message.channel.send(f"🧵 Open thread: <#{thread_id}>")
+            await self._reply(message, f"🧵 Open thread: <#{thread_id}>")
 
     async def _cmd_status(self, message: Any) -> None:
         """Handle !status."""
@@ -449,11 +499,11 @@ class DiscordBridge(TextCommandBridge):
             sessions = await self._callbacks.list_sessions()
         except Exception:
             logger.exception("Failed to fetch sessions for !status")
-            await message.channel.send("Failed to fetch sessions.")
+            await self._reply(message, "Failed to fetch sessions.")
             return
 
         if not sessions:
-            await message.channel.send("No sessions.")
+            await self._reply(message, "No sessions.")
             return
 
         lines = ["Sessions:\n"]
@@ -461,7 +511,7 @@ class DiscordBridge(TextCommandBridge):
             emoji = self._STATE_EMOJI.get(s.get("state", ""), "❓")
             name = s.get("name") or s.get("id", "")[:12]
             lines.append(f"  {emoji} {name}")
-        await message.channel.send("\n".join(lines))
+        await self._reply(message, "\n".join(lines))
 
     async def _cmd_list(self, message: Any, args: str) -> None:
         """Handle !list."""
@@ -477,16 +527,16 @@ class DiscordBridge(TextCommandBridge):
                 self._set_external_view(query)
         except Exception:
             logger.exception("Failed to fetch external sessions")
-            await message.channel.send("Failed to list external sessions.")
+            await self._reply(message, "Failed to list external sessions.")
             return
 
         text, _, _ = self._format_external_page(page)
-        await message.channel.send(text)
+        await self._reply(message, text)
 
     async def _cmd_attach(self, message: Any, args: str) -> None:
         """Handle !attach."""
         if not args:
-            await message.channel.send("Usage: !attach <number> [force]\n\nRun !list first.")
+            await self._reply(message, "Usage: !attach <number> [force]\n\nRun !list first.")
             return
 
         parts = args.split()
@@ -495,17 +545,17 @@ class DiscordBridge(TextCommandBridge):
         try:
             index = int(parts[0]) - 1
         except ValueError:
-            await message.channel.send("Please provide a session number.")
+            await self._reply(message, "Please provide a session number.")
             return
 
         if not self._cached_external:
-            await message.channel.send("No external sessions cached. Run !list first.")
+            await self._reply(message, "No external sessions cached. Run !list first.")
             return
         if not self._external_view:
-            await message.channel.send("No external sessions listed. Run !list first.")
+            await self._reply(message, "No external sessions listed. Run !list first.")
             return
         if index < 0 or index >= len(self._external_view):
-            await message.channel.send(f"Invalid number. Use 1–{len(self._external_view)}.")
+            await self._reply(message, f"Invalid number. Use 1–{len(self._external_view)}.")
             return
 
         external = self._external_view[index]
@@ -540,9 +590,10 @@ class DiscordBridge(TextCommandBridge):
                         pass
 
                     if thread_ok:
-                        await message.channel.send(
+                        await self._reply(
+                            message,
                             f"Already attached. Open thread: <#{existing_thread_id}>\n"
-                            "Use `!attach <number> force` to recreate the thread."
+                            "Use `!attach <number> force` to recreate the thread.",
                         )
                         return
                     else:
@@ -563,7 +614,7 @@ class DiscordBridge(TextCommandBridge):
             try:
                 thread_id = int(thread_info.get("thread_id") or 0)
                 if thread_id:
-                    await message.channel.send(f"🧵 Open thread: <#{thread_id}>")
+                    await self._reply(message, f"🧵 Open thread: <#{thread_id}>")
                     replay = await self._format_external_replay(
                         external["id"],
                         str(external["runner_type"]),
@@ -575,7 +626,7 @@ class DiscordBridge(TextCommandBridge):
                         try:
                             thread = self._client.get_channel(thread_id)
                             if thread:
-                                await thread.send(replay)
+                                await self._send(thread, replay)
                         except Exception:
                             logger.exception(
                                 "Failed to send Discord external session replay",
@@ -585,25 +636,25 @@ class DiscordBridge(TextCommandBridge):
                 logger.exception("Failed to replay external session history into Discord thread")
 
             # Bind platform
-            if self._on_session_bound:
-                await self._on_session_bound(session_id, "discord", thread_info.get("thread_id"))
+            await self._session_bound(session_id, "discord", thread_info.get("thread_id"))
 
             dir_short = external.get("directory", "").rsplit("/", 1)[-1]
-            await message.channel.send(
+            await self._reply(
+                message,
                 f"✅ Attached to {external['runner_type']} session in {dir_short}\n\n"
-                f"A new thread has been created. Send messages there to interact."
+                f"A new thread has been created. Send messages there to interact.",
             )
 
         except Exception as e:
             logger.warning("Failed to attach to external session", error=str(e))
-            await message.channel.send(f"Failed to attach: {e}")
+            await self._reply(message, f"Failed to attach: {e}")
 
     async def _cmd_stop(self, message: Any) -> None:
         """Handle !stop."""
         import discord
 
         if not isinstance(message.channel, discord.Thread):
-            await message.channel.send("Use this command inside a session thread.")
+            await self._reply(message, "Use this command inside a session thread.")
             return
         if not self._is_authorized_user_id(getattr(message.author, "id", None)):
             await self._send_not_paired(message)
@@ -611,15 +662,15 @@ class DiscordBridge(TextCommandBridge):
 
         session_id = self._session_for_thread(message.channel.id)
         if not session_id:
-            await message.channel.send("No session linked to this thread.")
+            await self._reply(message, "No session linked to this thread.")
             return
 
         try:
             await self._callbacks.stop_session(session_id)
-            await message.channel.send("⏹️ Session interrupted.")
+            await self._reply(message, "⏹️ Session interrupted.")
         except Exception as e:
             logger.exception("Failed to interrupt session")
-            await message.channel.send(f"Failed to interrupt: {e}")
+            await self._reply(message, f"Failed to interrupt: {e}")
 
     async def _cmd_usage(self, message: Any) -> None:
         """Show token usage for the session in the current thread."""
@@ -629,20 +680,20 @@ class DiscordBridge(TextCommandBridge):
             return
 
         if not isinstance(message.channel, discord.Thread):
-            await message.channel.send("Use this command inside a session thread.")
+            await self._reply(message, "Use this command inside a session thread.")
             return
 
         session_id = self._session_for_thread(message.channel.id)
         if not session_id:
-            await message.channel.send("No session linked to this thread.")
+            await self._reply(message, "No session linked to this thread.")
             return
 
         try:
             usage = await self._fetch_usage(session_id)
-            await message.channel.send(f"📊 {self._format_usage_text(usage)}")
+            await self._reply(message, f"📊 {self._format_usage_text(usage)}")
         except Exception as e:
             logger.exception("Failed to get usage")
-            await message.channel.send(f"Failed to get usage: {e}")
+            await self._reply(message, f"Failed to get usage: {e}")
 
     # ------------------------------------------------------------------
     # Session input forwarding
@@ -662,7 +713,7 @@ class DiscordBridge(TextCommandBridge):
                 if selected:
                     await self._send_input_or_start_via_api(session_id=session_id, text=selected)
                     self.clear_pending_permission(session_id)
-                    await message.channel.send(f"✅ Selected: {selected}")
+                    await self._reply(message, f"✅ Selected: {selected}")
                     return
 
             parsed = self.parse_approval_text(text)
@@ -670,9 +721,9 @@ class DiscordBridge(TextCommandBridge):
                 ok, msg = await self._handle_approval_text_response(session_id, pending, parsed)
                 if ok:
                     emoji = "✅" if parsed["allow"] else "❌"
-                    await message.channel.send(f"{emoji} {msg}")
+                    await self._reply(message, f"{emoji} {msg}")
                 else:
-                    await message.channel.send("❌ Failed. Request may have expired.")
+                    await self._reply(message, "❌ Failed. Request may have expired.")
                 return
 
         try:
@@ -685,7 +736,69 @@ class DiscordBridge(TextCommandBridge):
             )
         except Exception:
             logger.exception("Failed to forward human input", session_id=session_id)
-            await message.channel.send("Failed to send input.")
+            await self._reply(message, "Failed to send input.")
+
+    # ------------------------------------------------------------------
+    # Outbound scheduling
+    # ------------------------------------------------------------------
+
+    @property
+    def send_stats(self) -> RateLimiterStats:
+        """Queue depth, wait time and retry counters for outgoing messages."""
+        return self._limiter.stats
+
+    async def _send(
+        self,
+        thread: Any,
+        parts: str | Iterable[str],
+        *,
+        session_id: str | None = None,
+        weight: float = 1.0,
+        idempotency_key: str | None = None,
+    ) -> None:
+        """Send a message, or several in order, to a thread through the outbound dispatcher.
+
+        Parts go out back to back at the fastest rate the thread's bucket
+        allows, and nothing else is sent to the thread in between. They are
+        taken from ``parts`` one at a time, so it can be a generator. Network
+        errors and 5xx responses are retried with jittered backoff. With an
+        ``idempotency_key``, parts already delivered under it are skipped.
+        """
+        if isinstance(parts, str):
+            parts = (parts,)
+        lane = self._send_locks.get(thread.id)
+        if lane is None:
+            lane = self._send_locks[thread.id] = Lane()
+        lane.users += 1
+        try:
+            async with lane.lock:
+                for index, part in enumerate(parts):
+                    await self._dispatch(
+                        functools.partial(thread.send, part),
+                        session_id=session_id,
+                        key=thread.id,
+                        policy=self._limiter,
+                        weight=weight,
+                        idempotency_key=(
+                            f"{idempotency_key}:{index}" if idempotency_key is not None else None
+                        ),
+                        transient=_discord_transient,
+                    )
+        finally:
+            lane.users -= 1
+            if not lane.users:
+                del self._send_locks[thread.id]
+
+    async def _reply(self, message: Any, text: str) -> None:
+        """Send a reply to the channel/thread where the command came from."""
+        try:
+            await self._send(message.channel, text)
+        except Exception:
+            logger.exception("Failed to send Discord reply")
+
+    def _is_sending(self, thread_id: int) -> bool:
+        """Whether messages are queued or going out to a thread."""
+        return thread_id in self._send_locks or self._limiter.busy(thread_id)
 
     # ------------------------------------------------------------------
     # Typing indicator
@@ -701,7 +814,9 @@ class DiscordBridge(TextCommandBridge):
             while True:
                 try:
                     thread = self._client.get_channel(thread_id)
-                    if thread:
+                    # Typing is lowest priority: a pending message both
+                    # needs the bucket more and clears the indicator anyway.
+                    if thread and not self._is_sending(thread_id):
                         await thread.typing()
                 except Exception:
                     logger.debug(
@@ -759,10 +874,14 @@ class DiscordBridge(TextCommandBridge):
             thread = self._client.get_channel(thread_id)
             if thread:
                 # Discord has a 2000 char limit per message
-                for i in range(0, len(text), _DISCORD_MSG_LIMIT):
-                    await thread.send(text[i : i + _DISCORD_MSG_LIMIT])
-        except Exception:
-            logger.exception("Failed to send Discord message", session_id=session_id)
+                await self._send(
+                    thread,
+                    split_message(text, _DISCORD_MSG_LIMIT),
+                    session_id=session_id,
+                    idempotency_key=self._message_key(session_id, metadata),
+                )
+        except Exception as exc:
+            raise DeliveryError(f"Failed to send Discord message: {exc}") from exc
 
     async def send_auto_approve_batch(self, session_id: str, items: list[tuple[str, str]]) -> None:
         """Send a batched auto-approve notification to Discord."""
@@ -785,7 +904,7 @@ class DiscordBridge(TextCommandBridge):
         try:
             thread = self._client.get_channel(thread_id)
             if thread:
-                await thread.send(text[:_DISCORD_MSG_LIMIT])
+                await self._send(thread, text[:_DISCORD_MSG_LIMIT], session_id=session_id)
         except Exception:
             pass
 
@@ -810,9 +929,9 @@ class DiscordBridge(TextCommandBridge):
                 "Reply with a number (e.g. `1`) or an exact option label."
             )
             try:
-                await thread.send(text)
-            except Exception:
-                logger.exception("Failed to send Discord choice request", session_id=session_id)
+                await self._send(thread, text, session_id=session_id, weight=APPROVAL_WEIGHT)
+            except Exception as exc:
+                raise DeliveryError(f"Failed to send Discord choice request: {exc}") from exc
             return
 
         reason: str | None = None
@@ -837,9 +956,9 @@ class DiscordBridge(TextCommandBridge):
         try:
             thread = self._client.get_channel(thread_id)
             if thread:
-                await thread.send(text)
-        except Exception:
-            logger.exception("Failed to send Discord approval request", session_id=session_id)
+                await self._send(thread, text, session_id=session_id, weight=APPROVAL_WEIGHT)
+        except Exception as exc:
+            raise DeliveryError(f"Failed to send Discord approval request: {exc}") from exc
 
     async def on_status_change(
         self, session_id: str, status: str, metadata: dict | None = None
@@ -867,9 +986,9 @@ class DiscordBridge(TextCommandBridge):
         try:
             thread = self._client.get_channel(thread_id)
             if thread:
-                await thread.send(text)
-        except Exception:
-            logger.exception("Failed to send Discord status", session_id=session_id)
+                await self._send(thread, text, session_id=session_id)
+        except Exception as exc:
+            raise DeliveryError(f"Failed to send Discord status: {exc}") from exc
 
     async def create_thread(self, session_id: str, session_name: str) -> dict:
         """Create a Discord thread for a session."""
@@ -891,9 +1010,11 @@ class DiscordBridge(TextCommandBridge):
             thread_id = thread.id
             self._thread_ids[session_id] = thread_id
             try:
-                await thread.send(
+                await self._send(
+                    thread,
                     "Tether session thread.\n"
-                    "Send a message here to provide input. Use `!stop` to interrupt, `!usage` for token usage."
+                    "Send a message here to provide input. Use `!stop` to interrupt, `!usage` for token usage.",
+                    session_id=session_id,
                 )
             except Exception:
                 # Thread creation succeeded; welcome message is best-effort.
@@ -922,3 +1043,33 @@ class DiscordBridge(TextCommandBridge):
         """Clean up when a session is deleted."""
         self._stop_typing(session_id)
         await super().on_session_removed(session_id)
+
+
+def _discord_retry_after(exc: BaseException) -> float | None:
+    """Seconds to wait after a Discord 429, else None.
+
+    discord.py retries most 429s itself; this covers ``RateLimited`` and
+    the ``HTTPException`` it raises once its own retries run out.
+    """
+    seconds = default_retry_after(exc)
+    if seconds is not None:
+        return seconds
+    if getattr(exc, "status", None) != 429:
+        return None
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After", 1.0))
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def _discord_transient(exc: BaseException) -> bool:
+    """Whether a Discord error is a network failure or 5xx worth retrying."""
+    if is_transient(exc):
+        return True
+    try:
+        import aiohttp
+    except ImportError:
+        return False
+    # aiohttp's ServerTimeoutError is a connection error too, but ambiguous.
+    return isinstance(exc, aiohttp.ClientConnectionError) and not isinstance(exc, TimeoutError)
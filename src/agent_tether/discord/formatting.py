@@ -0,0 +1,20 @@
+"""Discord message formatting utilities."""
+
+from typing import Iterator
+
+from agent_tether import markdown as md
+
+
+def split_message(text: str, limit: int = 2000) -> Iterator[str]:
+    """Split Markdown into Discord messages of at most ``limit`` characters.
+
+    Lazy and code-fence-aware; see :func:`agent_tether.markdown.split`.
+
+    Args:
+        text: Markdown to split.
+        limit: Maximum characters per message (default 2000 for Discord).
+
+    Returns:
+        Iterator over the messages, in order. Empty for empty text.
+    """
+    return md.split(text, limit)
@@ -0,0 +1,257 @@
+"""Typed records for store events.
+
+Store events arrive as ``{"type": ..., "data": {...}}`` dicts. ``decode_event``
+parses each one once into a small slotted record, so routing code works with
+attributes instead of repeated dict lookups, and one decoded event can be
+handed to any number of bridges. Records are shared, so treat them as
+read-only.
+
+Decoders are looked up by the event's ``type`` in a table that hosts can
+extend with ``register_decoder``.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, ClassVar
+
+from agent_tether.base import ApprovalRequest, BridgeInterface
+
+_delivery_ids = itertools.count(1)
+
+
+@dataclass(slots=True)
+class Event:
+    """Base class for decoded store events.
+
+    Attributes:
+        seq: The store's sequence number for the event, if it sent one.
+        delivery_id: Identifier given to the record when it is created,
+            unique within the process. Retries of the record reuse it, so
+            it stands in for ``seq`` in idempotency keys (see
+            :func:`delivery_key`).
+    """
+
+    # Store event type this record was decoded from.
+    type: ClassVar[str] = ""
+
+    seq: int | None = field(default=None, kw_only=True)
+    delivery_id: int = field(
+        default_factory=_delivery_ids.__next__, kw_only=True, compare=False, repr=False
+    )
+
+
+@dataclass(slots=True)
+class OutputEvent(Event):
+    """A final assistant message for the session's thread."""
+
+    type: ClassVar[str] = "output"
+
+    text: str
+
+
+@dataclass(slots=True)
+class ApprovalEvent(Event):
+    """A permission request or multiple-choice question for the user."""
+
+    type: ClassVar[str] = "permission_request"
+
+    request: ApprovalRequest
+
+
+@dataclass(slots=True)
+class StateEvent(Event):
+    """A session state transition (RUNNING, AWAITING_INPUT, ERROR, ...)."""
+
+    type: ClassVar[str] = "session_state"
+
+    state: str
+
+
+@dataclass(slots=True)
+class ErrorEvent(Event):
+    """An error reported by the agent or runner."""
+
+    type: ClassVar[str] = "error"
+
+    message: str
+
+
+# (data) -> record, or None if the event has nothing for a bridge
+EventDecoder = Callable[[dict[str, Any]], Event | None]
+
+
+def _decode_output(data: dict[str, Any]) -> OutputEvent | None:
+    # Only forward the final assistant message of a turn. Intermediate steps
+    # (thinking, tool calls) have final=False / kind="step" and are skipped.
+    if not data.get("final"):
+        return None
+    text = data.get("text", "")
+    return OutputEvent(text) if text else None
+
+
+def _decode_output_final(data: dict[str, Any]) -> None:
+    # Accumulated blob -- skipped, the per-step final output is used instead.
+    return None
+
+
+def _decode_permission(data: dict[str, Any]) -> ApprovalEvent:
+    tool_input = data.get("tool_input", {})
+    tool_name = data.get("tool_name", "Permission request")
+    request_id = data.get("request_id", "")
+
+    # Special-case multi-choice questions coming through as a "tool".
+    # Codex emits these as AskUserQuestion with a structured schema.
+    if (
+        isinstance(tool_input, dict)
+        and str(tool_name).startswith("AskUserQuestion")
+        and isinstance(tool_input.get("questions"), list)
+        and tool_input["questions"]
+        and isinstance(tool_input["questions"][0], dict)
+    ):
+        q = tool_input["questions"][0]
+        header = str(q.get("header") or "Question")
+        question = str(q.get("question") or "")
+        options = q.get("options") or []
+        labels: list[str] = []
+        lines: list[str] = [question.strip()] if question else []
+        for i, opt in enumerate(options, start=1):
+            if not isinstance(opt, dict):
+                continue
+            label = str(opt.get("label") or "").strip()
+            desc = str(opt.get("description") or "").strip()
+            if not label:
+                continue
+            labels.append(label)
+            if desc:
+                lines.append(f"{i}. {label} - {desc}")
+            else:
+                lines.append(f"{i}. {label}")
+
+        request = ApprovalRequest(
+            kind="choice",
+            request_id=request_id,
+            title=header,
+            description="\n".join([l for l in lines if l]).strip(),
+            options=labels,
+        )
+    else:
+        description = json.dumps(tool_input) if isinstance(tool_input, dict) else str(tool_input)
+        request = ApprovalRequest(
+            kind="permission",
+            request_id=request_id,
+            title=tool_name,
+            description=description,
+            options=["Allow", "Deny"],
+        )
+    return ApprovalEvent(request)
+
+
+def _decode_state(data: dict[str, Any]) -> StateEvent:
+    return StateEvent(data.get("state", ""))
+
+
+def _decode_error(data: dict[str, Any]) -> ErrorEvent:
+    return ErrorEvent(data.get("message", "Unknown error"))
+
+
+_DECODERS: dict[str, EventDecoder] = {
+    "output": _decode_output,
+    "output_final": _decode_output_final,
+    "permission_request": _decode_permission,
+    "session_state": _decode_state,
+    "error": _decode_error,
+}
+
+
+def register_decoder(event_type: str, decoder: EventDecoder) -> None:
+    """Register or replace the decoder for a store event type.
+
+    Args:
+        event_type: The ``type`` field of the store events to decode.
+        decoder: Called with the event's ``data`` dict. Returns a record, or
+            None to drop the event.
+    """
+    _DECODERS[event_type] = decoder
+
+
+def decode_event(event: dict[str, Any], *, since: int | None = None) -> Event | None:
+    """Decode a store event into a typed record.
+
+    Returns None for events no bridge acts on: history replay, intermediate
+    output, and types without a registered decoder.
+
+    Args:
+        event: The store event. An optional top-level ``seq`` (int) is copied
+            to the record.
+        since: Resume cursor. Events with a ``seq`` at or below it were
+            already delivered and are dropped; history replay past it is
+            decoded like live events.
+    """
+    event_type = event.get("type")
+    if not isinstance(event_type, str):
+        return None
+    decoder = _DECODERS.get(event_type)
+    if decoder is None:
+        return None
+    data = event.get("data", {})
+    seq = event.get("seq")
+    if since is not None and seq is not None:
+        if seq <= since:
+            return None
+    elif data.get("is_history"):
+        # Skip history replay events
+        return None
+    record = decoder(data)
+    if record is not None and seq is not None:
+        record.seq = seq
+    return record
+
+
+def delivery_key(session_id: str, event: Event) -> str:
+    """Idempotency key for delivering ``event`` to a session's threads.
+
+    Derived from the store's ``seq`` when it sent one, so a replay after a
+    restart maps to the same key; otherwise from the record's
+    ``delivery_id``, which every retry of the record shares.
+    """
+    if event.seq is not None:
+        return f"{session_id}:{event.seq}"
+    return f"{session_id}:#{event.delivery_id}"
+
+
+def output_metadata(
+    session_id: str, event: Event, idempotency_key: str | None = None
+) -> dict[str, Any]:
+    """``on_output`` metadata for delivering ``event``.
+
+    Carries the event's ``seq``, if it has one, and an ``idempotency_key``
+    (``delivery_key()`` unless one is passed), so delivering the same event
+    again doesn't post the parts that already went out.
+    """
+    metadata: dict[str, Any] = {
+        "idempotency_key": idempotency_key or delivery_key(session_id, event)
+    }
+    if event.seq is not None:
+        metadata["seq"] = event.seq
+    return metadata
+
+
+async def deliver_event(session_id: str, bridge: BridgeInterface, event: Event) -> None:
+    """Deliver a decoded event through the bridge's per-event hooks."""
+    if isinstance(event, OutputEvent):
+        await bridge.on_output(session_id, event.text, metadata=output_metadata(session_id, event))
+    elif isinstance(event, ApprovalEvent):
+        await bridge.on_approval_request(session_id, event.request)
+    elif isinstance(event, StateEvent):
+        if event.state == "RUNNING":
+            await bridge.on_typing(session_id)
+        elif event.state == "AWAITING_INPUT":
+            await bridge.on_typing_stopped(session_id)
+        elif event.state == "ERROR":
+            await bridge.on_typing_stopped(session_id)
+            await bridge.on_status_change(session_id, "error")
+    elif isinstance(event, ErrorEvent):
+        await bridge.on_status_change(session_id, "error", {"message": event.message})
@@ -0,0 +1,162 @@
+"""Per-bridge health tracking and circuit breaking.
+
+``BridgeManager`` keeps one ``BridgeHealth`` per registered bridge. It records
+the outcome and latency of every delivery in a rolling window and drives a
+circuit breaker from the window's error rate:
+
+- ``closed``: deliveries go through.
+- ``open``: the bridge is failing; deliveries are buffered or shed without
+  calling it, until ``reset_timeout`` has passed.
+- ``half_open``: one probe delivery is let through. Success closes the
+  breaker, failure opens it again.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+@dataclass
+class HealthSnapshot:
+    """Point-in-time view of a bridge's health.
+
+    Attributes:
+        platform: Platform identifier.
+        state: Circuit breaker state.
+        calls: Deliveries in the rolling window.
+        error_rate: Fraction of failed deliveries in the window.
+        p50: Median delivery latency in seconds.
+        p95: 95th percentile delivery latency in seconds.
+        p99: 99th percentile delivery latency in seconds.
+        buffered: Deliveries waiting for the breaker to close.
+        shed: Deliveries dropped while the breaker was open.
+    """
+
+    platform: str
+    state: BreakerState
+    calls: int
+    error_rate: float
+    p50: float
+    p95: float
+    p99: float
+    buffered: int = 0
+    shed: int = 0
+
+
+class BridgeHealth:
+    """Rolling delivery stats and circuit breaker for one bridge.
+
+    Args:
+        platform: Platform identifier.
+        window: Number of recent deliveries to keep.
+        failure_threshold: Error rate at or above which the breaker opens.
+            0 disables the breaker; stats are still tracked.
+        min_calls: Deliveries needed in the window before the breaker can
+            open, so one early failure doesn't trip it.
+        reset_timeout: Seconds an open breaker waits before probing.
+    """
+
+    def __init__(
+        self,
+        platform: str,
+        *,
+        window: int = 100,
+        failure_threshold: float = 0.0,
+        min_calls: int = 10,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        self.platform = platform
+        self.state: BreakerState = "closed"
+        self.shed = 0
+        self._results: deque[tuple[bool, float]] = deque(maxlen=max(1, window))
+        self._failure_threshold = failure_threshold
+        self._min_calls = max(1, min_calls)
+        self._reset_timeout = max(0.0, reset_timeout)
+        self._opened_at = 0.0
+        self._probing = False
+
+    def allow(self, now: float | None = None) -> bool:
+        """Whether a delivery may call the bridge now.
+
+        Moves an open breaker to half-open once ``reset_timeout`` has passed
+        and lets exactly one probe through until its result is recorded.
+        """
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            if now is None:
+                now = time.monotonic()
+            if now - self._opened_at < self._reset_timeout:
+                return False
+            self.state = "half_open"
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def retry_in(self, now: float | None = None) -> float:
+        """Seconds until an open breaker lets a probe through, else 0."""
+        if self.state != "open":
+            return 0.0
+        if now is None:
+            now = time.monotonic()
+        return max(0.0, self._opened_at + self._reset_timeout - now)
+
+    def record(self, ok: bool, latency: float) -> None:
+        """Record the outcome of a delivery and update the breaker."""
+        self._results.append((ok, latency))
+        if self.state == "half_open":
+            self._probing = False
+            if ok:
+                self.state = "closed"
+                self._results.clear()
+            else:
+                self._open()
+            return
+        if (
+            not ok
+            and self.state == "closed"
+            and self._failure_threshold
+            and len(self._results) >= self._min_calls
+            and self.error_rate >= self._failure_threshold
+        ):
+            self._open()
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of failed deliveries in the window."""
+        if not self._results:
+            return 0.0
+        return sum(1 for ok, _ in self._results if not ok) / len(self._results)
+
+    def percentile(self, pct: float) -> float:
+        """Delivery latency at the given percentile (0-100), nearest rank."""
+        if not self._results:
+            return 0.0
+        latencies = sorted(latency for _, latency in self._results)
+        rank = min(max(1, math.ceil(len(latencies) * pct / 100)), len(latencies))
+        return latencies[rank - 1]
+
+    def snapshot(self, buffered: int = 0) -> HealthSnapshot:
+        """Current stats as a ``HealthSnapshot``."""
+        return HealthSnapshot(
+            platform=self.platform,
+            state=self.state,
+            calls=len(self._results),
+            error_rate=self.error_rate,
+            p50=self.percentile(50),
+            p95=self.percentile(95),
+            p99=self.percentile(99),
+            buffered=buffered,
+            shed=self.shed,
+        )
+
+    def _open(self) -> None:
+        self.state = "open"
+        self._opened_at = time.monotonic()
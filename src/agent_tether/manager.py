@@ -1,36 +1,194 @@
 """Bridge manager for routing events to messaging platforms.
 
 The manager maintains a registry of active bridges and routes events to the
-appropriate platform based on session configuration.
+appropriate platform based on session configuration. A session can be bound
+to several platforms; events for it are then delivered to every bound bridge
+concurrently.
+
+The session-to-platform bindings form an in-memory routing index. With a
+``BridgeConfig.data_dir`` it is persisted to ``routes.json`` there, and it is
+kept up to date with the bindings each registered bridge reports and the
+threads created through :meth:`BridgeManager.create_thread`.
 """
 
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
 import structlog
 
-from agent_tether.base import ApprovalRequest, BridgeInterface
+from agent_tether.base import ApprovalRequest, BridgeConfig, BridgeInterface
+from agent_tether.health import BridgeHealth, HealthSnapshot
+from agent_tether.outbound import OutboundDispatcher
 
 logger = structlog.get_logger(__name__)
 
+# File name used under BridgeConfig.data_dir
+ROUTES_FILENAME = "routes.json"
+
+# (bridge) -> awaitable delivering one event to it
+_Delivery = Callable[[BridgeInterface], Awaitable[None]]
+
+# Called with the outcome of a delivery that was held back
+_OnDone = Callable[["PlatformResult"], None]
+
+# How often a backlog drain rechecks a half-open breaker with a probe in flight
+_DRAIN_POLL_INTERVAL = 0.05
+
+
+@dataclass
+class PlatformResult:
+    """Outcome of delivering one event to one platform.
+
+    Attributes:
+        platform: Platform identifier.
+        ok: Whether the bridge accepted the event.
+        latency: Seconds the bridge call took.
+        error: Failure description when ``ok`` is False.
+        buffered: The bridge's breaker was open and the event was held back
+            to be delivered once it closes.
+    """
+
+    platform: str
+    ok: bool
+    latency: float = 0.0
+    error: str | None = None
+    buffered: bool = False
+
 
 class BridgeManager:
     """Manages messaging platform bridges and routes events.
 
     Bridges are registered at startup based on available credentials.
-    Events are routed to the platform associated with each session.
+    Events are routed to the platform passed by the caller or, when none is
+    given, to every platform the session is bound to. Each bridge is called
+    in its own task, so a slow or failing bridge does not hold up the others.
+
+    Every delivery is timed and recorded in the bridge's ``BridgeHealth``.
+    With a ``failure_threshold``, a bridge whose error rate crosses it has
+    its circuit opened: deliveries to it return immediately and are held in
+    a bounded backlog (or shed) until a probe succeeds. :meth:`deliver` gives
+    other senders, such as ``BridgeSubscriber``, the same treatment.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        config: BridgeConfig | None = None,
+        *,
+        send_timeout: float | None = None,
+        failure_threshold: float = 0.0,
+        breaker_min_calls: int = 10,
+        breaker_reset_timeout: float = 30.0,
+        max_buffered: int = 100,
+        max_in_flight: int = 32,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            config: Bridge configuration. When ``data_dir`` is set, session
+                bindings are loaded from and saved to ``routes.json`` there.
+            send_timeout: Seconds one platform call a bridge makes through
+                the shared dispatcher may take before it is cancelled and
+                the delivery counted as a failure. Waiting for a concurrency
+                slot or for the bridge's rate limits doesn't count, so
+                pacing alone never fails a delivery. None waits
+                indefinitely.
+            failure_threshold: Error rate (0-1) over the recent deliveries
+                that opens a bridge's circuit. 0 disables circuit breaking.
+            breaker_min_calls: Deliveries a bridge needs in its window before
+                its circuit can open.
+            breaker_reset_timeout: Seconds an open circuit waits before
+                probing the bridge again.
+            max_buffered: Deliveries held per bridge while its circuit is
+                open; the oldest are shed beyond that. 0 sheds everything.
+            max_in_flight: Most outgoing platform API calls in flight at
+                once, across all registered bridges.
+        """
         self._bridges: dict[str, BridgeInterface] = {}
+        self._bindings: dict[str, list[str]] = {}
+        self._failure_threshold = failure_threshold
+        self._breaker_min_calls = breaker_min_calls
+        self._breaker_reset_timeout = breaker_reset_timeout
+        self._max_buffered = max(0, max_buffered)
+        self._health: dict[str, BridgeHealth] = {}
+        self._backlogs: dict[str, deque[tuple[str, _Delivery, _OnDone | None]]] = {}
+        self._drains: dict[str, asyncio.Task[None]] = {}
+        self._dispatcher = OutboundDispatcher(max_in_flight, call_timeout=send_timeout)
+        self._routes_path: Path | None = None
+        if config is not None and config.data_dir:
+            self._routes_path = Path(config.data_dir) / ROUTES_FILENAME
+            self._load_routes()
 
     def register_bridge(self, platform: str, bridge: BridgeInterface) -> None:
         """Register a messaging platform bridge.
 
+        Every binding the bridge reports is recorded in the routing index
+        before the host's own ``on_session_bound`` callback runs, and its
+        outgoing calls are routed through the manager's shared
+        ``OutboundDispatcher``.
+
         Args:
             platform: Platform identifier (e.g., "telegram", "slack", "discord").
             bridge: Bridge implementation instance.
         """
         self._bridges[platform] = bridge
+        self._health[platform] = BridgeHealth(
+            platform,
+            failure_threshold=self._failure_threshold,
+            min_calls=self._breaker_min_calls,
+            reset_timeout=self._breaker_reset_timeout,
+        )
+        bridge.add_session_bound_listener(self.on_session_bound)
+        bridge.set_dispatcher(self._dispatcher)
         logger.info("Bridge registered", platform=platform)
 
+    async def start_all(self, timeout: float | None = 30.0) -> list[PlatformResult]:
+        """Start every registered bridge concurrently.
+
+        A bridge that fails or misses the deadline is logged and reported; it
+        does not hold up the others.
+
+        Args:
+            timeout: Seconds each bridge's ``start()`` may take. None waits
+                indefinitely.
+
+        Returns:
+            One result per bridge, with the time it took to become ready.
+        """
+        results = await self._run_all("start", timeout)
+        logger.info(
+            "Bridges started",
+            ready=[r.platform for r in results if r.ok],
+            failed=[r.platform for r in results if not r.ok],
+        )
+        return results
+
+    async def stop_all(self, timeout: float | None = 10.0) -> list[PlatformResult]:
+        """Stop every registered bridge concurrently.
+
+        Deliveries still held back by open circuits are dropped.
+
+        Args:
+            timeout: Seconds each bridge's ``stop()`` may take. None waits
+                indefinitely.
+
+        Returns:
+            One result per bridge.
+        """
+        drains = list(self._drains.values())
+        for task in drains:
+            task.cancel()
+        await asyncio.gather(*drains, return_exceptions=True)
+        for platform, backlog in self._backlogs.items():
+            for _, _, on_done in backlog:
+                _notify(on_done, PlatformResult(platform, ok=False, error="Bridge stopped"))
+        self._backlogs.clear()
+        return await self._run_all("stop", timeout)
+
     def get_bridge(self, platform: str) -> BridgeInterface | None:
         """Get a registered bridge by platform name.
 
@@ -42,6 +200,40 @@ class BridgeManager:
         """
         return self._bridges.get(platform)
 
+    @property
+    def dispatcher(self) -> OutboundDispatcher:
+        """The outbound dispatcher shared by the registered bridges."""
+        return self._dispatcher
+
+    def get_health(self, platform: str) -> HealthSnapshot | None:
+        """Get delivery stats and circuit state for a bridge.
+
+        Args:
+            platform: Platform identifier.
+
+        Returns:
+            Health snapshot or None if not registered.
+        """
+        health = self._health.get(platform)
+        if health is None:
+            return None
+        return health.snapshot(buffered=len(self._backlogs.get(platform, ())))
+
+    def is_holding(self, platform: str) -> bool:
+        """Whether a delivery to a bridge may be held back instead of attempted.
+
+        True while its breaker isn't closed or earlier deliveries are still
+        waiting in its backlog. While it is False, ``deliver`` calls the
+        bridge right away and never invokes ``on_done``.
+
+        Args:
+            platform: Platform identifier.
+        """
+        health = self._health.get(platform)
+        return bool(self._backlogs.get(platform)) or (
+            health is not None and health.state != "closed"
+        )
+
     def list_bridges(self) -> list[str]:
         """List all registered platform names.
 
@@ -50,59 +242,177 @@ class BridgeManager:
         """
         return list(self._bridges.keys())
 
-    async def route_output(
-        self, session_id: str, text: str, platform: str, metadata: dict | None = None
-    ) -> None:
-        """Route output text to the appropriate platform bridge.
+    def bind_session(self, session_id: str, platforms: list[str]) -> None:
+        """Bind a session to the platforms its events should be mirrored to.
+
+        Replaces any previous binding. Platforms need not be registered yet;
+        deliveries to a missing bridge are reported as failed.
 
         Args:
             session_id: Internal Tether session ID.
-            text: Output text (markdown format).
-            platform: Target platform identifier.
-            metadata: Optional metadata about the output.
+            platforms: Platform identifiers, in delivery-report order.
         """
-        bridge = self._bridges.get(platform)
-        if not bridge:
-            logger.warning(
-                "No bridge registered for platform",
-                platform=platform,
-                session_id=session_id,
-            )
+        self._bindings[session_id] = list(dict.fromkeys(platforms))
+        self._save_routes()
+
+    def unbind_session(self, session_id: str, platform: str | None = None) -> None:
+        """Remove a session's binding, or just one platform from it.
+
+        Args:
+            session_id: Internal Tether session ID.
+            platform: Platform to drop. None removes the whole binding.
+        """
+        if platform is None:
+            if self._bindings.pop(session_id, None) is not None:
+                self._save_routes()
             return
+        platforms = self._bindings.get(session_id)
+        if platforms and platform in platforms:
+            platforms.remove(platform)
+            if not platforms:
+                del self._bindings[session_id]
+            self._save_routes()
 
-        await bridge.on_output(session_id, text, metadata)
+    def get_platforms(self, session_id: str) -> list[str]:
+        """List the platforms a session is bound to.
 
-    async def route_approval(
-        self, session_id: str, request: ApprovalRequest, platform: str
+        Args:
+            session_id: Internal Tether session ID.
+
+        Returns:
+            Bound platform identifiers, empty if the session is unbound.
+        """
+        return list(self._bindings.get(session_id, ()))
+
+    def get_platform(self, session_id: str) -> str | None:
+        """Get the platform a session was first bound to.
+
+        Args:
+            session_id: Internal Tether session ID.
+
+        Returns:
+            Platform identifier or None if the session is unbound.
+        """
+        platforms = self._bindings.get(session_id)
+        return platforms[0] if platforms else None
+
+    async def on_session_bound(
+        self, session_id: str, platform: str, thread_id: str | None = None
     ) -> None:
-        """Route approval request to the appropriate platform bridge.
+        """Record that a session was bound to a platform thread.
+
+        Matches ``OnSessionBound``. Adds the platform to the session's
+        binding, keeping any platforms it is already bound to.
 
         Args:
             session_id: Internal Tether session ID.
-            request: Approval request details.
-            platform: Target platform identifier.
+            platform: Platform the thread was created on.
+            thread_id: Platform thread identifier (unused).
         """
-        bridge = self._bridges.get(platform)
-        if not bridge:
-            logger.warning(
-                "No bridge registered for platform",
-                platform=platform,
-                session_id=session_id,
-            )
+        platforms = self._bindings.setdefault(session_id, [])
+        if platform in platforms:
             return
+        platforms.append(platform)
+        self._save_routes()
+        logger.info("Session bound", session_id=session_id, platform=platform)
 
-        await bridge.on_approval_request(session_id, request)
+    async def route_output(
+        self,
+        session_id: str,
+        text: str,
+        platform: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> list[PlatformResult]:
+        """Route output text to the session's platform bridges.
+
+        Args:
+            session_id: Internal Tether session ID.
+            text: Output text (markdown format).
+            platform: Target platform identifier. None delivers to every
+                platform the session is bound to.
+            metadata: Optional metadata about the output.
+
+        Returns:
+            One result per target platform.
+        """
+        return await self._fan_out(
+            session_id,
+            platform,
+            lambda bridge: bridge.on_output(session_id, text, metadata),
+        )
+
+    async def route_approval(
+        self, session_id: str, request: ApprovalRequest, platform: str | None = None
+    ) -> list[PlatformResult]:
+        """Route approval request to the session's platform bridges.
+
+        Args:
+            session_id: Internal Tether session ID.
+            request: Approval request details.
+            platform: Target platform identifier. None delivers to every
+                platform the session is bound to.
+
+        Returns:
+            One result per target platform.
+        """
+        return await self._fan_out(
+            session_id,
+            platform,
+            lambda bridge: bridge.on_approval_request(session_id, request),
+        )
 
     async def route_status(
-        self, session_id: str, status: str, platform: str, metadata: dict | None = None
-    ) -> None:
-        """Route status change to the appropriate platform bridge.
+        self,
+        session_id: str,
+        status: str,
+        platform: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> list[PlatformResult]:
+        """Route status change to the session's platform bridges.
 
         Args:
             session_id: Internal Tether session ID.
             status: New status.
-            platform: Target platform identifier.
+            platform: Target platform identifier. None delivers to every
+                platform the session is bound to.
             metadata: Optional metadata about the status.
+
+        Returns:
+            One result per target platform.
+        """
+        return await self._fan_out(
+            session_id,
+            platform,
+            lambda bridge: bridge.on_status_change(session_id, status, metadata),
+        )
+
+    async def deliver(
+        self,
+        session_id: str,
+        platform: str,
+        delivery: _Delivery,
+        *,
+        on_done: _OnDone | None = None,
+        buffer: bool = True,
+    ) -> PlatformResult:
+        """Deliver one event to one bridge the way the ``route_*`` methods do.
+
+        The call is timed and recorded in the bridge's health, the platform
+        calls it makes are bounded by ``send_timeout``, and it is held back
+        while the bridge's breaker is open.
+
+        Args:
+            session_id: Internal Tether session ID.
+            platform: Target platform identifier.
+            delivery: Called with the bridge to make the delivery.
+            on_done: For a delivery held back in the backlog (a ``buffered``
+                result), called with its outcome once it is attempted, shed
+                or dropped.
+            buffer: Whether to hold the delivery back while the breaker is
+                open. If False, it fails with "Circuit open" instead.
+
+        Returns:
+            The outcome, or a ``buffered`` result for a held-back delivery.
         """
         bridge = self._bridges.get(platform)
         if not bridge:
@@ -111,9 +421,15 @@ class BridgeManager:
                 platform=platform,
                 session_id=session_id,
             )
-            return
+            return PlatformResult(platform, ok=False, error="No bridge registered")
 
-        await bridge.on_status_change(session_id, status, metadata)
+        health = self._health[platform]
+        # Anything already held back goes first, so new events queue behind it.
+        if self._backlogs.get(platform) or not health.allow():
+            if not buffer:
+                return PlatformResult(platform, ok=False, error="Circuit open")
+            return self._hold(session_id, platform, delivery, on_done)
+        return await self._attempt(session_id, platform, bridge, delivery)
 
     async def create_thread(self, session_id: str, session_name: str, platform: str) -> dict:
         """Create a messaging thread on the specified platform.
@@ -123,6 +439,9 @@ class BridgeManager:
             session_name: Display name for the session.
             platform: Target platform identifier.
 
+        The session is bound to the platform once the thread exists, as if
+        the bridge had reported it through ``on_session_bound``.
+
         Returns:
             Dict with platform-specific thread info.
 
@@ -133,4 +452,151 @@ class BridgeManager:
         if not bridge:
             raise ValueError(f"No bridge registered for platform: {platform}")
 
-        return await bridge.create_thread(session_id, session_name)
+        thread_info = await bridge.create_thread(session_id, session_name)
+        await self.on_session_bound(session_id, platform, thread_info.get("thread_id"))
+        return thread_info
+
+    async def _run_all(self, method: str, timeout: float | None) -> list[PlatformResult]:
+        """Call a lifecycle method on every bridge at once, each with a deadline."""
+
+        async def run(platform: str, bridge: BridgeInterface) -> PlatformResult:
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(getattr(bridge, method)(), timeout)
+            except Exception as exc:
+                latency = time.perf_counter() - start
+                logger.exception("Bridge lifecycle call failed", platform=platform, method=method)
+                if method == "start":
+                    # Don't leave a half-started bridge running (e.g. polling).
+                    try:
+                        await asyncio.wait_for(bridge.stop(), timeout)
+                    except Exception:
+                        logger.exception(
+                            "Failed to stop bridge after failed start", platform=platform
+                        )
+                return PlatformResult(
+                    platform, ok=False, latency=latency, error=f"{type(exc).__name__}: {exc}"
+                )
+            return PlatformResult(platform, ok=True, latency=time.perf_counter() - start)
+
+        return list(
+            await asyncio.gather(*(run(name, bridge) for name, bridge in self._bridges.items()))
+        )
+
+    def _load_routes(self) -> None:
+        """Load session bindings from disk."""
+        if self._routes_path is None or not self._routes_path.exists():
+            return
+        try:
+            raw = json.loads(self._routes_path.read_text("utf-8"))
+            if not isinstance(raw, dict):
+                return
+            for session_id, platforms in raw.items():
+                if isinstance(platforms, list) and platforms:
+                    self._bindings[str(session_id)] = [str(p) for p in platforms]
+            logger.info("Loaded session routes", count=len(self._bindings))
+        except Exception:
+            logger.exception("Failed to load session routes", path=str(self._routes_path))
+
+    def _save_routes(self) -> None:
+        """Write session bindings to disk, if persistence is configured."""
+        if self._routes_path is None:
+            return
+        try:
+            self._routes_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._routes_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._bindings, indent=2, sort_keys=True) + "\n", "utf-8")
+            tmp.replace(self._routes_path)
+        except Exception:
+            logger.exception("Failed to save session routes", path=str(self._routes_path))
+
+    async def _fan_out(
+        self, session_id: str, platform: str | None, deliver: _Delivery
+    ) -> list[PlatformResult]:
+        platforms = [platform] if platform is not None else self._bindings.get(session_id, [])
+        if not platforms:
+            logger.warning("Session is not bound to any platform", session_id=session_id)
+            return []
+        if len(platforms) == 1:
+            return [await self.deliver(session_id, platforms[0], deliver)]
+        return list(
+            await asyncio.gather(*(self.deliver(session_id, name, deliver) for name in platforms))
+        )
+
+    async def _attempt(
+        self, session_id: str, platform: str, bridge: BridgeInterface, deliver: _Delivery
+    ) -> PlatformResult:
+        """Call the bridge once and record the outcome in its health."""
+        health = self._health[platform]
+        start = time.perf_counter()
+        try:
+            await deliver(bridge)
+        except Exception as exc:
+            latency = time.perf_counter() - start
+            health.record(False, latency)
+            logger.exception(
+                "Bridge delivery failed",
+                platform=platform,
+                session_id=session_id,
+                breaker=health.state,
+            )
+            return PlatformResult(
+                platform, ok=False, latency=latency, error=f"{type(exc).__name__}: {exc}"
+            )
+        latency = time.perf_counter() - start
+        health.record(True, latency)
+        return PlatformResult(platform, ok=True, latency=latency)
+
+    def _hold(
+        self, session_id: str, platform: str, deliver: _Delivery, on_done: _OnDone | None
+    ) -> PlatformResult:
+        """Buffer or shed a delivery while the bridge's breaker is open."""
+        health = self._health[platform]
+        if not self._max_buffered:
+            health.shed += 1
+            return PlatformResult(platform, ok=False, error="Circuit open")
+
+        backlog = self._backlogs.setdefault(platform, deque())
+        if len(backlog) >= self._max_buffered:
+            _, _, shed = backlog.popleft()
+            health.shed += 1
+            _notify(shed, PlatformResult(platform, ok=False, error="Shed while circuit open"))
+        backlog.append((session_id, deliver, on_done))
+        if platform not in self._drains:
+            self._drains[platform] = asyncio.create_task(self._drain(platform))
+        return PlatformResult(platform, ok=False, error="Circuit open", buffered=True)
+
+    async def _drain(self, platform: str) -> None:
+        """Deliver a bridge's backlog in order once its breaker lets calls through."""
+        backlog = self._backlogs[platform]
+        health = self._health[platform]
+        try:
+            while backlog:
+                bridge = self._bridges.get(platform)
+                if bridge is None:
+                    for _, _, on_done in backlog:
+                        _notify(on_done, PlatformResult(platform, ok=False, error="No bridge"))
+                    backlog.clear()
+                    break
+                if not health.allow():
+                    await asyncio.sleep(health.retry_in() or _DRAIN_POLL_INTERVAL)
+                    continue
+                session_id, deliver, on_done = backlog[0]
+                result = await self._attempt(session_id, platform, bridge, deliver)
+                # A failure that reopened the breaker keeps the event for the
+                # next probe; otherwise it was an ordinary failed delivery.
+                if result.ok or health.state == "closed":
+                    backlog.popleft()
+                    _notify(on_done, result)
+        finally:
+            self._drains.pop(platform, None)
+
+
+def _notify(on_done: _OnDone | None, result: PlatformResult) -> None:
+    """Report a held-back delivery's outcome, logging a failing callback."""
+    if on_done is None:
+        return
+    try:
+        on_done(result)
+    except Exception:
+        logger.exception("Delivery callback failed", platform=result.platform)
@@ -0,0 +1,502 @@
+"""Single-pass Markdown tokenizer shared by the bridge formatters.
+
+Agent output is Markdown. ``tokenize`` scans it once, left to right, and
+returns a flat list of ``(kind, value)`` tokens that a platform renderer
+turns into its own markup. Code spans, fenced blocks and tables are atomic,
+so nothing inside them is treated as markup. Emphasis, links and headings
+are matched against a stack of open delimiters as the scan goes, so no part
+of the text is scanned twice.
+
+The syntax covered is what agents actually produce:
+
+- fenced code blocks and inline code,
+- ``**bold**`` / ``__bold__`` (within a line) and ``*italic*`` / ``_italic_``,
+- ``[text](url)`` links,
+- ``#`` headings,
+- pipe tables (separator rows are dropped).
+
+Delimiters that never find a partner stay in the text as written.
+
+``parse`` wraps the tokens in a :class:`Document` and keeps recent results,
+so an output mirrored to several platforms is parsed once and rendered into
+each platform's dialect from the same document. ``render_markdown`` is the
+renderer for platforms that speak Markdown.
+
+``split`` cuts Markdown (or a dialect with the same code fences) into
+messages under a platform's size limit without breaking code blocks.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterator
+
+# (kind, value) -- see the kind constants below.
+Token = tuple[str, Any]
+
+# Literal text. Value: the text.
+TEXT = "text"
+# Inline code. Value: the code.
+CODE = "code"
+# Fenced code block. Value: the code, trailing whitespace removed.
+CODE_BLOCK = "code_block"
+# Pipe table. Value: list of rows, each a list of cell strings.
+TABLE = "table"
+# Paired markers. Opening tokens' values: ``LINK`` the URL, ``HEADING`` the
+# level (1-6), None otherwise. Closing tokens have value None.
+STRONG = "strong"
+STRONG_END = "/strong"
+EM = "em"
+EM_END = "/em"
+LINK = "link"
+LINK_END = "/link"
+HEADING = "heading"
+HEADING_END = "/heading"
+
+# Characters that can start markup; '#' and '|' only after a newline. The
+# first alternatives match a whole bold, italic or link with plain text
+# inside, so the common case takes one step instead of two stack operations.
+# Every alternative starts with a literal character, which lets the regex
+# engine skip ahead to candidates instead of trying each one at every offset.
+_PLAIN = r"[^`*_\[\]\n]+"
+_SCAN = re.compile(
+    rf"""
+    \*\*{_PLAIN}\*\*
+    | __{_PLAIN}__
+    | \*(?<!\w\*){_PLAIN}\*(?![\w*])
+    | _(?<!\w_){_PLAIN}_(?!\w)
+    | \[{_PLAIN}\]\((?P<url>[^)\n]+)\)
+    | ` | \* | _ | \[ | \]
+    | \n[\#|]
+    """,
+    re.VERBOSE,
+)
+_FENCE_OPEN = re.compile(r"```\w*\n")
+_TABLE = re.compile(r"(?:^\|.+\|$\n?){2,}", re.MULTILINE)
+_HEADING = re.compile(r"(#{1,6})[^\S\n]+(?=[^\n])")
+_SEPARATOR_CELL = re.compile(r"-{2,}|:?-+:?")
+# Longest span split() keeps whole for its ``atomic`` pattern.
+_MAX_SPAN = 2048
+# A code fence line: up to three spaces, three or more backticks, and an
+# optional info string (the language) on opening fences.
+_FENCE = re.compile(r"^ {0,3}(`{3,})([^`\n]*)$", re.MULTILINE)
+_is_word = re.compile(r"\w").match
+# Parsed documents kept by parse(); enough for the outputs in flight at once.
+_CACHE_SIZE = 32
+
+_OPEN = {"**": STRONG, "__": STRONG, "*": EM, "_": EM, "[": LINK}
+_CLOSE = {"**": STRONG_END, "__": STRONG_END, "*": EM_END, "_": EM_END, "[": LINK_END}
+
+
+@dataclass(frozen=True)
+class Document:
+    """Markdown parsed into tokens, ready to render into any dialect.
+
+    Attributes:
+        tokens: Tokens in document order, as returned by :func:`tokenize`.
+        source: The Markdown the document was parsed from, or None if it
+            was built from tokens.
+    """
+
+    tokens: tuple[Token, ...]
+    source: str | None = None
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse(text: str) -> Document:
+    """Parse Markdown into a :class:`Document`, reusing recent results.
+
+    Results are cached by the text's hash (and equality), so every bridge
+    rendering the same output shares one parse.
+
+    Args:
+        text: Markdown source.
+
+    Returns:
+        The parsed document. Callers must not modify it.
+    """
+    return Document(tuple(tokenize(text)), text)
+
+
+def render_markdown(doc: Document) -> str:
+    """Render a document as Markdown.
+
+    A parsed document renders as its source. Text in a built document is
+    written as is, so it may contain markup.
+    """
+    if doc.source is not None:
+        return doc.source
+    out: list[str] = []
+    append = out.append
+    urls: list[str] = []
+    for kind, value in doc.tokens:
+        if kind is TEXT:
+            append(value)
+        elif kind is CODE:
+            append(f"`{value}`")
+        elif kind is CODE_BLOCK:
+            # Keep a fence in the code from closing the block early.
+            code = value.replace("```", "``\\`")
+            append(f"```\n{code}\n```")
+        elif kind is TABLE:
+            lines = [f"| {' | '.join(row)} |" for row in value]
+            lines.insert(1, "|" + "---|" * max(len(row) for row in value))
+            append("\n".join(lines))
+        elif kind is STRONG or kind is STRONG_END:
+            append("**")
+        elif kind is EM or kind is EM_END:
+            append("*")
+        elif kind is LINK:
+            urls.append(value)
+            append("[")
+        elif kind is LINK_END:
+            append(f"]({urls.pop()})")
+        elif kind is HEADING:
+            append("#" * value + " ")
+    return "".join(out)
+
+
+def table_rows(block: str) -> list[list[str]]:
+    """Split a pipe table into rows of stripped cells, dropping separator rows."""
+    rows: list[list[str]] = []
+    for line in block.strip().splitlines():
+        cells = [c.strip() for c in line.strip().strip("|").split("|")]
+        if all(_SEPARATOR_CELL.fullmatch(c) for c in cells):
+            continue
+        rows.append(cells)
+    return rows
+
+
+def format_table(rows: list[list[str]]) -> str:
+    """Lay out table rows as plain text in aligned columns."""
+    col_count = max(len(r) for r in rows)
+    widths = [0] * col_count
+    for row in rows:
+        for i, cell in enumerate(row):
+            widths[i] = max(widths[i], len(cell))
+    formatted: list[str] = []
+    for row in rows:
+        parts = []
+        for i in range(col_count):
+            cell = row[i] if i < len(row) else ""
+            parts.append(cell.ljust(widths[i]))
+        formatted.append("  ".join(parts))
+    return "\n".join(formatted)
+
+
+def tokenize(text: str) -> list[Token]:
+    """Tokenize Markdown in one left-to-right pass.
+
+    Args:
+        text: Markdown source.
+
+    Returns:
+        Tokens in document order. Paired markers are always properly nested.
+    """
+    # Lines are found by their leading newline; give the first one one too.
+    text = "\n" + text
+    tokens: list[Token] = []
+    append = tokens.append
+    # Open delimiters, innermost last: (delimiter, token index, end offset).
+    # Each one's token is a TEXT placeholder until a partner turns it into
+    # an opening marker.
+    stack: list[tuple[str, int, int]] = []
+    heading = -1  # token index of the open heading, if any
+    heading_end = 0
+    length = len(text)
+    pos = 1  # start of plain text not yet emitted
+    i = 0
+    search = _SCAN.search
+
+    while True:
+        limit = heading_end if heading >= 0 else length
+        m = search(text, i, limit)
+        if m is None:
+            if pos < limit:
+                append((TEXT, text[pos:limit]))
+            if heading < 0:
+                break
+            # Delimiters opened in the heading can't outlive it.
+            while stack and stack[-1][1] > heading:
+                stack.pop()
+            append((HEADING_END, None))
+            heading = -1
+            i = pos = limit
+            continue
+
+        i = m.start()
+        char = text[i]
+        end = m.end()
+        if char == "\n":
+            i += 1
+            char = text[i]
+
+        elif end - i > 1 and not stack:
+            # A whole construct with plain text inside. With nothing open,
+            # pairing it here gives the same result as the steps below.
+            if pos < i:
+                append((TEXT, text[pos:i]))
+            url = m.group("url")
+            if url is not None:
+                append((LINK, url))
+                append((TEXT, text[i + 1 : end - len(url) - 3]))
+                append((LINK_END, None))
+            else:
+                size = 2 if text[i + 1] == char else 1
+                append((STRONG if size == 2 else EM, None))
+                append((TEXT, text[i + size : end - size]))
+                append((STRONG_END if size == 2 else EM_END, None))
+            i = pos = end
+            continue
+
+        if char == "`":
+            if text.startswith("```", i):
+                fence = _FENCE_OPEN.match(text, i)
+                if fence:
+                    end = text.find("```", fence.end(), limit)
+                    if end >= 0:
+                        if pos < i:
+                            append((TEXT, text[pos:i]))
+                        append((CODE_BLOCK, text[fence.end() : end].rstrip()))
+                        i = pos = end + 3
+                        continue
+            if i + 1 < limit and text[i + 1] != "`":
+                end = text.find("`", i + 1, limit)
+                if end >= 0:
+                    if pos < i:
+                        append((TEXT, text[pos:i]))
+                    append((CODE, text[i + 1 : end]))
+                    i = pos = end + 1
+                    continue
+            i += 1
+
+        elif char == "*" or char == "_":
+            double = char * 2
+            is_double = text.startswith(double, i)
+            check_next = True
+            if (
+                is_double
+                and text.startswith(char, i + 2)
+                and stack
+                and stack[-1][0] == char
+                and stack[-1][1] > heading
+                and stack[-1][2] < i
+            ):
+                # "***" closing "***x": close the inner single delimiter first;
+                # what follows it is the outer closer, not a word.
+                is_double = check_next = False
+            delim = double if is_double else char
+            opener = _find(stack, delim, heading)
+            if opener >= 0:
+                _, _, content = stack[opener]
+                if is_double:
+                    # Bold: at least one character, on the opener's line.
+                    can_close = content < i and text.find("\n", content, i) < 0
+                else:
+                    can_close = content < i and not (
+                        check_next and i + 1 < length and _is_word(text[i + 1])
+                    )
+                if can_close:
+                    if pos < i:
+                        append((TEXT, text[pos:i]))
+                    _close(tokens, stack, opener)
+                    i = pos = i + len(delim)
+                    continue
+                if is_double and content == i:
+                    # "****": the second pair is text inside the first.
+                    i += 2
+                    continue
+                # The opener's first candidate partner failed; it stays text.
+                del stack[opener]
+            # A single delimiter only opens after a non-word character.
+            if is_double or not (
+                i > 0 and (_is_word(text[i - 1]) if pos < i else _ends_in_word(tokens, stack))
+            ):
+                if pos < i:
+                    append((TEXT, text[pos:i]))
+                stack.append((delim, len(tokens), i + len(delim)))
+                append((TEXT, delim))
+                i = pos = i + len(delim)
+            else:
+                i += 1
+
+        elif char == "[":
+            if pos < i:
+                append((TEXT, text[pos:i]))
+            stack.append(("[", len(tokens), i + 1))
+            append((TEXT, "["))
+            i = pos = i + 1
+
+        elif char == "]":
+            opener = next(
+                (k for k, entry in enumerate(stack) if entry[0] == "[" and entry[1] > heading),
+                -1,
+            )
+            end = -1
+            if opener >= 0 and text.startswith("(", i + 1):
+                end = text.find(")", i + 2, limit)
+            if end > i + 2 and stack[opener][2] < i:
+                if pos < i:
+                    append((TEXT, text[pos:i]))
+                index = stack[opener][1]
+                del stack[opener:]
+                tokens[index] = (LINK, text[i + 2 : end])
+                append((LINK_END, None))
+                i = pos = end + 1
+            else:
+                i += 1
+            # Every open bracket has now seen its first ']'; none can match later.
+            stack[:] = [entry for entry in stack if entry[0] != "["]
+
+        elif char == "|":
+            table = _TABLE.match(text, i)
+            if table and (rows := table_rows(table.group(0))):
+                if pos < i:
+                    append((TEXT, text[pos:i]))
+                append((TABLE, rows))
+                # The table's last newline goes with it, so a '#' on the next
+                # line doesn't start a heading.
+                i = pos = table.end()
+            else:
+                i += 1
+
+        else:  # "#" at the start of a line
+            match = _HEADING.match(text, i)
+            if match:
+                if pos < i:
+                    append((TEXT, text[pos:i]))
+                heading = len(tokens)
+                append((HEADING, len(match.group(1))))
+                heading_end = text.find("\n", i)
+                if heading_end < 0:
+                    heading_end = length
+                i = pos = match.end()
+            else:
+                i += 1
+
+    return tokens
+
+
+def _find(stack: list[tuple[str, int, int]], delim: str, floor: int) -> int:
+    """Index of the innermost open ``delim`` opened after token ``floor``."""
+    for k in range(len(stack) - 1, -1, -1):
+        entry = stack[k]
+        if entry[1] <= floor:
+            break
+        if entry[0] == delim:
+            return k
+    return -1
+
+
+def _close(tokens: list[Token], stack: list[tuple[str, int, int]], opener: int) -> None:
+    """Pair the delimiter at ``stack[opener]`` with a closer at the end of ``tokens``.
+
+    Delimiters opened inside it that are still open stay text.
+    """
+    delim, index, _ = stack[opener]
+    del stack[opener:]
+    tokens[index] = (_OPEN[delim], None)
+    tokens.append((_CLOSE[delim], None))
+
+
+def _ends_in_word(tokens: list[Token], stack: list[tuple[str, int, int]]) -> bool:
+    """Whether the text emitted so far ends in a word character.
+
+    An open delimiter counts as markup, not as the characters it's made of.
+    """
+    if not tokens or (stack and stack[-1][1] == len(tokens) - 1):
+        return False
+    kind, value = tokens[-1]
+    return kind == TEXT and bool(_is_word(value[-1]))
+
+
+def split(text: str, limit: int, *, atomic: re.Pattern[str] | None = None) -> Iterator[str]:
+    """Split Markdown into messages of at most ``limit`` characters.
+
+    Messages are produced one at a time as they are consumed, so a very
+    large output is never held as a list of slices. Each message ends at
+    its last line break, else space, as long as that leaves it at least
+    half full; otherwise it is cut at the limit. A code fence open at a cut
+    is closed at the end of the message and reopened, with its language, at
+    the start of the next, so every message renders on its own.
+
+    Args:
+        text: Markdown to split.
+        limit: Maximum characters per message.
+        atomic: Matches spans that must not be cut, such as a dialect's
+            links or entities. Spans can't contain newlines, and those over
+            2048 characters may be cut.
+
+    Yields:
+        Messages in order. Nothing for empty text.
+    """
+    pos = 0
+    fence: str | None = None  # opening line of the fence open at pos
+    while pos < len(text):
+        prefix = f"{fence}\n" if fence else ""
+        if len(prefix) + len(text) - pos <= limit:
+            yield prefix + text[pos:]
+            return
+        room = limit - len(prefix)
+        cut = _find_cut(text, pos, room, atomic)
+        still_open = _fence_at(text, pos, cut, fence)
+        if still_open:
+            # Leave room to close it.
+            cut = _find_cut(text, pos, room - 4, atomic)
+            still_open = _fence_at(text, pos, cut, fence)
+        part = prefix + text[pos:cut]
+        if still_open:
+            part += "```" if part.endswith("\n") else "\n```"
+        yield part
+        pos, fence = cut, still_open
+
+
+def _find_cut(text: str, pos: int, room: int, atomic: re.Pattern[str] | None) -> int:
+    """Where a message starting at ``pos`` with ``room`` characters should end."""
+    room = max(1, room)
+    end = pos + room
+    for sep in ("\n", " "):
+        at = text.rfind(sep, pos + room // 2, end)
+        while at >= 0 and atomic is not None:
+            span = _span_at(text, pos, at, atomic)
+            if span < 0:
+                break
+            at = text.rfind(sep, pos + room // 2, span)
+        if at >= 0:
+            return at + 1
+    if atomic is not None:
+        span = _span_at(text, pos, end, atomic)
+        if span > pos:
+            return span
+    return end
+
+
+def _span_at(text: str, pos: int, offset: int, atomic: re.Pattern[str]) -> int:
+    """Start of the ``atomic`` span after ``pos`` that ``offset`` is inside, else -1."""
+    start = max(pos, offset - _MAX_SPAN, text.rfind("\n", pos, offset) + 1)
+    end = text.find("\n", offset, offset + _MAX_SPAN)
+    for m in atomic.finditer(text, start, end if end >= 0 else offset + _MAX_SPAN):
+        if m.start() >= offset:
+            break
+        if m.end() > offset:
+            return m.start()
+    return -1
+
+
+def _fence_at(text: str, pos: int, cut: int, fence: str | None) -> str | None:
+    """The fence open at ``cut``, given ``fence`` was open at ``pos``.
+
+    Returns the fence's opening line, or None outside code blocks.
+    """
+    line_end = text.find("\n", cut)
+    for m in _FENCE.finditer(text, pos, line_end if line_end >= 0 else len(text)):
+        if m.start() >= cut:
+            break
+        ticks, info = m.groups()
+        if fence is None:
+            fence = ticks + info.strip()
+        elif not info.strip() and len(ticks) >= len(fence) - len(fence.lstrip("`")):
+            fence = None
+    return fence
@@ -0,0 +1,354 @@
+"""Shared dispatcher for outgoing platform API calls.
+
+Bridges hand every outgoing message to an ``OutboundDispatcher`` instead of
+awaiting the platform client directly. The dispatcher:
+
+- caps how many calls are in flight at once, across every bridge sharing it,
+- runs each session's calls in the order they were submitted,
+- paces calls through the submitting bridge's ``PacingPolicy`` (for
+  example a ``RateLimiter`` tuned to the platform's limits), and
+- tells the policy which session each call is for and how much weight it
+  carries, so sessions sharing a quota (e.g. one Telegram forum group) get
+  a fair share of it instead of queueing behind the busiest one,
+- retries transient failures (network errors, 5xx) with jittered
+  exponential backoff, and
+- remembers recently delivered idempotency keys, so a message that is
+  submitted again (e.g. replayed from a dead-letter queue after a later
+  chunk failed) isn't posted twice.
+
+``BridgeManager`` shares one dispatcher between all the bridges registered
+with it; a standalone bridge gets its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable, Protocol, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+# (exception) -> whether the call may succeed if simply tried again
+TransientFn = Callable[[BaseException], bool]
+
+# Weight of approval prompts relative to ordinary output (1.0). Bridges pass
+# it for permission requests so a waiting approval overtakes queued output
+# from other sessions on the same quota.
+APPROVAL_WEIGHT = 4.0
+
+
+class PacingPolicy(Protocol):
+    """Decides when a call may go out. ``RateLimiter`` implements it."""
+
+    async def run(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[T]],
+        *,
+        flow: Hashable = None,
+        weight: float = 1.0,
+    ) -> T:
+        """Run ``call`` once the policy allows a call for ``key``.
+
+        ``flow`` identifies who the call is for (a session) and ``weight``
+        its share of ``key`` relative to other flows.
+        """
+        ...
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Whether an error from a platform call is worth retrying.
+
+    Matches connection errors and exceptions carrying a 5xx ``status`` or
+    ``status_code``. Timeouts are not retried: the request may already have
+    reached the platform, and sending it again would post the message twice.
+    Bridges pass their own check for platform exception types.
+    """
+    if isinstance(exc, TimeoutError):
+        return False
+    if isinstance(exc, OSError):
+        return True
+    for attr in ("status", "status_code"):
+        status = getattr(exc, attr, None)
+        if isinstance(status, int) and status >= 500:
+            return True
+    return False
+
+
+@dataclass
+class DispatcherStats:
+    """Counters for an ``OutboundDispatcher``.
+
+    Attributes:
+        submitted: Calls handed to the dispatcher.
+        completed: Attempts that returned successfully.
+        failed: Attempts that raised, retried ones included.
+        in_flight: Calls currently talking to a platform.
+        peak_in_flight: Highest ``in_flight`` seen.
+        retried: Retries after a transient failure.
+        deduplicated: Submissions skipped because their idempotency key was
+            already delivered or in flight.
+        attempts: Number of messages by how many attempts they took,
+            rate-limit retries included.
+    """
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    retried: int = 0
+    deduplicated: int = 0
+    attempts: dict[int, int] = field(default_factory=dict)
+
+
+class Lane:
+    """A FIFO lock with a count of its users.
+
+    Holders of a ``dict`` of lanes bump ``users`` before waiting on ``lock``
+    and delete the lane once the count drops back to zero, so idle keys
+    don't accumulate. The dispatcher keeps one per session; bridges use
+    them to keep multi-part messages to a thread together.
+    """
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class OutboundDispatcher:
+    """Runs outgoing calls under a global concurrency cap.
+
+    Args:
+        max_in_flight: Most calls allowed to be in flight at once.
+        max_attempts: Attempts per call before a transient failure is
+            raised. 1 disables retries.
+        backoff_base: Upper bound in seconds of the first retry's delay;
+            doubles with each retry. Delays are drawn uniformly below it.
+        backoff_max: Cap on the retry delay bound.
+        remember: Delivered idempotency keys to remember.
+        call_timeout: Seconds one attempt of a call may take once it has a
+            slot and its pacing let it through; it is then cancelled and
+            raises ``TimeoutError``, which is not retried. Time spent
+            waiting for a slot, for pacing or between retries doesn't
+            count. None waits indefinitely.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 32,
+        *,
+        max_attempts: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        remember: int = 1024,
+        call_timeout: float | None = None,
+    ) -> None:
+        self.stats = DispatcherStats()
+        self._max_in_flight = max(1, max_in_flight)
+        self._slots = asyncio.Semaphore(self._max_in_flight)
+        self._lanes: dict[Hashable, Lane] = {}
+        self._weights: dict[str, float] = {}
+        self._max_attempts = max(1, max_attempts)
+        self._backoff_base = max(0.0, backoff_base)
+        self._backoff_max = max(0.0, backoff_max)
+        self._remember = max(0, remember)
+        self._call_timeout = call_timeout
+        self._delivered: OrderedDict[Hashable, object] = OrderedDict()
+        self._pending: dict[Hashable, asyncio.Future[Any]] = {}
+
+    @property
+    def max_in_flight(self) -> int:
+        """The concurrency cap."""
+        return self._max_in_flight
+
+    def set_session_weight(self, session_id: str, weight: float | None) -> None:
+        """Give a session a larger or smaller share of shared quotas.
+
+        Args:
+            session_id: The session.
+            weight: Multiplier applied to each of the session's calls. None
+                restores the default of 1.0.
+        """
+        if weight is None:
+            self._weights.pop(session_id, None)
+        elif weight <= 0:
+            raise ValueError("weight must be positive")
+        else:
+            self._weights[session_id] = weight
+
+    def session_weight(self, session_id: str) -> float:
+        """The weight set for ``session_id``, 1.0 by default."""
+        return self._weights.get(session_id, 1.0)
+
+    async def submit(
+        self,
+        call: Callable[[], Awaitable[T]],
+        *,
+        session_id: str | None = None,
+        key: Hashable = None,
+        policy: PacingPolicy | None = None,
+        weight: float = 1.0,
+        idempotency_key: str | None = None,
+        transient: TransientFn | None = None,
+    ) -> T:
+        """Run an outgoing call and return its result.
+
+        Args:
+            call: Zero-argument coroutine function making the API call. The
+                policy may call it again to retry.
+            session_id: Session the call belongs to. Calls for the same
+                session and policy run one at a time, in submission order.
+                None for calls outside any session (e.g. command replies).
+            key: Pacing key passed to the policy (chat, channel or thread).
+            policy: Pacing policy of the submitting bridge. None sends as
+                soon as a slot is free.
+            weight: Weight of this kind of message (e.g.
+                ``APPROVAL_WEIGHT``), multiplied by the session's weight.
+            idempotency_key: Identifies the logical message. If a call with
+                the same key and policy was already delivered, or is in
+                flight, its result is returned instead of sending again.
+            transient: Decides which errors are retried. Defaults to
+                :func:`is_transient`.
+        """
+        self.stats.submitted += 1
+        if idempotency_key is None:
+            return await self._submit(call, session_id, key, policy, weight, transient)
+
+        token = (id(policy), idempotency_key)
+        if token in self._delivered:
+            self.stats.deduplicated += 1
+            self._delivered.move_to_end(token)
+            return self._delivered[token]  # type: ignore[return-value]
+        pending = self._pending.get(token)
+        if pending is not None:
+            self.stats.deduplicated += 1
+            return await asyncio.shield(pending)
+
+        pending = self._pending[token] = asyncio.get_running_loop().create_future()
+        try:
+            result = await self._submit(call, session_id, key, policy, weight, transient)
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except BaseException as exc:
+            pending.set_exception(exc)
+            # Mark it retrieved; the submitter gets the exception directly.
+            pending.exception()
+            raise
+        else:
+            pending.set_result(result)
+            self._delivered[token] = result
+            while len(self._delivered) > self._remember:
+                self._delivered.popitem(last=False)
+            return result
+        finally:
+            del self._pending[token]
+
+    async def _submit(
+        self,
+        call: Callable[[], Awaitable[T]],
+        session_id: str | None,
+        key: Hashable,
+        policy: PacingPolicy | None,
+        weight: float,
+        transient: TransientFn | None,
+    ) -> T:
+        if session_id is None:
+            return await self._retrying(call, key, policy, None, weight, transient)
+        weight *= self.session_weight(session_id)
+        lane_key = (id(policy), session_id)
+        lane = self._lanes.get(lane_key)
+        if lane is None:
+            lane = self._lanes[lane_key] = Lane()
+        lane.users += 1
+        try:
+            async with lane.lock:
+                return await self._retrying(call, key, policy, session_id, weight, transient)
+        finally:
+            lane.users -= 1
+            if not lane.users:
+                del self._lanes[lane_key]
+
+    async def _retrying(
+        self,
+        call: Callable[[], Awaitable[T]],
+        key: Hashable,
+        policy: PacingPolicy | None,
+        flow: Hashable,
+        weight: float,
+        transient: TransientFn | None,
+    ) -> T:
+        """Run a call, retrying transient failures with jittered backoff."""
+        transient = transient or is_transient
+        attempts = 0
+
+        def attempt() -> Awaitable[T]:
+            nonlocal attempts
+            attempts += 1
+            return call()
+
+        try:
+            retry = 0
+            while True:
+                try:
+                    return await self._paced(attempt, key, policy, flow, weight)
+                except Exception as exc:
+                    if retry + 1 >= self._max_attempts or not transient(exc):
+                        raise
+                    retry += 1
+                    self.stats.retried += 1
+                    # Full jitter: senders that failed together don't retry together.
+                    bound = min(self._backoff_max, self._backoff_base * 2 ** (retry - 1))
+                    delay = random.uniform(0, bound)
+                    logger.warning(
+                        "Transient send failure, retrying",
+                        key=str(key),
+                        retry=retry,
+                        delay=round(delay, 3),
+                        error=str(exc),
+                    )
+                    await asyncio.sleep(delay)
+        finally:
+            if attempts:
+                counts = self.stats.attempts
+                counts[attempts] = counts.get(attempts, 0) + 1
+
+    async def _paced(
+        self,
+        call: Callable[[], Awaitable[T]],
+        key: Hashable,
+        policy: PacingPolicy | None,
+        flow: Hashable,
+        weight: float,
+    ) -> T:
+        if policy is None:
+            return await self._limited(call)
+        return await policy.run(key, lambda: self._limited(call), flow=flow, weight=weight)
+
+    async def _limited(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Hold a concurrency slot for the duration of one call."""
+        stats = self.stats
+        async with self._slots:
+            stats.in_flight += 1
+            stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+            try:
+                if self._call_timeout:
+                    result = await asyncio.wait_for(call(), self._call_timeout)
+                else:
+                    result = await call()
+            except BaseException:
+                stats.failed += 1
+                raise
+            finally:
+                stats.in_flight -= 1
+        stats.completed += 1
+        return result
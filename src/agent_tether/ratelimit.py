@@ -0,0 +1,324 @@
+"""Outbound rate limiting for platform API calls.
+
+Chat platforms limit how fast a bot may send, globally and per chat or
+channel, and answer bursts with HTTP 429 plus a ``retry_after`` hint.
+``RateLimiter`` paces calls through token buckets so bridges queue instead
+of failing:
+
+- a global bucket shared by every call, and
+- one bucket per key (a chat, channel or thread), created on first use and
+  forgotten once the key is idle and its bucket has refilled.
+
+Calls for the same key run one at a time. Waiting calls are served by
+weighted fair queueing over flows (usually sessions), so one busy session
+can't starve the rest of a shared quota; within a flow, calls keep their
+order. When a call is rejected with a retry hint, the key's bucket is
+paused for that long and the call is retried.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+# (exception) -> seconds to wait before retrying, or None if not a rate limit
+RetryAfterFn = Callable[[BaseException], float | None]
+
+# Per-key buckets kept before idle ones are first evicted.
+_MIN_SWEEP = 256
+
+
+class TokenBucket:
+    """Classic token bucket.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum tokens, i.e. the allowed burst. Defaults to one
+            second's worth, at least 1.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def delay(self, now: float | None = None) -> float:
+        """Seconds until a token is available. 0 if one is available now."""
+        if now is None:
+            now = time.monotonic()
+        self._refill(now)
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def take(self) -> None:
+        """Consume a token. Call only after :meth:`delay` returned 0."""
+        self._tokens -= 1
+
+    def pause(self, seconds: float, now: float | None = None) -> None:
+        """Hand out no tokens for ``seconds``, e.g. after a 429.
+
+        Leaves at most one token, so the call that was rejected can retry as
+        soon as the pause ends without the bucket admitting a burst.
+        """
+        if now is None:
+            now = time.monotonic()
+        self._refill(now)
+        self._blocked_until = max(self._blocked_until, now + seconds)
+        self._tokens = min(self._tokens, 1.0)
+        # Nothing accrues while paused.
+        self._updated = self._blocked_until
+
+    def idle(self, now: float | None = None) -> bool:
+        """Whether the bucket is full and unpaused, i.e. as good as a new one."""
+        if now is None:
+            now = time.monotonic()
+        self._refill(now)
+        return now >= self._blocked_until and self._tokens >= self.capacity
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+
+class _FairQueue:
+    """Calls waiting for their turn on one key, ordered by finish tag."""
+
+    __slots__ = ("active", "waiters", "finish", "vtime", "seq")
+
+    def __init__(self) -> None:
+        self.active = False
+        self.waiters: list[tuple[float, int, asyncio.Future[None]]] = []
+        # flow -> finish tag of its latest call
+        self.finish: dict[Hashable, float] = {}
+        self.vtime = 0.0
+        self.seq = 0
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters for a ``RateLimiter``.
+
+    Attributes:
+        sent: Calls that completed successfully.
+        retried: Calls retried after a rate-limit response.
+        waiting: Calls currently queued behind earlier calls or for a token.
+        peak_waiting: Highest ``waiting`` seen.
+        total_wait: Seconds calls spent queued before their first attempt.
+        max_wait: Longest time a single call spent queued.
+    """
+
+    sent: int = 0
+    retried: int = 0
+    waiting: int = 0
+    peak_waiting: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class RateLimiter:
+    """Paces outbound calls through a global and per-key token buckets.
+
+    Args:
+        rate: Calls per second across all keys. None for no global limit.
+        burst: Global bucket capacity.
+        key_rate: Calls per second per key. None for no per-key limit.
+        key_burst: Per-key bucket capacity.
+        retry_after: Extracts a retry delay from an exception raised by a
+            call, returning None for errors that aren't rate limits. Defaults
+            to :func:`default_retry_after`.
+        max_retries: Rate-limit retries per call before the error is raised.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float | None = None,
+        burst: float | None = None,
+        key_rate: float | None = None,
+        key_burst: float | None = None,
+        retry_after: RetryAfterFn | None = None,
+        max_retries: int = 5,
+    ) -> None:
+        self.stats = RateLimiterStats()
+        self._global = TokenBucket(rate, burst) if rate else None
+        self._key_rate = key_rate
+        self._key_burst = key_burst
+        self._retry_after = retry_after or default_retry_after
+        self._max_retries = max(0, max_retries)
+        self._buckets: dict[Hashable, TokenBucket] = {}
+        # Idle buckets are evicted when the table grows past this size.
+        self._sweep_at = _MIN_SWEEP
+        self._queues: dict[Hashable, _FairQueue] = {}
+
+    async def run(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[T]],
+        *,
+        flow: Hashable = None,
+        weight: float = 1.0,
+    ) -> T:
+        """Run ``call`` once a token for ``key`` is available.
+
+        Calls for the same key run one at a time. When several are waiting,
+        the next one is chosen by weighted fair queueing over their flows:
+        each flow gets a share of the key's rate proportional to its weight,
+        so a flow that floods the key can't starve the others. Calls within
+        a flow keep their order.
+
+        Args:
+            key: The chat, channel or thread the call targets.
+            call: Zero-argument coroutine function making the API call. It is
+                called again on each retry.
+            flow: Who the call is for, typically a session. Calls without a
+                flow share one.
+            weight: The call's share relative to others waiting on the key.
+
+        Returns:
+            Whatever ``call`` returns.
+        """
+        stats = self.stats
+        queued_at = time.monotonic()
+        stats.waiting += 1
+        stats.peak_waiting = max(stats.peak_waiting, stats.waiting)
+        queued = True
+        queue: _FairQueue | None = None
+        try:
+            queue = await self._enter(key, flow, weight)
+            retries = 0
+            while True:
+                await self._acquire(key)
+                if queued:
+                    queued = False
+                    stats.waiting -= 1
+                    waited = time.monotonic() - queued_at
+                    stats.total_wait += waited
+                    stats.max_wait = max(stats.max_wait, waited)
+                try:
+                    result = await call()
+                except Exception as exc:
+                    delay = self._retry_after(exc)
+                    if delay is None or retries >= self._max_retries:
+                        raise
+                    retries += 1
+                    stats.retried += 1
+                    self._bucket(key).pause(delay)
+                    logger.warning("Rate limited, retrying", key=str(key), retry_after=delay)
+                    continue
+                stats.sent += 1
+                return result
+        finally:
+            if queued:
+                stats.waiting -= 1
+            if queue is not None:
+                self._leave(key, queue)
+
+    def busy(self, key: Hashable) -> bool:
+        """Whether a call for ``key`` is queued or in flight."""
+        return key in self._queues
+
+    async def _enter(self, key: Hashable, flow: Hashable, weight: float) -> _FairQueue:
+        """Wait for this call's turn on ``key``."""
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = _FairQueue()
+        # Self-clocked fair queueing: a call's finish tag is where its flow
+        # left off (or the current virtual time, if later) plus 1/weight.
+        start = max(queue.vtime, queue.finish.get(flow, 0.0))
+        tag = start + 1 / max(weight, 1e-9)
+        queue.finish[flow] = tag
+        if not queue.active:
+            queue.active = True
+            queue.vtime = tag
+            return queue
+
+        turn = asyncio.get_running_loop().create_future()
+        heapq.heappush(queue.waiters, (tag, queue.seq, turn))
+        queue.seq += 1
+        try:
+            await turn
+        except asyncio.CancelledError:
+            if turn.done() and not turn.cancelled():
+                # Cancelled right after being handed the turn: pass it on.
+                self._leave(key, queue)
+            raise
+        return queue
+
+    def _leave(self, key: Hashable, queue: _FairQueue) -> None:
+        """Hand the key to the waiting call with the smallest finish tag."""
+        while queue.waiters:
+            tag, _, turn = heapq.heappop(queue.waiters)
+            if turn.done():
+                continue
+            queue.vtime = tag
+            turn.set_result(None)
+            return
+        # Idle: forget the flows' tags along with the queue.
+        del self._queues[key]
+
+    async def _acquire(self, key: Hashable) -> None:
+        """Wait until both the global and the key's bucket have a token."""
+        bucket = self._bucket(key)
+        buckets = [bucket, self._global] if self._global is not None else [bucket]
+        while True:
+            delay = max(b.delay() for b in buckets)
+            if delay <= 0:
+                for b in buckets:
+                    b.take()
+                return
+            await asyncio.sleep(delay)
+
+    def _bucket(self, key: Hashable) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self._sweep_at:
+                self._sweep()
+            rate = self._key_rate or float("inf")
+            bucket = self._buckets[key] = TokenBucket(rate, self._key_burst)
+        return bucket
+
+    def _sweep(self) -> None:
+        """Forget buckets of keys with no calls that have refilled completely.
+
+        Such a bucket behaves exactly like the one created on the key's next
+        call. The next sweep waits until the table has doubled, so sweeping
+        costs O(1) per new key.
+        """
+        now = time.monotonic()
+        self._buckets = {
+            key: bucket
+            for key, bucket in self._buckets.items()
+            if key in self._queues or not bucket.idle(now)
+        }
+        self._sweep_at = max(_MIN_SWEEP, 2 * len(self._buckets))
+
+
+def default_retry_after(exc: BaseException) -> float | None:
+    """Read a ``retry_after`` attribute (seconds or timedelta) off an exception.
+
+    Matches ``telegram.error.RetryAfter`` and any exception following the
+    same convention.
+    """
+    value = getattr(exc, "retry_after", None)
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
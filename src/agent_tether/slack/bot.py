@@ -8,22 +8,53 @@ from agent_tether.base import (
     ApprovalRequest,
     BridgeCallbacks,
     BridgeConfig,
+    DeliveryError,
     GetSessionDirectory,
     GetSessionInfo,
     OnSessionBound,
     _EXTERNAL_MAX_FETCH,
 )
+from agent_tether.outbound import APPROVAL_WEIGHT, is_transient
+from agent_tether.ratelimit import RateLimiter, RateLimiterStats
+from agent_tether.slack.formatting import markdown_to_mrkdwn, render_mrkdwn, split_message
 from agent_tether.text_command_bridge import TextCommandBridge
 from pathlib import Path
 
 logger = structlog.get_logger(__name__)
 
+# Slack truncates message text past 40,000 characters and recommends at
+# most 4,000.
+_SLACK_MSG_LIMIT = 4000
+
+# chat.postMessage has its own limit: about one message per second per
+# channel, with short bursts tolerated.
+_POST_MESSAGES_PER_SECOND = 1
+_POST_MESSAGE_BURST = 3
+
+# Requests per minute for each Web API rate tier, per method and workspace.
+_TIER_REQUESTS_PER_MINUTE = {1: 1, 2: 20, 3: 50, 4: 100}
+
+# Tiers of other methods the bridge may call. Unlisted methods get tier 2.
+_METHOD_TIERS = {
+    "chat.update": 3,
+    "chat.delete": 3,
+    "conversations.history": 3,
+    "conversations.replies": 3,
+    "conversations.info": 3,
+    "auth.test": 4,
+}
+_DEFAULT_TIER = 2
+
 
 class SlackBridge(TextCommandBridge):
     """Slack bridge that routes agent events to Slack threads.
 
     Commands (in main channel): !help, !status, !list, !attach, !stop, !usage
     Session input: messages in session threads are forwarded as input.
+
+    Args:
+        rate_limiter: Optional limiter for ``chat.postMessage``. Defaults to
+            one enforcing Slack's per-channel posting limit.
     """
 
     def __init__(
@@ -36,6 +67,7 @@ class SlackBridge(TextCommandBridge):
         get_session_directory: GetSessionDirectory | None = None,
         get_session_info: GetSessionInfo | None = None,
         on_session_bound: OnSessionBound | None = None,
+        rate_limiter: RateLimiter | None = None,
     ):
         data_dir = (config or BridgeConfig()).data_dir or "."
         super().__init__(
@@ -52,6 +84,13 @@ class SlackBridge(TextCommandBridge):
         self._client: Any = None
         self._app: Any = None
         self._thread_ts: dict[str, str] = {}  # session_id -> thread_ts
+        # Posts are paced and ordered per channel; other methods per tier.
+        self._post_limiter = rate_limiter or RateLimiter(
+            key_rate=_POST_MESSAGES_PER_SECOND,
+            key_burst=_POST_MESSAGE_BURST,
+            retry_after=_slack_retry_after,
+        )
+        self._tier_limiters: dict[int, RateLimiter] = {}
 
     def restore_thread_mappings(self, sessions: list[dict] | None = None) -> None:
         """Restore session-to-thread mappings after restart.
@@ -125,6 +164,59 @@ class SlackBridge(TextCommandBridge):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @property
+    def send_stats(self) -> RateLimiterStats:
+        """Queue depth, wait time and retry counters for posted messages."""
+        return self._post_limiter.stats
+
+    async def _call(
+        self,
+        method: str,
+        session_id: str | None = None,
+        weight: float = 1.0,
+        idempotency_key: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Call a Web API method through the outbound dispatcher.
+
+        ``chat.postMessage`` is paced per channel and runs in call order, so
+        messages within a thread stay ordered; sessions posting to one
+        channel share its rate fairly, scaled by ``weight``. Other methods
+        are paced by their rate tier. ``ratelimited`` responses are retried
+        after the ``Retry-After`` they carry, and network errors and 5xx
+        responses with jittered backoff. A call whose ``idempotency_key``
+        was already delivered isn't made again.
+        """
+        call = getattr(self._client, method.replace(".", "_"))
+        if method == "chat.postMessage":
+            return await self._dispatch(
+                lambda: call(**kwargs),
+                session_id=session_id,
+                key=kwargs.get("channel"),
+                policy=self._post_limiter,
+                weight=weight,
+                idempotency_key=idempotency_key,
+                transient=_slack_transient,
+            )
+        tier = _METHOD_TIERS.get(method, _DEFAULT_TIER)
+        limiter = self._tier_limiters.get(tier)
+        if limiter is None:
+            per_minute = _TIER_REQUESTS_PER_MINUTE[tier]
+            limiter = self._tier_limiters[tier] = RateLimiter(
+                key_rate=per_minute / 60,
+                key_burst=max(1, per_minute // 10),
+                retry_after=_slack_retry_after,
+            )
+        return await self._dispatch(
+            lambda: call(**kwargs),
+            session_id=session_id,
+            key=method,
+            policy=limiter,
+            weight=weight,
+            idempotency_key=idempotency_key,
+            transient=_slack_transient,
+        )
+
     async def _reply(self, event: dict, text: str) -> None:
         """Send a reply to the channel/thread where the event originated."""
         if not self._client:
@@ -134,7 +226,7 @@ class SlackBridge(TextCommandBridge):
         if thread_ts:
             kwargs["thread_ts"] = thread_ts
         try:
-            await self._client.chat_postMessage(**kwargs)
+            await self._call("chat.postMessage", **kwargs)
         except Exception:
             logger.exception("Failed to send Slack reply")
 
@@ -343,7 +435,8 @@ class SlackBridge(TextCommandBridge):
                     )
                     if replay:
                         try:
-                            await self._client.chat_postMessage(
+                            await self._call(
+                                "chat.postMessage",
                                 channel=self._channel_id,
                                 thread_ts=thread_ts,
                                 text=replay,
@@ -357,8 +450,7 @@ class SlackBridge(TextCommandBridge):
                 logger.exception("Failed to replay external session history into Slack thread")
 
             # Bind platform
-            if self._on_session_bound:
-                await self._on_session_bound(session_id, "slack", thread_info.get("thread_id"))
+            await self._session_bound(session_id, "slack", thread_info.get("thread_id"))
 
             dir_short = external.get("directory", "").rsplit("/", 1)[-1]
             await self._reply(
@@ -464,14 +556,25 @@ class SlackBridge(TextCommandBridge):
             logger.warning("No Slack thread for session", session_id=session_id)
             return
 
-        try:
-            await self._client.chat_postMessage(
-                channel=self._channel_id,
-                thread_ts=thread_ts,
-                text=text,
-            )
-        except Exception:
-            logger.exception("Failed to send Slack message", session_id=session_id)
+        message_key = self._message_key(session_id, metadata)
+        # Long output goes out as consecutive thread replies, in order. A
+        # failed part stops the rest so they can't overtake it; delivering
+        # the message again skips the parts already posted (same keys).
+        parts = split_message(markdown_to_mrkdwn(text), _SLACK_MSG_LIMIT)
+        for index, part in enumerate(parts):
+            try:
+                await self._call(
+                    "chat.postMessage",
+                    session_id=session_id,
+                    idempotency_key=f"{message_key}:{index}",
+                    channel=self._channel_id,
+                    thread_ts=thread_ts,
+                    text=part,
+                )
+            except Exception as exc:
+                raise DeliveryError(
+                    f"Failed to send Slack message part {index + 1}: {exc}"
+                ) from exc
 
     async def send_auto_approve_batch(self, session_id: str, items: list[tuple[str, str]]) -> None:
         """Send a batched auto-approve notification to Slack."""
@@ -492,7 +595,9 @@ class SlackBridge(TextCommandBridge):
             text = "\n".join(lines)
 
         try:
-            await self._client.chat_postMessage(
+            await self._call(
+                "chat.postMessage",
+                session_id=session_id,
                 channel=self._channel_id,
                 thread_ts=thread_ts,
                 text=text,
@@ -517,13 +622,16 @@ class SlackBridge(TextCommandBridge):
                 "Reply with a number (e.g. `1`) or an exact option label."
             )
             try:
-                await self._client.chat_postMessage(
+                await self._call(
+                    "chat.postMessage",
+                    session_id=session_id,
+                    weight=APPROVAL_WEIGHT,
                     channel=self._channel_id,
                     thread_ts=thread_ts,
                     text=text,
                 )
-            except Exception:
-                logger.exception("Failed to send Slack choice request", session_id=session_id)
+            except Exception as exc:
+                raise DeliveryError(f"Failed to send Slack choice request: {exc}") from exc
             return
 
         reason: str | None = None
@@ -540,19 +648,23 @@ class SlackBridge(TextCommandBridge):
 
         self.set_pending_permission(session_id, request)
 
-        formatted = self.format_tool_input_markdown(request.description)
+        doc, _ = self.format_tool_input(request.description)
+        formatted = render_mrkdwn(doc)
         text = (
             f"*⚠️ Approval Required*\n\n*{request.title}*\n\n{formatted}\n\n"
             "Reply with `allow`/`proceed`, `deny`/`cancel`, `deny: <reason>`, `allow all`, or `allow {tool}`."
         )
         try:
-            await self._client.chat_postMessage(
+            await self._call(
+                "chat.postMessage",
+                session_id=session_id,
+                weight=APPROVAL_WEIGHT,
                 channel=self._channel_id,
                 thread_ts=thread_ts,
                 text=text,
             )
-        except Exception:
-            logger.exception("Failed to send Slack approval request", session_id=session_id)
+        except Exception as exc:
+            raise DeliveryError(f"Failed to send Slack approval request: {exc}") from exc
 
     async def on_status_change(
         self, session_id: str, status: str, metadata: dict | None = None
@@ -578,13 +690,15 @@ class SlackBridge(TextCommandBridge):
         text = f"{emoji} Status: {status}"
 
         try:
-            await self._client.chat_postMessage(
+            await self._call(
+                "chat.postMessage",
+                session_id=session_id,
                 channel=self._channel_id,
                 thread_ts=thread_ts,
                 text=text,
             )
-        except Exception:
-            logger.exception("Failed to send Slack status", session_id=session_id)
+        except Exception as exc:
+            raise DeliveryError(f"Failed to send Slack status: {exc}") from exc
 
     async def create_thread(self, session_id: str, session_name: str) -> dict:
         """Create a Slack thread for a session."""
@@ -594,7 +708,9 @@ class SlackBridge(TextCommandBridge):
         try:
             self._reserve_thread_name(session_id, session_name)
 
-            response = await self._client.chat_postMessage(
+            response = await self._call(
+                "chat.postMessage",
+                session_id=session_id,
                 channel=self._channel_id,
                 text=f"*New Session:* {session_name}",
             )
@@ -624,3 +740,36 @@ class SlackBridge(TextCommandBridge):
             if self._thread_names.get(session_id) == session_name:
                 self._release_thread_name(session_id)
             raise RuntimeError(f"Failed to create Slack thread: {e}")
+
+
+def _slack_retry_after(exc: BaseException) -> float | None:
+    """Seconds to wait after a ``ratelimited`` Slack API error, else None."""
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    status = getattr(response, "status_code", None)
+    if status != 429 and response.get("error") != "ratelimited":
+        return None
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    if value is None:
+        return 1.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def _slack_transient(exc: BaseException) -> bool:
+    """Whether a Slack API error is a network failure or 5xx worth retrying."""
+    if is_transient(exc):
+        return True
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int) and status >= 500:
+        return True
+    try:
+        import aiohttp
+    except ImportError:
+        return False
+    # aiohttp's ServerTimeoutError is a connection error too, but ambiguous.
+    return isinstance(exc, aiohttp.ClientConnectionError) and not isinstance(exc, TimeoutError)
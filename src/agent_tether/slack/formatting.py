@@ -0,0 +1,100 @@
+"""Slack message formatting utilities."""
+
+import re
+from typing import Iterator
+
+from agent_tether import markdown as md
+
+# Links and entities in mrkdwn; a message is never cut inside one.
+_ATOMIC = re.compile(r"<[^<>\n]*>|&(?:amp|lt|gt);")
+
+
+def escape_mrkdwn(text: str) -> str:
+    """Escape the characters Slack treats as control characters (&, <, >)."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def markdown_to_mrkdwn(text: str) -> str:
+    """Convert common Markdown to Slack mrkdwn.
+
+    Handles: code blocks, inline code, bold, italic, links, headers, tables.
+    Slack has no headings or tables, so headings render as bold lines and
+    tables as aligned code blocks. Slack can't nest a style inside itself or
+    format link labels, so such inner markers are dropped.
+
+    The text is parsed with :func:`agent_tether.markdown.parse`, so other
+    bridges rendering the same output reuse the parse.
+    """
+    return render_mrkdwn(md.parse(text))
+
+
+def render_mrkdwn(doc: md.Document) -> str:
+    """Render a parsed document as Slack mrkdwn.
+
+    Text is escaped; code and tables are rendered verbatim.
+    """
+    out: list[str] = []
+    append = out.append
+    bold = italic = 0  # open markers of each style
+    in_link = False
+    after_block = False  # a code block just ended; text must start on a new line
+    for kind, value in doc.tokens:
+        if after_block and not (kind is md.TEXT and value.startswith("\n")):
+            append("\n")
+        after_block = False
+
+        if kind is md.TEXT:
+            append(escape_mrkdwn(value))
+        elif kind is md.CODE:
+            append(escape_mrkdwn(value) if in_link else f"`{escape_mrkdwn(value)}`")
+        elif kind is md.CODE_BLOCK or kind is md.TABLE:
+            block = value if kind is md.CODE_BLOCK else md.format_table(value)
+            if out and not out[-1].endswith("\n"):
+                append("\n")
+            # Keep a fence in the code from closing the block early.
+            block = escape_mrkdwn(block).replace("```", "``\\`")
+            append(f"```\n{block}\n```")
+            after_block = True
+        elif kind is md.LINK:
+            url = escape_mrkdwn(value).replace("|", "%7C")
+            append(f"<{url}|")
+            in_link = True
+        elif kind is md.LINK_END:
+            append(">")
+            in_link = False
+        elif in_link:
+            continue
+        elif kind is md.STRONG or kind is md.HEADING:
+            bold += 1
+            if bold == 1:
+                append("*")
+        elif kind is md.STRONG_END or kind is md.HEADING_END:
+            bold -= 1
+            if not bold:
+                append("*")
+        elif kind is md.EM:
+            italic += 1
+            if italic == 1:
+                append("_")
+        elif kind is md.EM_END:
+            italic -= 1
+            if not italic:
+                append("_")
+    return "".join(out)
+
+
+def split_message(text: str, limit: int = 4000) -> Iterator[str]:
+    """Split mrkdwn into Slack messages of at most ``limit`` characters.
+
+    Lazy and code-fence-aware (see :func:`agent_tether.markdown.split`);
+    links and entities are never cut.
+
+    Args:
+        text: mrkdwn to split.
+        limit: Maximum characters per message (default 4000, Slack's
+            recommended maximum for a message's text).
+
+    Returns:
+        Iterator over the messages, in order. Empty for empty text.
+    """
+    return md.split(text, limit, atomic=_ATOMIC)
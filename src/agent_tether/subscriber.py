@@ -3,30 +3,617 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
+import heapq
+import inspect
 import structlog
-from typing import Callable
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, ClassVar, Iterable, TypeVar
 
-from agent_tether.base import ApprovalRequest
-from agent_tether.manager import BridgeManager
+from agent_tether.base import BridgeInterface
+from agent_tether.cursors import CursorStore
+from agent_tether.dead_letter import DeadLetter, DeadLetterQueue
+from agent_tether.events import (
+    ApprovalEvent,
+    ErrorEvent,
+    Event,
+    OutputEvent,
+    StateEvent,
+    decode_event,
+    deliver_event,
+    delivery_key,
+    output_metadata,
+)
+from agent_tether.manager import BridgeManager, PlatformResult
 
 logger = structlog.get_logger(__name__)
 
+# Events a pool worker handles for one session before moving on to the next
+# ready session, so a chatty session can't monopolise a worker.
+_POOL_QUANTUM = 16
+
+# Joins final outputs merged by the coalescing window.
+_COALESCE_SEPARATOR = "\n\n"
+
+# Event types that flush a session's coalesced output before being handled,
+# so approvals and state changes never sit behind buffered text.
+_FLUSHING_EVENTS = frozenset({"permission_request", "session_state", "error"})
+
+# Event types served ahead of queued output when priority lanes are on. The
+# agent is blocked until an approval is answered, so it must not wait behind
+# slow platform sends.
+_PRIORITY_EVENTS = frozenset({"permission_request", "error"})
+
+# Stand-in for a lane nothing was queued on yet; never appended to. Most
+# sessions are idle, so they don't each hold two empty deques.
+_NO_LANE: deque[Event] = deque(maxlen=0)
+
 # Callback types for store integration
 NewSubscriberFn = Callable[[str], asyncio.Queue]  # (session_id) -> Queue
 RemoveSubscriberFn = Callable[[str, asyncio.Queue], None]  # (session_id, queue) -> None
 
+EventT = TypeVar("EventT", bound=Event)
+
+# (session_id, bridge, event) -> None
+EventHandler = Callable[[str, BridgeInterface, EventT], Awaitable[None]]
+
+# (ready, total) -> None
+ProgressFn = Callable[[int, int], None]
+
+# (bridge) -> awaitable delivering to it
+_Delivery = Callable[[BridgeInterface], Awaitable[None]]
+
+
+class _Flush(Event):
+    """Queued by the coalescing timer to flush a session's buffer in order
+    with the rest of its events."""
+
+    __slots__ = ()
+
+    type: ClassVar[str] = "coalesce_flush"
+
+
+_FLUSH = _Flush()
+
+
+@dataclass
+class SubscriberStats:
+    """Counters for events admitted to a BridgeSubscriber's session buffers.
+
+    Attributes:
+        received: Events handed over by the store.
+        ignored: Events with nothing to deliver (history replay, intermediate
+            output, unknown types) dropped on arrival.
+        outputs_skipped: Output events dropped to stay within
+            ``max_queue_size``; each run of them is replaced by one
+            "N messages skipped" notice.
+        states_collapsed: Queued ``session_state`` events replaced by a newer
+            one while the buffer was full.
+        over_limit: Events that are never dropped (permission requests,
+            errors) admitted past ``max_queue_size``.
+        peak_depth: Deepest any single session buffer has been.
+        prioritized: Permission requests and errors that jumped ahead of
+            queued events on the priority lane.
+        batches: Bursts drained in one wakeup with ``max_batch``.
+        reaped: Subscriptions torn down after ``idle_timeout``.
+        woken: Dormant sessions re-subscribed through :meth:`BridgeSubscriber.wake`.
+        dead_lettered: Deliveries that failed and were parked for retry.
+        redelivered: Dead letters that went through on a later attempt.
+        exhausted: Dead letters that ran out of automatic retries.
+    """
+
+    received: int = 0
+    ignored: int = 0
+    outputs_skipped: int = 0
+    states_collapsed: int = 0
+    over_limit: int = 0
+    peak_depth: int = 0
+    prioritized: int = 0
+    batches: int = 0
+    reaped: int = 0
+    woken: int = 0
+    dead_lettered: int = 0
+    redelivered: int = 0
+    exhausted: int = 0
+
+
+@dataclass
+class SubscribeManyResult:
+    """Outcome of :meth:`BridgeSubscriber.subscribe_many`.
+
+    Attributes:
+        subscribed: Sessions that were newly subscribed.
+        skipped: Sessions already subscribed or without a registered bridge.
+        timed_out: Subscribed sessions whose consumer hadn't drained its
+            backlog within ``ready_timeout``.
+        time_to_ready: Seconds from the call until every consumer was
+            started and caught up.
+    """
+
+    subscribed: list[str]
+    skipped: list[str]
+    timed_out: list[str]
+    time_to_ready: float
+
+
+def _skip_notice(count: int) -> OutputEvent:
+    """Build the output event standing in for ``count`` dropped outputs."""
+    noun = "message" if count == 1 else "messages"
+    return OutputEvent(f"({count} {noun} skipped)")
+
+
+def _event_seqs(event: Event) -> tuple[int, ...]:
+    """The store sequence numbers an event covers."""
+    return (event.seq,) if event.seq is not None else ()
+
+
+def _accepts_keyword(fn: Callable[..., Any], name: str) -> bool:
+    """Whether a store's new_subscriber callback takes keyword ``name``."""
+    try:
+        params = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return False
+    return name in params or any(p.kind is p.VAR_KEYWORD for p in params.values())
+
+
+class _DeliveryTracker:
+    """Sequence numbers of a session's events that are still owed to a bridge.
+
+    Events complete out of order: the priority lane serves approvals ahead
+    of queued output, and dead letters are retried alongside live delivery.
+    The cursor therefore moves to just below the oldest event still
+    outstanding, and never past the newest one delivered.
+    """
+
+    __slots__ = ("_held", "_oldest", "_newest", "_position", "_on_advance")
+
+    def __init__(self, on_advance: Callable[[int], None]) -> None:
+        self._held: dict[int, int] = {}  # seq -> deliveries outstanding
+        self._oldest: list[int] = []  # heap of held seqs, pruned lazily
+        self._newest: int | None = None
+        self._position: int | None = None  # last cursor reported
+        self._on_advance = on_advance
+
+    def hold(self, seq: int) -> None:
+        """Record that the event ``seq`` has a delivery outstanding."""
+        if self._position is None:
+            self._position = seq - 1
+        held = self._held.get(seq)
+        if held is None:
+            self._held[seq] = 1
+            heapq.heappush(self._oldest, seq)
+        else:
+            self._held[seq] = held + 1
+
+    def release(self, seq: int) -> None:
+        """Record that a delivery of ``seq`` completed or was given up."""
+        held = self._held.get(seq)
+        if held is None:
+            return
+        if held > 1:
+            self._held[seq] = held - 1
+            return
+        del self._held[seq]
+        if self._newest is None or seq > self._newest:
+            self._newest = seq
+        oldest = self._oldest
+        while oldest and oldest[0] not in self._held:
+            heapq.heappop(oldest)
+        position = min(self._newest, oldest[0] - 1) if oldest else self._newest
+        if self._position is None or position > self._position:
+            self._position = position
+            self._on_advance(position)
+
+
+class _SessionInbox:
+    """Subscriber-side buffer for one session's store events.
+
+    Events the store publishes to the ``source`` queue are moved here by
+    :meth:`admit`, which decodes them and buffers the records. With a
+    ``limit``, admitting an event to a full buffer applies the overflow
+    policies:
+
+    - a ``session_state`` replaces the oldest queued ``session_state``;
+    - otherwise the oldest queued ``output`` is dropped (or the incoming one,
+      if no output is queued) and counted towards a skip notice, which is
+      delivered ahead of the remaining events;
+    - anything else (permission requests, errors) is admitted regardless.
+
+    With ``priority`` set, permission requests and errors go on a separate
+    lane that is always served first. Each lane stays in arrival order.
+
+    With a ``tracker``, admitted events are held in it until delivered, and
+    events dropped by the overflow policies are released.
+    """
+
+    __slots__ = (
+        "events",
+        "urgent",
+        "priority",
+        "limit",
+        "since",
+        "stats",
+        "skipped",
+        "on_put",
+        "last_active",
+        "source",
+        "tracker",
+        "_admitting",
+        "_waiter",
+        "_drained",
+    )
+
+    def __init__(
+        self,
+        limit: int,
+        stats: SubscriberStats,
+        on_put: Callable[[], None] | None = None,
+        *,
+        priority: bool = False,
+        since: int | None = None,
+    ) -> None:
+        self.events = _NO_LANE
+        self.urgent = _NO_LANE
+        self.priority = priority
+        self.limit = limit
+        self.since = since
+        self.stats = stats
+        self.skipped = 0
+        self.on_put = on_put
+        self.last_active = time.monotonic()
+        self.source: asyncio.Queue[dict[str, Any]] | None = None
+        self.tracker: _DeliveryTracker | None = None
+        self._admitting = False
+        self._waiter: asyncio.Future[None] | None = None
+        self._drained: asyncio.Future[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self.events) + len(self.urgent) + (1 if self.skipped else 0)
+
+    def admit(self) -> None:
+        """Decode and buffer everything the store has queued so far.
+
+        Consumers are woken once for the whole burst rather than per event.
+        """
+        self._admitting = False
+        source = self.source
+        if source is None:
+            return
+        if isinstance(source, _SessionQueue):
+            raws: Iterable[dict[str, Any]] = source.take()
+        elif source.empty():
+            return
+        else:
+            raws = [source.get_nowait() for _ in range(source.qsize())]
+        if not raws:
+            return
+        self.last_active = time.monotonic()
+        news = False
+        for raw in raws:
+            news = self._admit(raw) or news
+        if news:
+            self._notify()
+
+    def schedule_admit(self) -> None:
+        """Admit the store's events on the next loop iteration.
+
+        Called from the store's publish path, so decoding and the overflow
+        policies run outside it, once per burst of events.
+        """
+        if not self._admitting:
+            self._admitting = True
+            asyncio.get_running_loop().call_soon(self.admit)
+
+    def put(self, raw: dict[str, Any]) -> None:
+        """Decode and admit a store event, applying the overflow policies when full."""
+        self.last_active = time.monotonic()
+        if self._admit(raw):
+            self._notify()
+
+    def _admit(self, raw: dict[str, Any]) -> bool:
+        """Decode and buffer a store event without waking the consumer.
+
+        Returns:
+            Whether the consumer has something new: the event or a skip notice.
+        """
+        self.stats.received += 1
+        try:
+            event = decode_event(raw, since=self.since)
+        except Exception:
+            logger.exception("Failed to decode store event", extra={"event": raw})
+            event = None
+        if event is None:
+            self.stats.ignored += 1
+            return False
+        if (
+            self.limit
+            and len(self.events) + len(self.urgent) >= self.limit
+            and not self._make_room(event)
+        ):
+            return True  # the skip notice is still news
+        if self.tracker is not None and event.seq is not None:
+            self.tracker.hold(event.seq)
+        self._enqueue(event)
+        return True
+
+    def push(self, event: Event) -> None:
+        """Append an event to its lane without applying any policy."""
+        self._enqueue(event)
+        self._notify()
+
+    def _enqueue(self, event: Event) -> None:
+        if self.priority and event.type in _PRIORITY_EVENTS:
+            if self.events or self.skipped:
+                self.stats.prioritized += 1
+            if self.urgent is _NO_LANE:
+                self.urgent = deque()
+            self.urgent.append(event)
+        else:
+            if self.events is _NO_LANE:
+                self.events = deque()
+            self.events.append(event)
+        depth = len(self.events) + len(self.urgent)
+        if depth > self.stats.peak_depth:
+            self.stats.peak_depth = depth
+
+    def pop(self) -> Event | None:
+        """Take the next event, or None if the buffer is empty."""
+        if self.urgent:
+            return self.urgent.popleft()
+        if self.skipped:
+            count, self.skipped = self.skipped, 0
+            return _skip_notice(count)
+        return self.events.popleft() if self.events else None
+
+    @property
+    def waiting(self) -> bool:
+        """Whether a consumer is parked in :meth:`get`."""
+        return self._waiter is not None
+
+    def drain(self, limit: int) -> list[Event]:
+        """Take up to ``limit`` events that are ready, in delivery order."""
+        batch: list[Event] = []
+        while len(batch) < limit:
+            event = self.pop()
+            if event is None:
+                break
+            batch.append(event)
+        return batch
+
+    async def get(self) -> Event:
+        """Wait for and take the next event."""
+        while True:
+            self.admit()
+            event = self.pop()
+            if event is not None:
+                return event
+            self._waiter = asyncio.get_running_loop().create_future()
+            self.notify_drained()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+    def wait_drained(self) -> asyncio.Future[None]:
+        """A future resolved the next time the consumer runs out of events.
+
+        Consumers call :meth:`notify_drained` when they find the inbox empty;
+        check again once it resolves, as more may have arrived since.
+        """
+        if self._drained is None:
+            self._drained = asyncio.get_running_loop().create_future()
+        return self._drained
+
+    def notify_drained(self) -> None:
+        """Resolve :meth:`wait_drained`: the consumer found nothing left to take."""
+        drained, self._drained = self._drained, None
+        if drained is not None and not drained.done():
+            drained.set_result(None)
+
+    def _make_room(self, event: Event) -> bool:
+        """Free a slot for ``event``; False if ``event`` itself was dropped."""
+        event_type = event.type
+        if event_type == "session_state" and self._remove_first("session_state"):
+            self.stats.states_collapsed += 1
+            return True
+        if self._remove_first("output"):
+            self._count_skipped()
+            return True
+        if event_type == "output":
+            self._count_skipped()
+            return False
+        self.stats.over_limit += 1
+        return True
+
+    def _remove_first(self, event_type: str) -> bool:
+        for i, queued in enumerate(self.events):
+            if queued.type == event_type:
+                del self.events[i]
+                if self.tracker is not None and queued.seq is not None:
+                    self.tracker.release(queued.seq)
+                return True
+        return False
+
+    def _count_skipped(self) -> None:
+        self.skipped += 1
+        self.stats.outputs_skipped += 1
+
+    def _notify(self) -> None:
+        if self.on_put is not None:
+            self.on_put()
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+
+class _SessionQueue(asyncio.Queue[dict[str, Any]]):
+    """Store queue handed to ``new_subscriber`` by :class:`BridgeSubscriber`.
+
+    It behaves like a plain ``asyncio.Queue`` for the store, except that a
+    publish schedules the session's inbox to admit the event, and
+    :meth:`qsize` counts the events buffered in the inbox as well, so a
+    store can see how far behind the subscriber is.
+    """
+
+    def __init__(self, inbox: _SessionInbox) -> None:
+        self._inbox = inbox
+        super().__init__()
+
+    def _init(self, maxsize: int) -> None:
+        self._items: deque[dict[str, Any]] = deque()
+
+    def _put(self, item: dict[str, Any]) -> None:
+        self._items.append(item)
+        self._inbox.schedule_admit()
+
+    def _get(self) -> dict[str, Any]:
+        return self._items.popleft()
+
+    def take(self) -> deque[dict[str, Any]]:
+        """Remove and return every queued event at once."""
+        items, self._items = self._items, deque()
+        return items
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def qsize(self) -> int:
+        return len(self._items) + len(self._inbox)
+
+
+def _hook_queue(queue: asyncio.Queue[dict[str, Any]], inbox: _SessionInbox) -> bool:
+    """Make a queue the store created schedule the inbox to admit each put.
+
+    ``put`` and ``put_nowait`` both store items through the queue's ``_put``,
+    so wrapping it on the instance is enough; no task has to read the queue.
+
+    Returns:
+        False if the queue can't be hooked (no ``_put`` or no instance dict).
+    """
+    put = getattr(queue, "_put", None)
+    if put is None or not hasattr(queue, "__dict__"):
+        return False
+
+    def hooked(item: Any) -> None:
+        put(item)
+        inbox.schedule_admit()
+
+    queue._put = hooked  # type: ignore[method-assign]
+    return True
+
+
+def _unhook_queue(queue: asyncio.Queue[dict[str, Any]]) -> None:
+    """Undo :func:`_hook_queue` once the subscriber lets go of the queue."""
+    if hasattr(queue, "__dict__"):
+        vars(queue).pop("_put", None)
+
+
+class _PendingOutput:
+    """Final outputs held back during a session's coalescing window."""
+
+    __slots__ = ("texts", "size", "seqs", "timer")
+
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+        self.size = 0  # UTF-8 bytes, separators included
+        self.seqs: list[int] = []  # of the buffered outputs, oldest first
+        self.timer: asyncio.TimerHandle | None = None
+
 
 class BridgeSubscriber:
     """Subscribes to store events and routes them to platform bridges.
 
     For each session with a platform binding, a background task consumes
-    events from a store subscriber queue and forwards them to the bridge.
+    events from a store subscriber queue and forwards them to the bridge. A
+    session bound to several platforms has each event delivered to every one
+    of them concurrently; each delivery succeeds or fails on its own.
+    Events are decoded into typed records (see :mod:`agent_tether.events`)
+    as they arrive and dispatched through a handler table keyed by record
+    type, which :meth:`add_handler` extends.
+
+    With ``workers`` set, a fixed pool of consumer tasks serves every session
+    instead. Sessions with pending events wait in a shared ready queue and are
+    served round-robin, a few events at a time. A session is only ever held by
+    one worker, so events for a session are still delivered in order.
+
+    With ``coalesce_delay`` set, final outputs that arrive within the window
+    are merged into one ``on_output`` call. The buffer is flushed when the
+    window closes, when it reaches ``coalesce_max_bytes``, and immediately
+    before a permission request, state change or error is handled.
+
+    With ``max_queue_size`` set, each session buffers at most that many
+    events while its bridge is slow. Permission requests and errors are never
+    dropped, a newer ``session_state`` replaces a queued one, and the oldest
+    outputs are dropped and summarized as a single "N messages skipped"
+    notice. See :attr:`stats` for the counters.
+
+    With ``prioritize_approvals`` set, a session's permission requests and
+    errors are served ahead of its already-queued output and state changes.
+    Output is still delivered in order, and any coalesced output is flushed
+    before the approval is sent.
+
+    With ``max_batch`` set, a consumer drains every event that is ready for a
+    session (up to the limit) in one wakeup. If every bridge the session is
+    routed to overrides :meth:`BridgeInterface.on_events`, they receive the
+    burst in a single call and bypass coalescing and the handler table;
+    otherwise each event is routed as usual.
+
+    With a ``cursors`` store, the sequence number (``seq``) of delivered
+    events is recorded per session. The cursor only moves past an event once
+    it and every earlier one was delivered, dropped by ``max_queue_size``, or
+    given up on; a dead letter holds it back until it is delivered or
+    discarded. After a restart, ``subscribe`` resumes from the stored cursor:
+    events at or below it are skipped and history replayed past it is
+    delivered instead of discarded.
+
+    With ``idle_timeout`` set, a session whose store has been quiet for that
+    long and has nothing left to deliver is unsubscribed and kept only as a
+    dormant ``session_id -> platform`` entry. The store calls :meth:`wake`
+    before publishing to a session without subscribers to bring it back, so
+    live queues and tasks track active sessions rather than every bound one.
+
+    With ``max_delivery_attempts`` set, an event whose delivery raises is
+    parked in a per-bridge :class:`~agent_tether.dead_letter.DeadLetterQueue`
+    and retried with exponential backoff instead of being dropped. Retries
+    run alongside live delivery, so a retried event can arrive after newer
+    ones. A letter holds the cursor back until it is delivered, runs out of
+    retries or is discarded. See :meth:`dead_letters`,
+    :meth:`replay_dead_letters` and :meth:`discard_dead_letters`.
 
     Args:
         bridge_manager: The bridge manager to route events through.
         new_subscriber: Callback to register a subscriber queue for a session.
+            If it accepts a ``queue`` keyword, it is passed the queue to
+            register, which admits events to the session's buffer as they
+            are published. Otherwise the queue it returns is hooked to do
+            the same.
         remove_subscriber: Callback to unregister a subscriber queue.
+        workers: Size of the shared consumer pool. 0 (default) starts one
+            task per subscribed session.
+        coalesce_delay: Seconds to hold final outputs for merging. 0 (default)
+            delivers each output as it arrives.
+        coalesce_max_bytes: Flush the coalescing buffer once the merged text
+            would exceed this many UTF-8 bytes.
+        max_queue_size: Per-session event buffer limit. 0 (default) buffers
+            without limit.
+        prioritize_approvals: Serve permission requests and errors ahead of
+            queued events for the same session.
+        max_batch: Drain up to this many ready events per wakeup and hand
+            them to :meth:`BridgeInterface.on_events`. 0 (default) routes one
+            event at a time.
+        cursors: Where to persist per-session delivery cursors. If
+            ``new_subscriber`` accepts a ``since`` keyword, it is passed the
+            cursor so the store can replay only newer events.
+        idle_timeout: Seconds without store activity after which a session's
+            subscription is reaped. 0 (default) never reaps.
+        max_delivery_attempts: Total attempts, the first one included, for
+            an event whose delivery fails. 0 (default) logs and drops failed
+            deliveries.
+        retry_base_delay: Seconds before the first retry of a failed
+            delivery; doubles with each further attempt.
+        max_exhausted_letters: Dead letters out of retries to keep per
+            bridge for :meth:`replay_dead_letters`; older ones are dropped.
     """
 
     def __init__(
@@ -34,157 +621,868 @@ class BridgeSubscriber:
         bridge_manager: BridgeManager,
         new_subscriber: NewSubscriberFn,
         remove_subscriber: RemoveSubscriberFn,
+        *,
+        workers: int = 0,
+        coalesce_delay: float = 0.0,
+        coalesce_max_bytes: int = 4000,
+        max_queue_size: int = 0,
+        prioritize_approvals: bool = False,
+        max_batch: int = 0,
+        cursors: CursorStore | None = None,
+        idle_timeout: float = 0.0,
+        max_delivery_attempts: int = 0,
+        retry_base_delay: float = 1.0,
+        max_exhausted_letters: int = 100,
     ) -> None:
         self._bridge_manager = bridge_manager
         self._new_subscriber = new_subscriber
         self._remove_subscriber = remove_subscriber
         self._tasks: dict[str, asyncio.Task] = {}
         self._queues: dict[str, asyncio.Queue] = {}
+        self._inboxes: dict[str, _SessionInbox] = {}
+        self._max_queue_size = max(0, max_queue_size)
+        self._prioritize_approvals = prioritize_approvals
+        self._max_batch = max(0, max_batch)
+        # Resumable subscriptions
+        self._cursors = cursors
+        self._store_resumes = _accepts_keyword(new_subscriber, "since")
+        self._store_takes_queue = _accepts_keyword(new_subscriber, "queue")
+        # Per-session tasks feeding inboxes from store queues that can't be hooked
+        self._pumps: dict[str, asyncio.Task[None]] = {}
+        # Idle reaping
+        self._idle_timeout = max(0.0, idle_timeout)
+        self._reaper: asyncio.Task[None] | None = None
+        self._dormant: dict[str, list[str]] = {}  # session_id -> platforms
+        # Dead letters, per platform
+        self._max_delivery_attempts = max(0, max_delivery_attempts)
+        self._retry_base_delay = max(0.0, retry_base_delay)
+        self._max_exhausted_letters = max(0, max_exhausted_letters)
+        self._dead_letters: dict[str, DeadLetterQueue] = {}
+        self._redelivery: asyncio.Task[None] | None = None
+        self._redelivery_wakeup = asyncio.Event()
+        self.stats = SubscriberStats()
+        # Worker pool mode
+        self._workers = max(0, workers)
+        self._pool: list[asyncio.Task[None]] = []
+        self._platforms: dict[str, list[str]] = {}  # session_id -> platforms
+        self._ready: asyncio.Queue[str] = asyncio.Queue()
+        # Sessions currently in the ready queue or held by a worker
+        self._scheduled: set[str] = set()
+        # Output coalescing
+        self._coalesce_delay = max(0.0, coalesce_delay)
+        self._coalesce_max_bytes = max(1, coalesce_max_bytes)
+        self._pending_output: dict[str, _PendingOutput] = {}
+        # Event dispatch, keyed by record type. Each handler takes its own
+        # record type, which a dict can't express, hence Any.
+        self._handlers: dict[type[Event], EventHandler[Any]] = {
+            OutputEvent: self._handle_output,
+            ApprovalEvent: deliver_event,
+            StateEvent: deliver_event,
+            ErrorEvent: deliver_event,
+        }
 
-    def subscribe(self, session_id: str, platform: str) -> None:
+    def subscribe(
+        self, session_id: str, platform: str | None = None, *, since: int | None = None
+    ) -> None:
         """Start consuming store events for a session and routing to a bridge.
 
         The subscriber queue is registered synchronously so that events
-        emitted between subscribe() and the first await in _consume()
-        are not lost.
+        emitted before the consumer first runs are not lost. Subscribing an
+        already subscribed session with another platform adds that platform
+        to the ones its events are delivered to.
+
+        Args:
+            session_id: The session to subscribe to.
+            platform: The bridge to route its events to. Defaults to every
+                platform the session is bound to in the bridge manager.
+            since: Resume after this sequence number. Defaults to the
+                session's stored cursor when a cursor store is configured.
         """
-        if session_id in self._tasks:
+        if session_id in self._queues:
+            if platform is not None:
+                self._add_platform(session_id, platform)
             return
+        if self._register(session_id, [platform] if platform else None, since):
+            self._start(session_id)
+            logger.info(
+                "Bridge subscriber started",
+                extra={
+                    "session_id": session_id,
+                    "platforms": self._platforms[session_id],
+                    "since": since,
+                },
+            )
 
-        # Register the queue eagerly so no events are missed.
-        queue = self._new_subscriber(session_id)
-        self._queues[session_id] = queue
+    async def subscribe_many(
+        self,
+        sessions: Iterable[tuple[str, str | None]],
+        *,
+        concurrency: int = 32,
+        ready_timeout: float | None = 30.0,
+        on_progress: ProgressFn | None = None,
+    ) -> SubscribeManyResult:
+        """Subscribe many sessions at once with a staggered consumer ramp-up.
+
+        Every queue is registered with the store up front, so no events are
+        missed. Consumers are then started ``concurrency`` sessions at a
+        time, and each group must drain its backlog (e.g. history replay)
+        before the next one starts. Until then, later sessions just buffer.
+        This avoids a thundering herd against the store and the chat APIs at
+        process start.
+
+        Args:
+            sessions: ``(session_id, platform)`` pairs. A None platform is
+                looked up in the bridge manager's routing index. A session
+                that is already subscribed is skipped, but a platform given
+                for it is added as with :meth:`subscribe`.
+            concurrency: How many consumers to start per group.
+            ready_timeout: Seconds to wait for a group to drain before moving
+                on anyway. None waits indefinitely.
+            on_progress: Called with ``(ready, total)`` after each group.
+
+        Returns:
+            Which sessions were subscribed, skipped or slow, and the time it
+            took until every consumer had caught up.
+        """
+        started_at = time.monotonic()
+        registered: list[str] = []
+        skipped: list[str] = []
+        for session_id, platform in sessions:
+            if session_id in self._queues and platform:
+                self._add_platform(session_id, platform)
+            if self._register(session_id, [platform] if platform else None, None):
+                registered.append(session_id)
+            else:
+                skipped.append(session_id)
+
+        total = len(registered)
+        step = max(1, concurrency)
+        timed_out: list[str] = []
+        for i in range(0, total, step):
+            group = registered[i : i + step]
+            for session_id in group:
+                self._start(session_id)
+            timed_out.extend(await self._wait_caught_up(group, ready_timeout))
+            if on_progress is not None:
+                on_progress(min(i + step, total), total)
 
-        task = asyncio.create_task(self._consume(session_id, platform, queue))
-        self._tasks[session_id] = task
+        result = SubscribeManyResult(
+            subscribed=registered,
+            skipped=skipped,
+            timed_out=timed_out,
+            time_to_ready=time.monotonic() - started_at,
+        )
         logger.info(
-            "Bridge subscriber started",
-            extra={"session_id": session_id, "platform": platform},
+            "Bridge subscribers started",
+            extra={
+                "subscribed": total,
+                "skipped": len(skipped),
+                "timed_out": len(timed_out),
+                "time_to_ready": round(result.time_to_ready, 3),
+            },
         )
+        return result
 
     async def unsubscribe(self, session_id: str, *, platform: str | None = None) -> None:
-        """Stop consuming events for a session and clean up bridge state."""
-        task = self._tasks.pop(session_id, None)
-        self._queues.pop(session_id, None)
-        if task:
-            task.cancel()
-            logger.info("Bridge subscriber stopped", extra={"session_id": session_id})
+        """Stop consuming events for a session and clean up bridge state.
+
+        With ``platform``, the session is also unbound from that bridge. If
+        its events are routed to other platforms as well, only that platform
+        is dropped and the subscription stays.
+        """
+        platforms = self._platforms.get(session_id) or self._dormant.get(session_id) or []
+        partial = False
+        if platform is not None and platform in platforms and len(platforms) > 1:
+            partial = True
+            platforms.remove(platform)
+            logger.info(
+                "Bridge subscriber dropped platform",
+                extra={"session_id": session_id, "platform": platform},
+            )
+        else:
+            self._dormant.pop(session_id, None)
+            if self._release(session_id):
+                logger.info("Bridge subscriber stopped", extra={"session_id": session_id})
 
         # Notify bridge so it can clean up mappings
         if platform:
+            self._bridge_manager.unbind_session(session_id, platform)
+            if self._cursors is not None and not partial:
+                self._cursors.remove(session_id)
+            dead_letters = self._dead_letters.get(platform)
+            if dead_letters is not None:
+                dead_letters.discard(session_id=session_id)
             bridge = self._bridge_manager.get_bridge(platform)
             if bridge:
                 await bridge.on_session_removed(session_id)
 
-    async def _consume(self, session_id: str, platform: str, queue: asyncio.Queue) -> None:
-        """Background task that reads from a store subscriber and routes events."""
-        bridge = self._bridge_manager.get_bridge(platform)
-        if not bridge:
+    async def stop(self) -> None:
+        """Unsubscribe every session and stop the worker pool."""
+        for session_id in list(self._queues):
+            await self.unsubscribe(session_id)
+        self._dormant.clear()
+        pool, self._pool = self._pool, []
+        if self._reaper is not None:
+            pool.append(self._reaper)
+            self._reaper = None
+        if self._redelivery is not None:
+            pool.append(self._redelivery)
+            self._redelivery = None
+        for worker in pool:
+            worker.cancel()
+        await asyncio.gather(*pool, return_exceptions=True)
+        self._scheduled.clear()
+        if self._cursors is not None:
+            self._cursors.flush()
+
+    def wake(self, session_id: str) -> bool:
+        """Re-subscribe a session that was reaped for being idle.
+
+        Stores call this before publishing to a session that has no
+        subscribers. It is cheap for sessions that aren't dormant.
+
+        Returns:
+            True if the session was dormant and is subscribed again.
+        """
+        platforms = self._dormant.pop(session_id, None)
+        if platforms is None:
+            return False
+        if not self._register(session_id, platforms, None):
+            return False
+        self._start(session_id)
+        self.stats.woken += 1
+        logger.info("Bridge subscriber woken", extra={"session_id": session_id})
+        return True
+
+    def is_dormant(self, session_id: str) -> bool:
+        """Whether a session was reaped and is waiting for :meth:`wake`."""
+        return session_id in self._dormant
+
+    def dead_letters(
+        self, platform: str | None = None, *, session_id: str | None = None
+    ) -> list[DeadLetter]:
+        """Failed deliveries waiting for a retry or a manual replay."""
+        return [
+            letter
+            for queue in self._dead_letter_queues(platform)
+            for letter in queue.letters(session_id=session_id)
+        ]
+
+    async def replay_dead_letters(
+        self,
+        platform: str | None = None,
+        *,
+        session_id: str | None = None,
+        ids: list[int] | None = None,
+    ) -> int:
+        """Retry dead letters now, exhausted ones included.
+
+        Returns:
+            How many were delivered.
+        """
+        delivered = 0
+        for queue in self._dead_letter_queues(platform):
+            for letter in queue.letters(session_id=session_id, ids=ids):
+                delivered += await self._redeliver(queue, letter)
+        return delivered
+
+    def discard_dead_letters(
+        self,
+        platform: str | None = None,
+        *,
+        session_id: str | None = None,
+        ids: list[int] | None = None,
+    ) -> int:
+        """Drop dead letters without delivering them. Returns how many."""
+        dropped = 0
+        for queue in self._dead_letter_queues(platform):
+            letters = queue.letters(session_id=session_id, ids=ids)
+            dropped += queue.discard(ids=[letter.id for letter in letters])
+            for letter in letters:
+                if not letter.exhausted:
+                    self._settle(letter.session_id, letter.seqs)
+        return dropped
+
+    def add_handler(self, event_cls: type[EventT], handler: EventHandler[EventT]) -> None:
+        """Register or replace the handler for a decoded event type.
+
+        Pair with :func:`agent_tether.events.register_decoder` to route custom
+        store events.
+
+        Args:
+            event_cls: The record class to handle.
+            handler: Async callable taking ``(session_id, bridge, event)``.
+        """
+        self._handlers[event_cls] = handler
+
+    def queue_depth(self, session_id: str) -> int:
+        """Number of events buffered for a session, 0 if not subscribed."""
+        inbox = self._inboxes.get(session_id)
+        if inbox is None:
+            return 0
+        inbox.admit()
+        return len(inbox)
+
+    def _register(self, session_id: str, platforms: list[str] | None, since: int | None) -> bool:
+        """Register a session's store queue and inbox without starting a consumer.
+
+        Args:
+            platforms: Where to route the session's events. None means every
+                platform it is bound to in the bridge manager.
+
+        Returns:
+            True if the session is newly registered.
+        """
+        if session_id in self._queues:
+            return False
+        self._dormant.pop(session_id, None)
+
+        if platforms is None:
+            platforms = self._bridge_manager.get_platforms(session_id)
+            if not platforms:
+                logger.warning(
+                    "Session is not bound to a platform, not subscribing",
+                    extra={"session_id": session_id},
+                )
+                return False
+        missing = [p for p in platforms if not self._bridge_manager.get_bridge(p)]
+        if missing:
             logger.warning(
-                "No bridge for platform, subscriber exiting",
-                extra={"session_id": session_id, "platform": platform},
+                "No bridge for platform, not routing to it",
+                extra={"session_id": session_id, "platforms": missing},
             )
+            platforms = [p for p in platforms if p not in missing]
+            if not platforms:
+                return False
+
+        if since is None and self._cursors is not None:
+            since = self._cursors.get(session_id)
+
+        inbox = _SessionInbox(
+            self._max_queue_size,
+            self.stats,
+            priority=self._prioritize_approvals,
+            since=since,
+        )
+        # Register the queue eagerly so no events are missed.
+        kwargs: dict[str, Any] = {}
+        if since is not None and self._store_resumes:
+            kwargs["since"] = since
+        if self._store_takes_queue:
+            kwargs["queue"] = _SessionQueue(inbox)
+        queue = self._new_subscriber(session_id, **kwargs)
+        inbox.source = queue
+        if self._cursors is not None:
+            inbox.tracker = _DeliveryTracker(lambda seq: self._advance(session_id, seq))
+        # Anything the store queued before returning (e.g. history replay).
+        inbox.admit()
+        if not isinstance(queue, _SessionQueue) and not _hook_queue(queue, inbox):
+            self._pumps[session_id] = asyncio.create_task(self._pump(queue, inbox))
+        self._queues[session_id] = queue
+        self._inboxes[session_id] = inbox
+        self._platforms[session_id] = list(platforms)
+        return True
+
+    def _add_platform(self, session_id: str, platform: str) -> None:
+        """Route a subscribed session's events to one more platform."""
+        platforms = self._platforms[session_id]
+        if platform in platforms:
             return
+        if not self._bridge_manager.get_bridge(platform):
+            logger.warning(
+                "No bridge for platform, not routing to it",
+                extra={"session_id": session_id, "platforms": [platform]},
+            )
+            return
+        platforms.append(platform)
+        logger.info(
+            "Bridge subscriber added platform",
+            extra={"session_id": session_id, "platform": platform},
+        )
+
+    def _start(self, session_id: str) -> None:
+        """Start consuming a registered session's inbox."""
+        inbox = self._inboxes.get(session_id)
+        if inbox is None or session_id in self._tasks:
+            return
+        if self._workers:
+            inbox.on_put = lambda: self._schedule(session_id)
+            self._ensure_pool()
+            if inbox:
+                self._schedule(session_id)
+        else:
+            task = asyncio.create_task(self._consume(session_id, inbox))
+            self._tasks[session_id] = task
+        if self._idle_timeout and self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap())
+
+    async def _wait_caught_up(self, session_ids: list[str], timeout: float | None) -> list[str]:
+        """Wait until the sessions' consumers have drained their inboxes.
+
+        Returns:
+            The sessions still behind when ``timeout`` ran out.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            behind = [
+                session_id
+                for session_id in session_ids
+                if session_id in self._inboxes and not self._is_caught_up(session_id)
+            ]
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if not behind or (remaining is not None and remaining <= 0):
+                return behind
+            await asyncio.wait(
+                [self._inboxes[session_id].wait_drained() for session_id in behind],
+                timeout=remaining,
+            )
+
+    def _release(self, session_id: str) -> bool:
+        """Tear down a session's subscription, keeping bridge state and cursor.
+
+        Returns:
+            True if the session was subscribed.
+        """
+        task = self._tasks.pop(session_id, None)
+        pump = self._pumps.pop(session_id, None)
+        queue = self._queues.pop(session_id, None)
+        inbox = self._inboxes.pop(session_id, None)
+        self._platforms.pop(session_id, None)
+        self._discard_pending_output(session_id)
+        if task:
+            task.cancel()
+        if pump:
+            pump.cancel()
+        if inbox is not None:
+            inbox.source = None
+            inbox.notify_drained()  # nothing left to wait for
+        if queue is None:
+            return False
+        _unhook_queue(queue)
+        self._remove_subscriber(session_id, queue)
+        return True
+
+    @staticmethod
+    async def _pump(queue: asyncio.Queue[dict[str, Any]], inbox: _SessionInbox) -> None:
+        """Background task feeding an inbox from a store queue that can't be hooked."""
+        try:
+            while True:
+                inbox.put(await queue.get())
+                inbox.admit()
+        except asyncio.CancelledError:
+            pass
 
+    async def _consume(self, session_id: str, inbox: _SessionInbox) -> None:
+        """Background task that reads a session's inbox and routes events."""
         try:
             while True:
-                event = await queue.get()
-                event_type = event.get("type")
-                data = event.get("data", {})
-
-                # Skip history replay events
-                if data.get("is_history"):
-                    continue
-
-                try:
-                    if event_type == "output":
-                        # Only forward the final assistant message of a turn.
-                        # Intermediate steps (thinking, tool calls) have
-                        # final=False / kind="step" and are skipped.
-                        if data.get("final"):
-                            text = data.get("text", "")
-                            if text:
-                                await bridge.on_output(session_id, text)
-
-                    elif event_type == "output_final":
-                        # Accumulated blob -- skip, we use the per-step
-                        # final output above instead.
-                        pass
-
-                    elif event_type == "permission_request":
-                        tool_input = data.get("tool_input", {})
-                        tool_name = data.get("tool_name", "Permission request")
-
-                        # Special-case multi-choice questions coming through as a "tool".
-                        # Codex emits these as AskUserQuestion with a structured schema.
-                        if (
-                            isinstance(tool_input, dict)
-                            and str(tool_name).startswith("AskUserQuestion")
-                            and isinstance(tool_input.get("questions"), list)
-                            and tool_input["questions"]
-                            and isinstance(tool_input["questions"][0], dict)
-                        ):
-                            q = tool_input["questions"][0]
-                            header = str(q.get("header") or "Question")
-                            question = str(q.get("question") or "")
-                            options = q.get("options") or []
-                            labels: list[str] = []
-                            lines: list[str] = [question.strip()] if question else []
-                            for i, opt in enumerate(options, start=1):
-                                if not isinstance(opt, dict):
-                                    continue
-                                label = str(opt.get("label") or "").strip()
-                                desc = str(opt.get("description") or "").strip()
-                                if not label:
-                                    continue
-                                labels.append(label)
-                                if desc:
-                                    lines.append(f"{i}. {label} - {desc}")
-                                else:
-                                    lines.append(f"{i}. {label}")
-
-                            request = ApprovalRequest(
-                                kind="choice",
-                                request_id=data.get("request_id", ""),
-                                title=header,
-                                description="\n".join([l for l in lines if l]).strip(),
-                                options=labels,
-                            )
-                        else:
-                            description = (
-                                json.dumps(tool_input)
-                                if isinstance(tool_input, dict)
-                                else str(tool_input)
-                            )
-                            request = ApprovalRequest(
-                                kind="permission",
-                                request_id=data.get("request_id", ""),
-                                title=tool_name,
-                                description=description,
-                                options=["Allow", "Deny"],
-                            )
-                        await bridge.on_approval_request(session_id, request)
-
-                    elif event_type == "session_state":
-                        state = data.get("state", "")
-                        if state == "RUNNING":
-                            await bridge.on_typing(session_id)
-                        elif state == "AWAITING_INPUT":
-                            await bridge.on_typing_stopped(session_id)
-                        elif state == "ERROR":
-                            await bridge.on_typing_stopped(session_id)
-                            await bridge.on_status_change(session_id, "error")
-
-                    elif event_type == "error":
-                        msg = data.get("message", "Unknown error")
-                        await bridge.on_status_change(session_id, "error", {"message": msg})
-
-                except Exception:
-                    logger.exception(
-                        "Failed to route event to bridge",
-                        extra={"session_id": session_id, "event_type": event_type},
-                    )
+                event = await inbox.get()
+                if self._max_batch > 1:
+                    batch = [event]
+                    batch.extend(inbox.drain(self._max_batch - 1))
+                    await self._route_batch(session_id, batch)
+                else:
+                    await self._route_event(session_id, event)
         except asyncio.CancelledError:
             pass
-        finally:
-            self._remove_subscriber(session_id, queue)
+
+    # ------------------------------------------------------------------
+    # Worker pool
+    # ------------------------------------------------------------------
+
+    def _schedule(self, session_id: str) -> None:
+        """Put a session on the ready queue unless it is already scheduled."""
+        if session_id in self._scheduled:
+            return
+        self._scheduled.add(session_id)
+        self._ready.put_nowait(session_id)
+
+    def _ensure_pool(self) -> None:
+        """Start the worker tasks on first use."""
+        if self._pool:
+            return
+        self._pool = [asyncio.create_task(self._work()) for _ in range(self._workers)]
+
+    async def _work(self) -> None:
+        """Pool worker: serve ready sessions round-robin, one slice at a time."""
+        while True:
+            session_id = await self._ready.get()
+            inbox = self._inboxes.get(session_id)
+            if inbox is not None and self._max_batch > 1:
+                batch = inbox.drain(self._max_batch)
+                if batch:
+                    await self._route_batch(session_id, batch)
+            elif inbox is not None:
+                for _ in range(_POOL_QUANTUM):
+                    event = inbox.pop()
+                    if event is None:
+                        break
+                    await self._route_event(session_id, event)
+                    if self._inboxes.get(session_id) is not inbox:
+                        break  # unsubscribed while we were delivering
+
+            # Re-check whatever inbox is registered now: the session may have
+            # been re-subscribed while this worker held it.
+            current = self._inboxes.get(session_id)
+            if current:
+                self._ready.put_nowait(session_id)
+            else:
+                self._scheduled.discard(session_id)
+                if current is not None:
+                    current.notify_drained()
+
+    # ------------------------------------------------------------------
+    # Idle reaping
+    # ------------------------------------------------------------------
+
+    async def _reap(self) -> None:
+        """Background task that periodically reaps idle subscriptions."""
+        interval = self._idle_timeout / 2
+        while True:
+            await asyncio.sleep(interval)
+            self._reap_idle()
+
+    def _reap_idle(self, now: float | None = None) -> int:
+        """Move idle sessions to the dormant map. Returns how many were reaped."""
+        if now is None:
+            now = time.monotonic()
+        reaped = 0
+        for session_id, inbox in list(self._inboxes.items()):
+            if now - inbox.last_active < self._idle_timeout or not self._is_quiet(session_id):
+                continue
+            platforms = self._platforms[session_id]
+            self._release(session_id)
+            self._dormant[session_id] = platforms
+            reaped += 1
+        if reaped:
+            self.stats.reaped += reaped
+            logger.info("Reaped idle bridge subscribers", extra={"count": reaped})
+        return reaped
+
+    def _is_quiet(self, session_id: str) -> bool:
+        """Whether a session has nothing buffered and no delivery in flight."""
+        return session_id not in self._pending_output and self._is_caught_up(session_id)
+
+    def _is_caught_up(self, session_id: str) -> bool:
+        """Whether a started consumer has drained everything queued so far."""
+        inbox = self._inboxes[session_id]
+        inbox.admit()
+        if inbox:
+            return False
+        if self._workers:
+            return inbox.on_put is not None and session_id not in self._scheduled
+        return inbox.waiting
+
+    # ------------------------------------------------------------------
+    # Event routing
+    # ------------------------------------------------------------------
+
+    async def _route_event(self, session_id: str, event: Event) -> None:
+        """Forward a single decoded event to the session's bridges."""
+        if event is _FLUSH:
+            await self._flush_output(session_id)
+            return
+        handler = self._handlers.get(type(event))
+        if handler is None:
+            self._settle(session_id, _event_seqs(event))
+            return
+        if session_id in self._pending_output and event.type in _FLUSHING_EVENTS:
+            await self._flush_output(session_id)
+        if (
+            self._coalesce_delay
+            and isinstance(event, OutputEvent)
+            and handler == self._handle_output
+        ):
+            await self._coalesce_output(session_id, event.text, event.seq)
+            return
+        delivery: _Delivery = lambda bridge: handler(session_id, bridge, event)
+        letters = [(event, _event_seqs(event))]
+        platforms = self._platforms.get(session_id, ())
+        if len(platforms) == 1:
+            # The common case: skip _send's fan-out bookkeeping.
+            await self._send_to(session_id, platforms[0], delivery, letters)
+        else:
+            await self._send(session_id, delivery, letters)
+
+    async def _route_batch(self, session_id: str, batch: list[Event]) -> None:
+        """Hand a drained burst to the bridges' ``on_events`` hook.
+
+        Unless every bridge the session is routed to overrides the hook, each
+        event is routed as usual, so coalescing and custom handlers still
+        apply.
+        """
+        self.stats.batches += 1
+        platforms = self._platforms.get(session_id, [])
+        if not platforms or not all(self._takes_batches(p) for p in platforms):
+            for event in batch:
+                await self._route_event(session_id, event)
+            return
+
+        events = [event for event in batch if event is not _FLUSH]
+        if session_id in self._pending_output:
+            await self._flush_output(session_id)
+        if events:
+            await self._send(
+                session_id,
+                lambda bridge: bridge.on_events(session_id, events),
+                [(event, _event_seqs(event)) for event in events],
+            )
+
+    def _takes_batches(self, platform: str) -> bool:
+        """Whether a platform's bridge overrides ``on_events``."""
+        bridge = self._bridge_manager.get_bridge(platform)
+        return bridge is not None and type(bridge).on_events is not BridgeInterface.on_events
+
+    async def _send(
+        self, session_id: str, delivery: _Delivery, letters: list[tuple[Event, tuple[int, ...]]]
+    ) -> None:
+        """Make a delivery to every platform the session is routed to.
+
+        Args:
+            delivery: Called with each bridge to deliver to it.
+            letters: The events being delivered, with the seqs each covers,
+                to settle or dead-letter per platform.
+        """
+        platforms = list(self._platforms.get(session_id, ()))
+        if len(platforms) == 1:
+            await self._send_to(session_id, platforms[0], delivery, letters)
+            return
+        if not platforms:
+            return
+        # Every platform settles its own delivery of each seq.
+        inbox = self._inboxes[session_id]
+        if inbox.tracker is not None:
+            for _, seqs in letters:
+                for seq in seqs:
+                    for _ in platforms[1:]:
+                        inbox.tracker.hold(seq)
+        await asyncio.gather(
+            *(self._send_to(session_id, platform, delivery, letters) for platform in platforms)
+        )
+
+    async def _send_to(
+        self,
+        session_id: str,
+        platform: str,
+        delivery: _Delivery,
+        letters: list[tuple[Event, tuple[int, ...]]],
+    ) -> None:
+        """Make a delivery to one platform through the bridge manager.
+
+        The manager applies the bridge's breaker, send timeout and backlog.
+        A failed delivery is dead-lettered; one held back by an open breaker
+        is settled or dead-lettered once the backlog gets to it.
+        """
+        manager = self._bridge_manager
+        on_done = (
+            functools.partial(self._delivered, session_id, platform, letters)
+            if manager.is_holding(platform)
+            else None
+        )
+        result = await manager.deliver(session_id, platform, delivery, on_done=on_done)
+        if not result.buffered:
+            self._delivered(session_id, platform, letters, result)
+
+    def _delivered(
+        self,
+        session_id: str,
+        platform: str,
+        letters: list[tuple[Event, tuple[int, ...]]],
+        result: PlatformResult,
+    ) -> None:
+        """Settle or dead-letter a delivery to one platform once it is done."""
+        if result.ok:
+            for _, seqs in letters:
+                self._settle(session_id, seqs)
+            return
+        if platform not in self._platforms.get(session_id, ()):
+            return  # unsubscribed meanwhile
+        logger.warning(
+            "Failed to route event to bridge",
+            extra={
+                "session_id": session_id,
+                "platform": platform,
+                "event_type": letters[0][0].type,
+                "count": len(letters),
+                "error": result.error,
+            },
+        )
+        for event, seqs in letters:
+            self._dead_letter(session_id, platform, event, result.error or "failed", seqs)
+
+    async def _handle_output(
+        self, session_id: str, bridge: BridgeInterface, event: OutputEvent
+    ) -> None:
+        await bridge.on_output(session_id, event.text, metadata=output_metadata(session_id, event))
+
+    def _settle(self, session_id: str, seqs: Iterable[int]) -> None:
+        """Record that the events ``seqs`` no longer hold the cursor back."""
+        inbox = self._inboxes.get(session_id)
+        if inbox is None or inbox.tracker is None:
+            return
+        for seq in seqs:
+            inbox.tracker.release(seq)
+
+    def _advance(self, session_id: str, seq: int) -> None:
+        """Record delivery up to ``seq`` for a still-subscribed session."""
+        if self._cursors is not None and session_id in self._inboxes:
+            self._cursors.advance(session_id, seq)
+
+    # ------------------------------------------------------------------
+    # Dead letters
+    # ------------------------------------------------------------------
+
+    def _dead_letter_queues(self, platform: str | None) -> list[DeadLetterQueue]:
+        if platform is None:
+            return list(self._dead_letters.values())
+        queue = self._dead_letters.get(platform)
+        return [queue] if queue is not None else []
+
+    def _dead_letter(
+        self,
+        session_id: str,
+        platform: str,
+        event: Event,
+        error: BaseException | str,
+        seqs: tuple[int, ...],
+    ) -> None:
+        """Park a failed delivery for retry, if dead-lettering is enabled.
+
+        Otherwise the delivery is dropped and no longer holds the cursor back.
+        """
+        if not self._max_delivery_attempts:
+            self._settle(session_id, seqs)
+            return
+        queue = self._dead_letters.get(platform)
+        if queue is None:
+            queue = DeadLetterQueue(
+                platform,
+                max_attempts=self._max_delivery_attempts,
+                base_delay=self._retry_base_delay,
+                max_exhausted=self._max_exhausted_letters,
+            )
+            self._dead_letters[platform] = queue
+        letter = queue.add(session_id, event, error, seqs, delivery_key(session_id, event))
+        self.stats.dead_lettered += 1
+        if letter.exhausted:
+            self.stats.exhausted += 1
+            self._settle(session_id, seqs)
+        if self._redelivery is None:
+            self._redelivery = asyncio.create_task(self._redeliver_due())
+        self._redelivery_wakeup.set()
+
+    async def _redeliver_due(self) -> None:
+        """Background task that retries dead letters as their backoff expires."""
+        while True:
+            due_at = min(
+                (t for q in self._dead_letters.values() if (t := q.next_due_at()) is not None),
+                default=None,
+            )
+            self._redelivery_wakeup.clear()
+            timeout = None if due_at is None else max(0.0, due_at - time.monotonic())
+            try:
+                await asyncio.wait_for(self._redelivery_wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            for queue in list(self._dead_letters.values()):
+                for letter in queue.due():
+                    await self._redeliver(queue, letter)
+
+    async def _redeliver(self, queue: DeadLetterQueue, letter: DeadLetter) -> bool:
+        """Try a dead letter once. Coalescing is skipped; outputs go straight out.
+
+        An open breaker counts as a failed attempt rather than queueing the
+        letter in the manager's backlog.
+        """
+        session_id, event = letter.session_id, letter.event
+        delivery: _Delivery
+        if isinstance(event, OutputEvent):
+            text = event.text
+            metadata = output_metadata(session_id, event, letter.idempotency_key)
+            delivery = lambda bridge: bridge.on_output(session_id, text, metadata=metadata)
+        else:
+            handler = self._handlers.get(type(event), deliver_event)
+            delivery = lambda bridge: handler(session_id, bridge, event)
+        was_exhausted = letter.exhausted
+        result = await self._bridge_manager.deliver(
+            session_id, letter.platform, delivery, buffer=False
+        )
+        if not result.ok:
+            queue.failed(letter, result.error or "failed")
+            if letter.exhausted and not was_exhausted:
+                self.stats.exhausted += 1
+                # Given up: stop holding the cursor back.
+                self._settle(letter.session_id, letter.seqs)
+                logger.error(
+                    "Giving up on dead letter",
+                    extra={
+                        "session_id": letter.session_id,
+                        "platform": letter.platform,
+                        "attempts": letter.attempts,
+                        "error": letter.error,
+                    },
+                )
+            return False
+        queue.delivered(letter)
+        if not was_exhausted:  # an exhausted letter's seqs were settled already
+            self._settle(letter.session_id, letter.seqs)
+        self.stats.redelivered += 1
+        return True
+
+    # ------------------------------------------------------------------
+    # Output coalescing
+    # ------------------------------------------------------------------
+
+    async def _coalesce_output(self, session_id: str, text: str, seq: int | None) -> None:
+        """Add final output to the session's coalescing buffer."""
+        size = len(text.encode("utf-8"))
+        pending = self._pending_output.get(session_id)
+        if pending and pending.size + len(_COALESCE_SEPARATOR) + size > self._coalesce_max_bytes:
+            await self._flush_output(session_id)
+            pending = None
+
+        if pending is None:
+            pending = _PendingOutput()
+            pending.timer = asyncio.get_running_loop().call_later(
+                self._coalesce_delay, self._request_flush, session_id
+            )
+            self._pending_output[session_id] = pending
+        else:
+            pending.size += len(_COALESCE_SEPARATOR)
+        pending.texts.append(text)
+        pending.size += size
+        if seq is not None:
+            pending.seqs.append(seq)
+
+        if pending.size >= self._coalesce_max_bytes:
+            await self._flush_output(session_id)
+
+    async def _flush_output(self, session_id: str) -> None:
+        """Deliver the session's coalesced outputs as a single message."""
+        pending = self._pending_output.pop(session_id, None)
+        if not pending:
+            return
+        if pending.timer:
+            pending.timer.cancel()
+        event = OutputEvent(
+            _COALESCE_SEPARATOR.join(pending.texts),
+            seq=pending.seqs[-1] if pending.seqs else None,
+        )
+        metadata = output_metadata(session_id, event)
+        await self._send(
+            session_id,
+            lambda bridge: bridge.on_output(session_id, event.text, metadata=metadata),
+            [(event, tuple(pending.seqs))],
+        )
+
+    def _request_flush(self, session_id: str) -> None:
+        """Coalescing timer callback: queue a flush behind the session's events."""
+        inbox = self._inboxes.get(session_id)
+        if inbox is not None and session_id in self._pending_output:
+            inbox.push(_FLUSH)
+
+    def _discard_pending_output(self, session_id: str) -> None:
+        """Drop a session's coalescing buffer without delivering it."""
+        pending = self._pending_output.pop(session_id, None)
+        if pending and pending.timer:
+            pending.timer.cancel()
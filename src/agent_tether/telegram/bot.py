@@ -1,7 +1,7 @@
 """Telegram bot bridge implementation."""
 
 import asyncio
-import json
+import functools
 import os
 from typing import Any
 
@@ -12,15 +12,20 @@ from agent_tether.base import (
     BridgeCallbacks,
     BridgeInterface,
     BridgeConfig,
+    DeliveryError,
     GetSessionDirectory,
     GetSessionInfo,
     OnSessionBound,
     _EXTERNAL_MAX_FETCH,
     _EXTERNAL_REPLAY_LIMIT,
 )
+from agent_tether.outbound import APPROVAL_WEIGHT, is_transient
+from agent_tether.ratelimit import RateLimiter, RateLimiterStats
 from agent_tether.telegram.formatting import (
     chunk_message,
+    html_to_plain_text,
     markdown_to_telegram_html,
+    render_telegram_html,
     strip_tool_markers,
 )
 from agent_tether.telegram.state import StateManager
@@ -30,6 +35,12 @@ logger = structlog.get_logger(__name__)
 _TELEGRAM_TOPIC_NAME_MAX_LEN = 64
 _APPROVAL_TRUNCATE = 120  # max chars per value in compact approval view
 
+# Telegram flood limits for bots: ~30 messages/s overall and 20 messages/min
+# into any one group. Every topic lives in the same forum group, so the
+# group limit is the one that binds.
+_GLOBAL_MESSAGES_PER_SECOND = 30
+_GROUP_MESSAGES_PER_MINUTE = 20
+
 
 class TelegramBridge(BridgeInterface):
     """Telegram bridge that routes agent events to Telegram forum topics.
@@ -41,6 +52,8 @@ class TelegramBridge(BridgeInterface):
         bot_token: Telegram bot API token.
         forum_group_id: Telegram forum group chat ID.
         state_manager: Optional state manager (created if not provided).
+        rate_limiter: Optional limiter for outgoing messages. Defaults to
+            one enforcing Telegram's global and per-group limits.
     """
 
     def __init__(
@@ -53,6 +66,7 @@ class TelegramBridge(BridgeInterface):
         get_session_directory: GetSessionDirectory | None = None,
         get_session_info: GetSessionInfo | None = None,
         on_session_bound: OnSessionBound | None = None,
+        rate_limiter: RateLimiter | None = None,
     ):
         super().__init__(
             config=config,
@@ -75,6 +89,14 @@ class TelegramBridge(BridgeInterface):
         self._pending_deny_reason: dict[int, tuple[str, str, str]] = {}
         # Background typing indicator loops: session_id → asyncio.Task
         self._typing_tasks: dict[str, asyncio.Task] = {}
+        # Command menu registration started by start()
+        self._commands_task: asyncio.Task[None] | None = None
+        # Paces send_message under Telegram's flood limits
+        self._limiter = rate_limiter or RateLimiter(
+            rate=_GLOBAL_MESSAGES_PER_SECOND,
+            key_rate=_GROUP_MESSAGES_PER_MINUTE / 60,
+            key_burst=_GROUP_MESSAGES_PER_MINUTE,
+        )
 
     async def start(self) -> None:
         """Start the Telegram bot."""
@@ -125,20 +147,9 @@ class TelegramBridge(BridgeInterface):
 
         await self._app.initialize()
 
-        # Register command menu with Telegram
-        from telegram import BotCommand
-
-        await self._app.bot.set_my_commands(
-            [
-                BotCommand("status", "List all sessions"),
-                BotCommand("list", "List external sessions (Claude Code, Codex)"),
-                BotCommand("attach", "Attach to an external session"),
-                BotCommand("new", "Start a new session"),
-                BotCommand("stop", "Interrupt the session in this topic"),
-                BotCommand("usage", "Show token usage and cost"),
-                BotCommand("help", "Show available commands"),
-            ]
-        )
+        # The command menu is cosmetic; register it in the background so it
+        # doesn't hold up polling.
+        self._commands_task = asyncio.create_task(self._register_commands())
 
         await self._app.start()
         await self._app.updater.start_polling()
@@ -147,19 +158,90 @@ class TelegramBridge(BridgeInterface):
             forum_group_id=self._forum_group_id,
         )
 
+    async def _register_commands(self) -> None:
+        """Register the command menu with Telegram."""
+        from telegram import BotCommand
+
+        try:
+            await self._app.bot.set_my_commands(
+                [
+                    BotCommand("status", "List all sessions"),
+                    BotCommand("list", "List external sessions (Claude Code, Codex)"),
+                    BotCommand("attach", "Attach to an external session"),
+                    BotCommand("new", "Start a new session"),
+                    BotCommand("stop", "Interrupt the session in this topic"),
+                    BotCommand("usage", "Show token usage and cost"),
+                    BotCommand("help", "Show available commands"),
+                ]
+            )
+        except Exception:
+            logger.exception("Failed to register Telegram command menu")
+
     async def stop(self) -> None:
         """Stop the Telegram bot."""
+        if self._commands_task and not self._commands_task.done():
+            self._commands_task.cancel()
         if self._app:
-            if self._app.updater.running:
+            # start() may have failed or been cancelled part way through.
+            if self._app.updater and self._app.updater.running:
                 await self._app.updater.stop()
-            await self._app.stop()
+            if self._app.running:
+                await self._app.stop()
             await self._app.shutdown()
         logger.info("Telegram bridge stopped")
 
+    @property
+    def send_stats(self) -> RateLimiterStats:
+        """Queue depth, wait time and retry counters for outgoing messages."""
+        return self._limiter.stats
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    async def _send_message(
+        self,
+        session_id: str | None = None,
+        weight: float = 1.0,
+        idempotency_key: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a message through the outbound dispatcher.
+
+        Waits for a send slot in the target chat and retries on
+        ``RetryAfter`` and network errors instead of failing. Messages for
+        one session go out in order; sessions sharing the chat get a fair
+        share of its limit, scaled by ``weight``. A message whose
+        ``idempotency_key`` was already delivered isn't sent again.
+        """
+        return await self._dispatch(
+            lambda: self._app.bot.send_message(**kwargs),
+            session_id=session_id,
+            key=kwargs["chat_id"],
+            policy=self._limiter,
+            weight=weight,
+            idempotency_key=idempotency_key,
+            transient=_telegram_transient,
+        )
+
+    async def _reply(self, message: Any, text: str, **kwargs: Any) -> Any:
+        """Reply to a message through the outbound dispatcher, paced with its chat."""
+        return await self._dispatch(
+            lambda: message.reply_text(text, **kwargs),
+            key=message.chat_id,
+            policy=self._limiter,
+            transient=_telegram_transient,
+        )
+
+    async def _edit(self, query: Any, text: str, **kwargs: Any) -> Any:
+        """Edit a callback query's message through the outbound dispatcher."""
+        return await self._dispatch(
+            lambda: query.edit_message_text(text, **kwargs),
+            key=query.message.chat_id if query.message else None,
+            policy=self._limiter,
+            transient=_telegram_transient,
+        )
+
     @staticmethod
     def _display_name(user: Any) -> str:
         """Get a human-readable display name from a Telegram user object."""
@@ -171,82 +253,6 @@ class TelegramBridge(BridgeInterface):
         name = " ".join(p for p in parts if p).strip()
         return name or "unknown"
 
-    @staticmethod
-    def _format_tool_input_html(
-        raw: str, *, truncate: int = _APPROVAL_TRUNCATE
-    ) -> tuple[str, bool]:
-        """Pretty-format tool_input as Telegram HTML.
-
-        Returns (html_text, was_truncated).
-        """
-        import html as html_mod
-
-        try:
-            obj = json.loads(raw) if isinstance(raw, str) else raw
-        except (json.JSONDecodeError, TypeError):
-            obj = None
-
-        truncated = False
-
-        if isinstance(obj, dict):
-            lines: list[str] = []
-            for key, value in obj.items():
-                label = BridgeInterface._humanize_key(str(key))
-                v = BridgeInterface._humanize_enum_value(value)
-                if len(v) > truncate:
-                    v = v[:truncate] + "…"
-                    truncated = True
-                v_escaped = html_mod.escape(v)
-                label_escaped = html_mod.escape(label)
-                if key in ("file_path", "path", "notebook_path"):
-                    lines.append(f"<b>{label_escaped}</b>: <code>{v_escaped}</code>")
-                elif key in ("command",):
-                    lines.append(f"<b>{label_escaped}</b>:\n<pre>{v_escaped}</pre>")
-                elif key in ("old_string", "new_string", "content", "new_source"):
-                    lines.append(f"<b>{label_escaped}</b>:\n<pre>{v_escaped}</pre>")
-                else:
-                    lines.append(f"<b>{label_escaped}</b>: {v_escaped}")
-            return "\n".join(lines), truncated
-
-        text = html_mod.escape(str(raw))
-        if len(text) > truncate * 3:
-            text = text[: truncate * 3] + "…"
-            truncated = True
-        return text, truncated
-
-    @staticmethod
-    def _format_tool_input_full_html(raw: str) -> str:
-        """Format tool_input as Telegram HTML without truncation."""
-        import html as html_mod
-
-        try:
-            obj = json.loads(raw) if isinstance(raw, str) else raw
-        except (json.JSONDecodeError, TypeError):
-            obj = None
-
-        if isinstance(obj, dict):
-            lines: list[str] = []
-            for key, value in obj.items():
-                label = BridgeInterface._humanize_key(str(key))
-                v = BridgeInterface._humanize_enum_value(value)
-                v_escaped = html_mod.escape(v)
-                label_escaped = html_mod.escape(label)
-                if key in ("file_path", "path", "notebook_path"):
-                    lines.append(f"<b>{label_escaped}</b>: <code>{v_escaped}</code>")
-                elif key in (
-                    "command",
-                    "old_string",
-                    "new_string",
-                    "content",
-                    "new_source",
-                ):
-                    lines.append(f"<b>{label_escaped}</b>:\n<pre>{v_escaped}</pre>")
-                else:
-                    lines.append(f"<b>{label_escaped}</b>: {v_escaped}")
-            return "\n".join(lines)
-
-        return html_mod.escape(str(raw))
-
     def _make_external_topic_name(self, *, directory: str, session_id: str) -> str:
         """Generate a topic name from the directory, UpperCased.
 
@@ -332,7 +338,7 @@ class TelegramBridge(BridgeInterface):
         first_msg_id: int | None = None
         for part in chunk_message(html_text):
             try:
-                sent = await self._app.bot.send_message(
+                sent = await self._send_message(
                     chat_id=self._forum_group_id,
                     message_thread_id=topic_id,
                     text=part,
@@ -343,7 +349,7 @@ class TelegramBridge(BridgeInterface):
             except Exception:
                 # Fallback to plain text if HTML fails
                 try:
-                    sent = await self._app.bot.send_message(
+                    sent = await self._send_message(
                         chat_id=self._forum_group_id,
                         message_thread_id=topic_id,
                         text=part.replace("<pre>", "")
@@ -415,7 +421,7 @@ class TelegramBridge(BridgeInterface):
             "/help — Show this help\n\n"
             "Send a text message in a session topic to forward it as input."
         )
-        await update.message.reply_text(text)
+        await self._reply(update.message, text)
 
     async def _cmd_status(self, update: Any, context: Any) -> None:
         """Handle /status — list all Tether sessions."""
@@ -423,11 +429,11 @@ class TelegramBridge(BridgeInterface):
             sessions = await self._callbacks.list_sessions()
         except Exception:
             logger.exception("Failed to fetch sessions for /status")
-            await update.message.reply_text("Failed to fetch sessions.")
+            await self._reply(update.message, "Failed to fetch sessions.")
             return
 
         if not sessions:
-            await update.message.reply_text("No sessions.")
+            await self._reply(update.message, "No sessions.")
             return
 
         lines = ["Sessions:\n"]
@@ -435,7 +441,7 @@ class TelegramBridge(BridgeInterface):
             emoji = self._STATE_EMOJI.get(s.get("state", ""), "❓")
             name = s.get("name") or s.get("id", "")[:12]
             lines.append(f"  {emoji} {name}")
-        await update.message.reply_text("\n".join(lines))
+        await self._reply(update.message, "\n".join(lines))
 
     async def _cmd_list(self, update: Any, context: Any) -> None:
         """Handle /list — list external sessions available for attachment."""
@@ -461,21 +467,23 @@ class TelegramBridge(BridgeInterface):
                 self._set_external_view(query)
         except Exception:
             logger.exception("Failed to fetch external sessions")
-            await update.message.reply_text("Failed to list external sessions.")
+            await self._reply(update.message, "Failed to list external sessions.")
             return
 
         text, page, total_pages = self._format_external_page(
             page, attach_cmd="/attach", list_cmd="/list"
         )
         reply_markup = self._external_pagination_markup(page, total_pages)
-        await update.message.reply_text(text, reply_markup=reply_markup)
+        await self._reply(update.message, text, reply_markup=reply_markup)
 
     async def _cmd_attach(self, update: Any, context: Any) -> None:
         """Handle /attach <number> [force] — attach to an external session and create a topic."""
 
         args = context.args
         if not args:
-            await update.message.reply_text("Usage: /attach <number> [force]\n\nRun /list first.")
+            await self._reply(
+                update.message, "Usage: /attach <number> [force]\n\nRun /list first."
+            )
             return
 
         # Parse optional "force" flag
@@ -484,17 +492,17 @@ class TelegramBridge(BridgeInterface):
         try:
             index = int(args[0]) - 1
         except ValueError:
-            await update.message.reply_text("Please provide a session number.")
+            await self._reply(update.message, "Please provide a session number.")
             return
 
         if not self._cached_external:
-            await update.message.reply_text("No external sessions cached. Run /list first.")
+            await self._reply(update.message, "No external sessions cached. Run /list first.")
             return
         if not self._external_view:
-            await update.message.reply_text("No external sessions listed. Run /list first.")
+            await self._reply(update.message, "No external sessions listed. Run /list first.")
             return
         if index < 0 or index >= len(self._external_view):
-            await update.message.reply_text(f"Invalid number. Use 1–{len(self._external_view)}.")
+            await self._reply(update.message, f"Invalid number. Use 1–{len(self._external_view)}.")
             return
 
         external = self._external_view[index]
@@ -522,7 +530,7 @@ class TelegramBridge(BridgeInterface):
                     # Verify the topic is still usable by sending a test message
                     topic_ok = False
                     try:
-                        test_msg = await self._app.bot.send_message(
+                        test_msg = await self._send_message(
                             chat_id=self._forum_group_id,
                             message_thread_id=existing_topic,
                             text="Reconnected.",
@@ -538,9 +546,10 @@ class TelegramBridge(BridgeInterface):
                         self._state.remove_session(session_id)
 
                     if topic_ok:
-                        await update.message.reply_text(
+                        await self._reply(
+                            update.message,
                             "Already attached, check the existing topic.\n"
-                            "Use /attach <number> force to recreate the topic."
+                            "Use /attach <number> force to recreate the topic.",
                         )
                         return
 
@@ -563,18 +572,18 @@ class TelegramBridge(BridgeInterface):
                 logger.exception("Failed to replay external session history into Telegram topic")
 
             # Bind session to Telegram platform
-            if self._on_session_bound:
-                await self._on_session_bound(session_id, "telegram", thread_info.get("thread_id"))
+            await self._session_bound(session_id, "telegram", thread_info.get("thread_id"))
 
             dir_short = external.get("directory", "").rsplit("/", 1)[-1]
-            await update.message.reply_text(
+            await self._reply(
+                update.message,
                 f"✅ Attached to {external['runner_type']} session in {dir_short}\n\n"
-                f"A new topic has been created. Send messages there to interact."
+                f"A new topic has been created. Send messages there to interact.",
             )
 
         except Exception as e:
             logger.warning("Failed to attach to external session", error=str(e))
-            await update.message.reply_text(f"Failed to attach: {e}")
+            await self._reply(update.message, f"Failed to attach: {e}")
 
     async def _cmd_new(self, update: Any, context: Any) -> None:
         """Handle /new — create a new session and topic.
@@ -607,9 +616,10 @@ class TelegramBridge(BridgeInterface):
 
         if not args:
             if not base_directory:
-                await update.message.reply_text(
+                await self._reply(
+                    update.message,
                     "Usage: /new <agent> <directory>\n"
-                    "Or, inside a session topic: /new or /new <agent>"
+                    "Or, inside a session topic: /new or /new <agent>",
                 )
                 return
             adapter = base_adapter
@@ -627,14 +637,15 @@ class TelegramBridge(BridgeInterface):
             else:
                 # Non-session topic: allow /new <directory> (default adapter)
                 if maybe_adapter:
-                    await update.message.reply_text("Usage: /new <agent> <directory>")
+                    await self._reply(update.message, "Usage: /new <agent> <directory>")
                     return
                 directory_raw = token
         else:
             adapter = self._agent_to_adapter(args[0])
             if not adapter:
-                await update.message.reply_text(
-                    "Unknown agent. Use: claude, codex, claude_auto, claude_subprocess, claude_api, codex_sdk_sidecar"
+                await self._reply(
+                    update.message,
+                    "Unknown agent. Use: claude, codex, claude_auto, claude_subprocess, claude_api, codex_sdk_sidecar",
                 )
                 return
             directory_raw = " ".join(args[1:]).strip()
@@ -646,7 +657,7 @@ class TelegramBridge(BridgeInterface):
                 base_directory=base_directory,
             )
         except Exception as e:
-            await update.message.reply_text(f"Invalid directory: {e}")
+            await self._reply(update.message, f"Invalid directory: {e}")
             return
 
         dir_short = directory.rstrip("/").rsplit("/", 1)[-1] or "Session"
@@ -664,7 +675,7 @@ class TelegramBridge(BridgeInterface):
             new_topic_id = int(session.get("platform_thread_id") or 0)
         except Exception as e:
             logger.exception("Failed to create session via /new")
-            await update.message.reply_text(f"Failed to create session: {e}")
+            await self._reply(update.message, f"Failed to create session: {e}")
             return
 
         # Confirm in the issuing topic.
@@ -684,14 +695,14 @@ class TelegramBridge(BridgeInterface):
             parts.append(f'<a href="{link}">Open topic →</a>')
         else:
             parts.append("A new topic should appear in the forum list.")
-        await update.message.reply_text("\n".join(parts), parse_mode="HTML")
+        await self._reply(update.message, "\n".join(parts), parse_mode="HTML")
 
         # Post a short intro in the new topic.
         if self._app and new_topic_id:
             try:
                 import html as _html
 
-                intro = await self._app.bot.send_message(
+                intro = await self._send_message(
                     chat_id=self._forum_group_id,
                     message_thread_id=new_topic_id,
                     text=(
@@ -715,31 +726,31 @@ class TelegramBridge(BridgeInterface):
         """Handle /stop — interrupt the session in the current topic."""
         topic_id = update.message.message_thread_id
         if not topic_id:
-            await update.message.reply_text("Use this command inside a session topic.")
+            await self._reply(update.message, "Use this command inside a session topic.")
             return
 
         session_id = self._state.get_session_for_topic(topic_id)
         if not session_id:
-            await update.message.reply_text("No session linked to this topic.")
+            await self._reply(update.message, "No session linked to this topic.")
             return
 
         try:
             await self._callbacks.stop_session(session_id)
-            await update.message.reply_text("⏹️ Session interrupted.")
+            await self._reply(update.message, "⏹️ Session interrupted.")
         except Exception as e:
             logger.exception("Failed to interrupt session")
-            await update.message.reply_text(f"Failed to interrupt: {e}")
+            await self._reply(update.message, f"Failed to interrupt: {e}")
 
     async def _cmd_usage(self, update: Any, context: Any) -> None:
         """Handle /usage — show token and cost usage for the session in this topic."""
         topic_id = update.message.message_thread_id
         if not topic_id:
-            await update.message.reply_text("Use this command inside a session topic.")
+            await self._reply(update.message, "Use this command inside a session topic.")
             return
 
         session_id = self._state.get_session_for_topic(topic_id)
         if not session_id:
-            await update.message.reply_text("No session linked to this topic.")
+            await self._reply(update.message, "No session linked to this topic.")
             return
 
         try:
@@ -761,10 +772,10 @@ class TelegramBridge(BridgeInterface):
             else:
                 lines.append("Cost: <i>not tracked</i>")
 
-            await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+            await self._reply(update.message, "\n".join(lines), parse_mode="HTML")
         except Exception as e:
             logger.exception("Failed to get usage")
-            await update.message.reply_text(f"Failed to get usage: {e}")
+            await self._reply(update.message, f"Failed to get usage: {e}")
 
     # ------------------------------------------------------------------
     # Message and callback handlers
@@ -785,7 +796,7 @@ class TelegramBridge(BridgeInterface):
             except Exception:
                 logger.exception("Failed to refresh external sessions")
                 try:
-                    await query.edit_message_text("Failed to refresh external sessions.")
+                    await self._edit(query, "Failed to refresh external sessions.")
                 except Exception:
                     pass
                 return
@@ -808,9 +819,7 @@ class TelegramBridge(BridgeInterface):
             except Exception:
                 logger.exception("Failed to fetch external sessions for pagination")
                 try:
-                    await query.edit_message_text(
-                        "Failed to list external sessions. Run /list again."
-                    )
+                    await self._edit(query, "Failed to list external sessions. Run /list again.")
                 except Exception:
                     pass
                 return
@@ -821,11 +830,11 @@ class TelegramBridge(BridgeInterface):
         )
         reply_markup = self._external_pagination_markup(page, total_pages)
         try:
-            await query.edit_message_text(text=text, reply_markup=reply_markup)
+            await self._edit(query, text=text, reply_markup=reply_markup)
         except Exception:
             # If edit fails (message too old, etc.), send a new message.
             try:
-                await query.message.reply_text(text, reply_markup=reply_markup)
+                await self._reply(query.message, text, reply_markup=reply_markup)
             except Exception:
                 logger.exception("Failed to send external pagination message")
 
@@ -836,15 +845,16 @@ class TelegramBridge(BridgeInterface):
 
         topic_id = update.message.message_thread_id
         if not topic_id:
-            await update.message.reply_text(
+            await self._reply(
+                update.message,
                 "💡 Send messages in a session topic to interact with that agent. "
-                "This is the General topic. Messages here aren't routed to any session."
+                "This is the General topic. Messages here aren't routed to any session.",
             )
             return
 
         session_id = self._state.get_session_for_topic(topic_id)
         if not session_id:
-            await update.message.reply_text("⚠️ No active session is linked to this topic.")
+            await self._reply(update.message, "⚠️ No active session is linked to this topic.")
             return
 
         text = update.message.text.strip()
@@ -862,9 +872,9 @@ class TelegramBridge(BridgeInterface):
                 message=message,
             )
             if ok:
-                await update.message.reply_text(f"❌ {message}")
+                await self._reply(update.message, f"❌ {message}")
             else:
-                await update.message.reply_text("❌ Failed to deny. Request may have expired.")
+                await self._reply(update.message, "❌ Failed to deny. Request may have expired.")
             return
 
         # Pending choice request: allow replying with "1"/"2"/... or an exact label.
@@ -875,14 +885,14 @@ class TelegramBridge(BridgeInterface):
                 try:
                     await self._send_input_or_start_via_api(session_id=session_id, text=selected)
                     self.clear_pending_permission(session_id)
-                    await update.message.reply_text(f"✅ Selected: {selected}")
+                    await self._reply(update.message, f"✅ Selected: {selected}")
                 except Exception:
                     logger.exception(
                         "Failed to forward choice selection",
                         session_id=session_id,
                         topic_id=topic_id,
                     )
-                    await update.message.reply_text("Failed to send selection.")
+                    await self._reply(update.message, "Failed to send selection.")
                 return
 
         try:
@@ -900,7 +910,7 @@ class TelegramBridge(BridgeInterface):
                 session_id=session_id,
                 topic_id=topic_id,
             )
-            await update.message.reply_text("Failed to send input.")
+            await self._reply(update.message, "Failed to send input.")
 
     async def _handle_callback_query(self, update: Any, context: Any) -> None:
         """Handle approval button clicks in Telegram."""
@@ -930,9 +940,7 @@ class TelegramBridge(BridgeInterface):
         session_id = self._state.get_session_for_topic(topic_id)
         if not session_id:
             logger.warning("No session for topic", topic_id=topic_id)
-            await query.edit_message_text(
-                text=f"{query.message.text}\n\n❌ Error: Session not found"
-            )
+            await self._edit(query, text=f"{query.message.text}\n\n❌ Error: Session not found")
             return
 
         # Use cached HTML to preserve formatting when editing the message
@@ -943,19 +951,22 @@ class TelegramBridge(BridgeInterface):
             cached = self._pending_descriptions.get(request_id)
             if cached:
                 tool_name, raw_desc = cached
-                full_html = self._format_tool_input_full_html(raw_desc)
+                doc, _ = self.format_tool_input(
+                    raw_desc, truncate=None, truncate_code=None, max_chars=None, max_text=None
+                )
+                full_html = render_telegram_html(doc)
                 full_text = f"⚠️ <b>{tool_name}</b> (full)\n\n{full_html}"
                 # Send as new message (don't replace — keep buttons on original)
                 for part in chunk_message(full_text):
                     try:
-                        await self._app.bot.send_message(
+                        await self._send_message(
                             chat_id=self._forum_group_id,
                             message_thread_id=topic_id,
                             text=part,
                             parse_mode="HTML",
                         )
                     except Exception:
-                        await self._app.bot.send_message(
+                        await self._send_message(
                             chat_id=self._forum_group_id,
                             message_thread_id=topic_id,
                             text=part,
@@ -975,7 +986,8 @@ class TelegramBridge(BridgeInterface):
                     or pending_req.request_id != request_id
                     or pending_req.kind != "choice"
                 ):
-                    await query.edit_message_text(
+                    await self._edit(
+                        query,
                         text=f"{original_html}\n\n❌ Request expired.",
                         parse_mode="HTML",
                     )
@@ -994,7 +1006,8 @@ class TelegramBridge(BridgeInterface):
                 selected = pending_req.options[idx]
                 await self._send_input_or_start_via_api(session_id=session_id, text=selected)
                 self.clear_pending_permission(session_id)
-                await query.edit_message_text(
+                await self._edit(
+                    query,
                     text=f"{original_html}\n\n✅ {selected} by {username}",
                     parse_mode="HTML",
                 )
@@ -1003,7 +1016,8 @@ class TelegramBridge(BridgeInterface):
             # Handle "Deny ✏️" — prompt for reason, don't resolve yet
             if option_selected == "DenyWithReason":
                 self._pending_deny_reason[topic_id] = (session_id, request_id, username)
-                await query.edit_message_text(
+                await self._edit(
+                    query,
                     text=f"{original_html}\n\n✏️ Why? Reply with your reason.",
                     parse_mode="HTML",
                 )
@@ -1050,17 +1064,20 @@ class TelegramBridge(BridgeInterface):
             )
             if ok:
                 if allow:
-                    await query.edit_message_text(
+                    await self._edit(
+                        query,
                         text=f"{original_html}\n\n✅ {display_option} by {username}",
                         parse_mode="HTML",
                     )
                 else:
-                    await query.edit_message_text(
+                    await self._edit(
+                        query,
                         text=f"{original_html}\n\n❌ Denied by {username}",
                         parse_mode="HTML",
                     )
             else:
-                await query.edit_message_text(
+                await self._edit(
+                    query,
                     text=f"{original_html}\n\n❌ Error: Failed to submit response",
                     parse_mode="HTML",
                 )
@@ -1082,7 +1099,8 @@ class TelegramBridge(BridgeInterface):
                 session_id=session_id,
                 request_id=request_id,
             )
-            await query.edit_message_text(
+            await self._edit(
+                query,
                 text=f"{original_html}\n\n❌ Error: Failed to submit response",
                 parse_mode="HTML",
             )
@@ -1103,30 +1121,39 @@ class TelegramBridge(BridgeInterface):
             logger.warning("No Telegram topic for session", session_id=session_id)
             return
 
+        from telegram.error import BadRequest
+
         formatted = markdown_to_telegram_html(text)
         chunks = chunk_message(formatted)
-        for chunk in chunks:
+        message_key = self._message_key(session_id, metadata)
+        for index, chunk in enumerate(chunks):
             try:
-                await self._app.bot.send_message(
+                await self._send_message(
+                    session_id=session_id,
+                    idempotency_key=f"{message_key}:{index}",
                     chat_id=self._forum_group_id,
                     message_thread_id=topic_id,
                     text=chunk,
                     parse_mode="HTML",
                 )
-            except Exception:
-                # Fallback to plain text if HTML parsing fails
+            except BadRequest:
+                # Fallback to plain text if Telegram rejects the markup. Send
+                # this chunk's text, not the whole message, so nothing is lost.
+                plain = html_to_plain_text(chunk)
+                if not plain.strip():
+                    continue
                 try:
-                    await self._app.bot.send_message(
+                    await self._send_message(
+                        session_id=session_id,
+                        idempotency_key=f"{message_key}:{index}:plain",
                         chat_id=self._forum_group_id,
                         message_thread_id=topic_id,
-                        text=text[:4096],
-                    )
-                except Exception:
-                    logger.exception(
-                        "Failed to send Telegram message",
-                        session_id=session_id,
-                        topic_id=topic_id,
+                        text=plain,
                     )
+                except Exception as exc:
+                    raise DeliveryError(f"Failed to send Telegram message: {exc}") from exc
+            except Exception as exc:
+                raise DeliveryError(f"Failed to send Telegram message: {exc}") from exc
 
     async def send_auto_approve_batch(self, session_id: str, items: list[tuple[str, str]]) -> None:
         """Send a batched auto-approve notification to Telegram."""
@@ -1147,7 +1174,8 @@ class TelegramBridge(BridgeInterface):
             text = "\n".join(lines)
 
         try:
-            await self._app.bot.send_message(
+            await self._send_message(
+                session_id=session_id,
                 chat_id=self._forum_group_id,
                 message_thread_id=topic_id,
                 text=text,
@@ -1167,10 +1195,16 @@ class TelegramBridge(BridgeInterface):
         try:
             while True:
                 try:
-                    await self._app.bot.send_chat_action(
-                        chat_id=self._forum_group_id,
-                        message_thread_id=topic_id,
-                        action="typing",
+                    await self._dispatch(
+                        functools.partial(
+                            self._app.bot.send_chat_action,
+                            chat_id=self._forum_group_id,
+                            message_thread_id=topic_id,
+                            action="typing",
+                        ),
+                        key=self._forum_group_id,
+                        policy=self._limiter,
+                        transient=_telegram_transient,
                     )
                 except Exception:
                     logger.debug("Failed to send typing action", session_id=session_id)
@@ -1248,19 +1282,17 @@ class TelegramBridge(BridgeInterface):
 
             reply_markup = InlineKeyboardMarkup(rows)
             try:
-                await self._app.bot.send_message(
+                await self._send_message(
+                    session_id=session_id,
+                    weight=APPROVAL_WEIGHT,
                     chat_id=self._forum_group_id,
                     message_thread_id=topic_id,
                     text=html_text,
                     reply_markup=reply_markup,
                     parse_mode="HTML",
                 )
-            except Exception:
-                logger.exception(
-                    "Failed to send choice request",
-                    session_id=session_id,
-                    request_id=request.request_id,
-                )
+            except Exception as exc:
+                raise DeliveryError(f"Failed to send choice request: {exc}") from exc
             return
 
         reason: str | None = None
@@ -1282,7 +1314,14 @@ class TelegramBridge(BridgeInterface):
             logger.error("python-telegram-bot not installed")
             return
 
-        description, was_truncated = self._format_tool_input_html(request.description)
+        doc, was_truncated = self.format_tool_input(
+            request.description,
+            truncate=_APPROVAL_TRUNCATE,
+            truncate_code=_APPROVAL_TRUNCATE,
+            max_chars=None,
+            max_text=_APPROVAL_TRUNCATE * 3,
+        )
+        description = render_telegram_html(doc)
 
         tool_name = request.title
         rid = request.request_id
@@ -1343,19 +1382,17 @@ class TelegramBridge(BridgeInterface):
         self._approval_html[rid] = text
 
         try:
-            await self._app.bot.send_message(
+            await self._send_message(
+                session_id=session_id,
+                weight=APPROVAL_WEIGHT,
                 chat_id=self._forum_group_id,
                 message_thread_id=topic_id,
                 text=text,
                 reply_markup=reply_markup,
                 parse_mode="HTML",
             )
-        except Exception:
-            logger.exception(
-                "Failed to send approval request",
-                session_id=session_id,
-                request_id=request.request_id,
-            )
+        except Exception as exc:
+            raise DeliveryError(f"Failed to send approval request: {exc}") from exc
 
     async def on_session_removed(self, session_id: str) -> None:
         """Clean up state when a session is deleted."""
@@ -1388,17 +1425,14 @@ class TelegramBridge(BridgeInterface):
         text = f"{emoji} Status: {status}"
 
         try:
-            await self._app.bot.send_message(
+            await self._send_message(
+                session_id=session_id,
                 chat_id=self._forum_group_id,
                 message_thread_id=topic_id,
                 text=text,
             )
-        except Exception:
-            logger.exception(
-                "Failed to send status update",
-                session_id=session_id,
-                status=status,
-            )
+        except Exception as exc:
+            raise DeliveryError(f"Failed to send status update: {exc}") from exc
 
     async def create_thread(self, session_id: str, session_name: str) -> dict:
         """Create a Telegram forum topic for a session."""
@@ -1406,10 +1440,17 @@ class TelegramBridge(BridgeInterface):
             raise RuntimeError("Telegram app not initialized")
 
         try:
-            topic = await self._app.bot.create_forum_topic(
-                chat_id=self._forum_group_id,
-                name=session_name[:128],  # Telegram limit
-                icon_color=7322096,  # Light blue
+            topic = await self._dispatch(
+                functools.partial(
+                    self._app.bot.create_forum_topic,
+                    chat_id=self._forum_group_id,
+                    name=session_name[:128],  # Telegram limit
+                    icon_color=7322096,  # Light blue
+                ),
+                session_id=session_id,
+                key=self._forum_group_id,
+                policy=self._limiter,
+                transient=_telegram_transient,
             )
 
             topic_id = topic.message_thread_id
@@ -1435,3 +1476,18 @@ class TelegramBridge(BridgeInterface):
                 name=session_name,
             )
             raise RuntimeError(f"Failed to create Telegram topic: {e}")
+
+
+def _telegram_transient(exc: BaseException) -> bool:
+    """Whether a Telegram error is a network failure worth retrying.
+
+    ``BadRequest`` subclasses ``NetworkError`` but won't succeed on retry.
+    ``TimedOut`` does too, and the message may have been posted anyway.
+    """
+    try:
+        from telegram.error import BadRequest, NetworkError, TimedOut
+    except ImportError:
+        return is_transient(exc)
+    if isinstance(exc, (BadRequest, TimedOut)):
+        return False
+    return isinstance(exc, NetworkError) or is_transient(exc)
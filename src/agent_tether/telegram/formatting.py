@@ -1,8 +1,11 @@
 """Telegram message formatting utilities."""
 
+import bisect
 import html
 import re
 
+from agent_tether import markdown as md
+
 
 def escape_markdown(text: str) -> str:
     """Escape special characters for Telegram MarkdownV2.
@@ -34,49 +37,21 @@ def escape_markdown(text: str) -> str:
     return text
 
 
-def _markdown_table_to_pre(text: str) -> str:
-    """Convert markdown tables to <pre> blocks.
+def _format_table(rows: list[list[str]]) -> str:
+    """Render table rows as an aligned ``<pre>`` block."""
+    return "<pre>" + html.escape(md.format_table(rows)) + "</pre>"
 
-    Finds consecutive lines that look like table rows (start/end with |)
-    and wraps them in <pre>, dropping the separator row (dashes).
-    Must be called AFTER html.escape so content is safe.
-    """
 
-    def _format_table(match: re.Match) -> str:
-        lines = match.group(0).strip().splitlines()
-        rows: list[list[str]] = []
-        for line in lines:
-            cells = [c.strip() for c in line.strip().strip("|").split("|")]
-            # Skip separator rows like |---|---|
-            if all(re.fullmatch(r"-{2,}|:?-+:?", c) for c in cells):
-                continue
-            rows.append(cells)
-        if not rows:
-            return match.group(0)
-        # Compute column widths
-        col_count = max(len(r) for r in rows)
-        widths = [0] * col_count
-        for row in rows:
-            for i, cell in enumerate(row):
-                if i < col_count:
-                    widths[i] = max(widths[i], len(cell))
-        # Format aligned rows
-        formatted: list[str] = []
-        for row in rows:
-            parts = []
-            for i in range(col_count):
-                cell = row[i] if i < len(row) else ""
-                parts.append(cell.ljust(widths[i]))
-            formatted.append("  ".join(parts))
-        return "<pre>" + "\n".join(formatted) + "</pre>"
-
-    # Match consecutive lines that start with |
-    return re.sub(
-        r"(?:^\|.+\|$\n?){2,}",
-        _format_table,
-        text,
-        flags=re.MULTILINE,
-    )
+# Markup for paired tokens. Headings render as bold; Telegram has no headings.
+_TAGS = {
+    md.STRONG: "<b>",
+    md.STRONG_END: "</b>",
+    md.EM: "<i>",
+    md.EM_END: "</i>",
+    md.LINK_END: "</a>",
+    md.HEADING: "<b>",
+    md.HEADING_END: "</b>",
+}
 
 
 def markdown_to_telegram_html(text: str) -> str:
@@ -84,39 +59,37 @@ def markdown_to_telegram_html(text: str) -> str:
 
     Handles: code blocks, inline code, bold, italic, links, headers, tables.
     Telegram HTML supports: <b>, <i>, <code>, <pre>, <a href="">.
-    """
-    # HTML-escape first so we don't corrupt user text
-    text = html.escape(text)
-
-    # Tables → <pre> (before code blocks so they don't interfere)
-    text = _markdown_table_to_pre(text)
-
-    # Fenced code blocks: ```lang\n...\n``` → <pre>...</pre>
-    text = re.sub(
-        r"```(?:\w*)\n(.*?)```",
-        lambda m: f"<pre>{m.group(1).rstrip()}</pre>",
-        text,
-        flags=re.DOTALL,
-    )
 
-    # Inline code: `...` → <code>...</code>
-    text = re.sub(r"`([^`]+)`", r"<code>\1</code>", text)
-
-    # Bold: **text** or __text__
-    text = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", text)
-    text = re.sub(r"__(.+?)__", r"<b>\1</b>", text)
-
-    # Italic: *text* or _text_ (but not inside words with underscores)
-    text = re.sub(r"(?<!\w)\*([^*]+?)\*(?!\w)", r"<i>\1</i>", text)
-    text = re.sub(r"(?<!\w)_([^_]+?)_(?!\w)", r"<i>\1</i>", text)
+    The text is parsed with :func:`agent_tether.markdown.parse`, so other
+    bridges rendering the same output reuse the parse.
+    """
+    return render_telegram_html(md.parse(text))
 
-    # Links: [text](url)
-    text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r'<a href="\2">\1</a>', text)
 
-    # Headers: # Title → bold
-    text = re.sub(r"^#{1,6}\s+(.+)$", r"<b>\1</b>", text, flags=re.MULTILINE)
+def render_telegram_html(doc: md.Document) -> str:
+    """Render a parsed document as Telegram HTML.
 
-    return text
+    Code and tables are rendered verbatim, without inner formatting.
+    """
+    TEXT, CODE, CODE_BLOCK, LINK, TABLE = md.TEXT, md.CODE, md.CODE_BLOCK, md.LINK, md.TABLE
+    escape = html.escape
+    tags = _TAGS
+    out: list[str] = []
+    append = out.append
+    for kind, value in doc.tokens:
+        if kind is TEXT:
+            append(escape(value))
+        elif kind is CODE:
+            append(f"<code>{escape(value)}</code>")
+        elif kind is CODE_BLOCK:
+            append(f"<pre>{escape(value)}</pre>")
+        elif kind is LINK:
+            append(f'<a href="{escape(value)}">')
+        elif kind is TABLE:
+            append(_format_table(value))
+        else:
+            append(tags[kind])
+    return "".join(out)
 
 
 def strip_tool_markers(text: str) -> str:
@@ -127,20 +100,168 @@ def strip_tool_markers(text: str) -> str:
     return re.sub(r"^\[tool:\s*\w+\]\s*$", "", text, flags=re.MULTILINE).strip()
 
 
+def html_to_plain_text(text: str) -> str:
+    """Strip Telegram HTML back to plain text.
+
+    Used for the plain-text fallback when Telegram rejects a chunk's markup.
+    Drops tags (including one cut off at the end of a chunk) and unescapes
+    entities.
+    """
+    return html.unescape(re.sub(r"<[^>]*(?:>|$)", "", text))
+
+
+# Tags and the text between them. A stray '<' is text.
+_HTML_UNIT = re.compile(r"<[^>]*>|[^<]+|<")
+_TAG = re.compile(r"<(/?)([A-Za-z][\w-]*)")
+_CLOSING_TAG = re.compile(r"</([A-Za-z][\w-]*)\s*>")
+# Entities that stand for one UTF-16 code unit. Longer numeric references
+# aren't matched, so they're measured by their raw length, which is larger.
+_ENTITY = re.compile(r"&(?:[A-Za-z]\w*|#\d{1,4}|#[xX][0-9a-fA-F]{1,4});")
+# Preferred places to end a chunk, best first. Each is used only if it
+# leaves the chunk at least half full.
+_BREAKS = ("\n\n", "\n", " ")
+
+
+def _utf16_len(text: str) -> int:
+    """Length in UTF-16 code units, which is how Telegram counts."""
+    return len(text.encode("utf-16-le", "surrogatepass")) // 2
+
+
+def _visible_len(text: str) -> int:
+    """Telegram length of a run of HTML text: each entity counts as one unit."""
+    if "&" in text:
+        text = _ENTITY.sub("&", text)
+    return len(text) if text.isascii() else _utf16_len(text)
+
+
 def chunk_message(text: str, limit: int = 4096) -> list[str]:
-    """Split a message into chunks at Telegram's character limit.
+    """Split a Telegram HTML message into chunks Telegram will accept.
+
+    Length is counted the way Telegram does: visible text only (tags don't
+    count, an entity counts as the character it stands for), in UTF-16
+    code units. A chunk ends at its last paragraph break, else line break,
+    else space, as long as that leaves it at least half full; otherwise it
+    is cut at the limit. Tags, entities and surrogate pairs are never split.
+    Tags open at a cut are closed at the end of the chunk and reopened at
+    the start of the next one.
 
     Args:
-        text: Text to chunk.
-        limit: Maximum characters per chunk (default 4096 for Telegram).
+        text: Telegram HTML (or plain text) to chunk.
+        limit: Maximum length per chunk (default 4096 for Telegram).
 
     Returns:
         List of text chunks.
     """
-    if len(text) <= limit:
+    if _utf16_len(text) <= limit:
         return [text]
 
-    chunks = []
-    for i in range(0, len(text), limit):
-        chunks.append(text[i : i + limit])
+    chunks: list[str] = []
+    # Tags open at the start of the current chunk: (name, opening tag).
+    open_tags: tuple[tuple[str, str], ...] = ()
+    pos = 0
+    while pos < len(text):
+        cut, still_open = _find_cut(text, pos, open_tags, limit)
+        # Closing tags right at the cut end this chunk rather than the next.
+        while closing := _CLOSING_TAG.match(text, cut):
+            still_open = _pop_tag(still_open, closing.group(1).lower())
+            cut = closing.end()
+        reopen = "".join(tag for _, tag in open_tags)
+        close = "".join(f"</{name}>" for name, _ in reversed(still_open))
+        chunks.append(reopen + text[pos:cut] + close)
+        open_tags = still_open
+        pos = cut
     return chunks
+
+
+def _find_cut(
+    text: str, pos: int, open_tags: tuple[tuple[str, str], ...], limit: int
+) -> tuple[int, tuple[tuple[str, str], ...]]:
+    """Where the chunk starting at ``pos`` should end, and the tags open there."""
+    tags = open_tags
+    # Offsets where the open tags changed, and the tags open from there on.
+    offsets = [pos]
+    states = [tags]
+    used = 0
+    half = limit // 2
+    half_at = len(text)  # offset at which the chunk is half full
+    for m in _HTML_UNIT.finditer(text, pos):
+        unit = m.group()
+        if unit[0] == "<" and (tag := _TAG.match(unit)):
+            name = tag.group(2).lower()
+            tags = _pop_tag(tags, name) if tag.group(1) else (*tags, (name, unit))
+            offsets.append(m.end())
+            states.append(tags)
+            continue
+        width = _visible_len(unit) if len(unit) <= limit - used else limit + 1
+        if used + width <= limit:
+            used += width
+            if used >= half and half_at == len(text):
+                half_at = max(m.start(), m.end() - (used - half))
+            continue
+
+        start = m.start()
+        cut = start + _fit(unit, limit - used)
+        if used < half:
+            half_at = start + half - used
+        for sep in _BREAKS:
+            at = _find_break(text, sep, half_at, cut)
+            if at >= 0:
+                cut = at + len(sep)
+                break
+        else:
+            if cut == start and not used:
+                # Not even one character fits; send it anyway.
+                cut = start + (_fit(unit, 2) or 1)
+        return cut, states[bisect.bisect_right(offsets, cut) - 1]
+    return len(text), tags
+
+
+def _find_break(text: str, sep: str, start: int, end: int) -> int:
+    """Offset of the last ``sep`` in ``text[start:end]`` outside a tag, or -1."""
+    at = text.rfind(sep, start, end - len(sep) + 1)
+    while at >= 0 and text.rfind("<", 0, at) > text.rfind(">", 0, at):
+        at = text.rfind(sep, start, at)
+    return at
+
+
+def _fit(run: str, room: int) -> int:
+    """How many characters of a text run fit in ``room`` code units.
+
+    Never ends inside an entity or between the halves of a surrogate pair.
+    """
+
+    def entity_at(k: int) -> re.Match[str] | None:
+        """The entity ``run[:k]`` ends inside of, if any."""
+        amp = run.rfind("&", max(0, k - 32), k)
+        entity = _ENTITY.match(run, amp) if amp >= 0 else None
+        return entity if entity and entity.end() > k else None
+
+    def width(k: int) -> int:
+        entity = entity_at(k)
+        if entity:
+            return _visible_len(run[: entity.start()]) + 1
+        return _visible_len(run[:k])
+
+    # A character is at least one code unit and an escaped one (&quot;)
+    # at most six characters.
+    low, high = 0, min(len(run), room * 6)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if width(mid) <= room:
+            low = mid
+        else:
+            high = mid - 1
+    entity = entity_at(low)
+    if entity:
+        low = entity.end()
+    elif low and "\ud800" <= run[low - 1] <= "\udbff":
+        low -= 1
+    return low
+
+
+def _pop_tag(tags: tuple[tuple[str, str], ...], name: str) -> tuple[tuple[str, str], ...]:
+    """``tags`` without the innermost open ``name`` tag."""
+    for k in range(len(tags) - 1, -1, -1):
+        if tags[k][0] == name:
+            return tags[:k] + tags[k + 1 :]
+    return tags
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from agent_tether import markdown as md
 from agent_tether.base import ApprovalRequest, BridgeConfig, BridgeInterface
 
 
@@ -116,6 +117,56 @@ def test_format_tool_input_markdown_truncate():
     assert len(result) < 600  # Should be truncated
 
 
+def test_format_tool_input_renders_per_dialect():
+    """Test one tool input document renders in each bridge's markup."""
+    from agent_tether.slack.formatting import render_mrkdwn
+    from agent_tether.telegram.formatting import render_telegram_html
+
+    bridge = FakeBridge()
+    doc, truncated = bridge.format_tool_input(
+        '{"file_path": "/tmp/a<b>.py", "command": "ls && pwd", "output_mode": "files_with_matches"}'
+    )
+
+    assert not truncated
+    assert render_telegram_html(doc) == (
+        "<b>File path</b>: <code>/tmp/a&lt;b&gt;.py</code>\n"
+        "<b>command</b>:\n<pre>ls &amp;&amp; pwd</pre>\n"
+        "<b>Output mode</b>: Files with matches"
+    )
+    assert render_mrkdwn(doc) == (
+        "*File path*: `/tmp/a&lt;b&gt;.py`\n"
+        "*command*:\n```\nls &amp;&amp; pwd\n```\n"
+        "*Output mode*: Files with matches"
+    )
+
+
+def test_format_tool_input_reports_truncation():
+    """Test truncated values, dropped fields and long plain text are reported."""
+    bridge = FakeBridge()
+
+    _, truncated = bridge.format_tool_input('{"data": "' + "x" * 50 + '"}', truncate=10)
+    assert truncated
+    doc, truncated = bridge.format_tool_input('{"a": "1", "b": "2"}', max_chars=5)
+    assert truncated
+    assert doc.tokens[-1] == (md.TEXT, "\n...(truncated)")
+    doc, truncated = bridge.format_tool_input("x" * 30, max_text=10)
+    assert truncated
+    assert doc.tokens == ((md.TEXT, "x" * 10 + "..."),)
+    doc, truncated = bridge.format_tool_input("x" * 30, max_text=None)
+    assert not truncated
+
+
+def test_format_tool_input_limits_plain_text_and_fields_separately():
+    """Test max_chars only drops fields and max_text only cuts plain text."""
+    bridge = FakeBridge()
+
+    _, truncated = bridge.format_tool_input("x" * 30, max_chars=10, max_text=None)
+    assert not truncated
+    fields = '{"a": "' + "1" * 20 + '", "b": "' + "2" * 20 + '"}'
+    _, truncated = bridge.format_tool_input(fields, max_chars=None, max_text=10)
+    assert not truncated
+
+
 # ========== Approval text parsing ==========
 
 
@@ -553,3 +604,26 @@ async def test_buffer_auto_approve_single_item():
 
     assert len(bridge._auto_approve_buffer.get("sess_1", [])) == 1
     assert bridge._auto_approve_buffer["sess_1"] == [("Bash", "Allow All")]
+
+
+# ========== Batch hook ==========
+
+
+@pytest.mark.asyncio
+async def test_on_events_default_delivers_each_event():
+    """Test the default on_events falls back to the per-event hooks."""
+    from agent_tether.events import ApprovalEvent, OutputEvent, StateEvent
+
+    bridge = FakeBridge()
+    request = ApprovalRequest(
+        request_id="req_1", title="Bash", description="ls", options=["Allow", "Deny"]
+    )
+
+    await bridge.on_events(
+        "sess_1",
+        [OutputEvent("one"), ApprovalEvent(request), StateEvent("ERROR"), OutputEvent("two")],
+    )
+
+    assert bridge.outputs == [("sess_1", "one"), ("sess_1", "two")]
+    assert bridge.approvals == [("sess_1", request)]
+    assert bridge.statuses == [("sess_1", "error")]
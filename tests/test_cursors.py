@@ -0,0 +1,101 @@
+"""Tests for CursorStore persistence."""
+
+import asyncio
+import json
+
+import pytest
+
+from agent_tether.base import BridgeConfig
+from agent_tether.cursors import CURSORS_FILENAME, CursorStore
+
+
+def test_save_and_load(tmp_path):
+    """Test round-trip save and load."""
+    path = tmp_path / "cursors.json"
+    store = CursorStore(path)
+    store.advance("sess_1", 5)
+    store.advance("sess_2", 9)
+
+    loaded = CursorStore(path)
+    loaded.load()
+
+    assert loaded.get("sess_1") == 5
+    assert loaded.get("sess_2") == 9
+    assert loaded.get("sess_3") is None
+
+
+def test_advance_only_moves_forward(tmp_path):
+    """Test older sequence numbers don't rewind a cursor."""
+    store = CursorStore(tmp_path / "cursors.json")
+    store.advance("sess_1", 10)
+    store.advance("sess_1", 3)
+
+    assert store.get("sess_1") == 10
+
+
+def test_remove(tmp_path):
+    """Test removing a cursor is persisted."""
+    path = tmp_path / "cursors.json"
+    store = CursorStore(path)
+    store.advance("sess_1", 1)
+    store.remove("sess_1")
+
+    assert json.loads(path.read_text()) == {}
+
+
+def test_load_missing_and_corrupt(tmp_path):
+    """Test missing or corrupt files load as empty."""
+    missing = CursorStore(tmp_path / "missing.json")
+    missing.load()
+    assert missing.get("sess_1") is None
+
+    path = tmp_path / "corrupt.json"
+    path.write_text("not valid json {{{")
+    corrupt = CursorStore(path)
+    corrupt.load()
+    assert corrupt.get("sess_1") is None
+
+
+def test_load_skips_invalid_values(tmp_path):
+    """Test non-integer cursors are ignored."""
+    path = tmp_path / "cursors.json"
+    path.write_text(json.dumps({"sess_1": 4, "sess_2": "x", "sess_3": True}))
+    store = CursorStore(path)
+    store.load()
+
+    assert store.get("sess_1") == 4
+    assert store.get("sess_2") is None
+    assert store.get("sess_3") is None
+
+
+def test_for_config(tmp_path):
+    """Test the store lives under the configured data directory."""
+    (tmp_path / CURSORS_FILENAME).write_text(json.dumps({"sess_1": 7}))
+
+    store = CursorStore.for_config(BridgeConfig(data_dir=str(tmp_path)))
+
+    assert store.get("sess_1") == 7
+
+
+@pytest.mark.asyncio
+async def test_writes_are_debounced(tmp_path):
+    """Test a burst of advances inside an event loop costs one delayed write."""
+    path = tmp_path / "cursors.json"
+    store = CursorStore(path, flush_delay=0.05)
+    for seq in range(1, 50):
+        store.advance("sess_1", seq)
+
+    assert not path.exists()
+    await asyncio.sleep(0.1)
+    assert json.loads(path.read_text()) == {"sess_1": 49}
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_pending_changes(tmp_path):
+    """Test flush() writes without waiting for the debounce."""
+    path = tmp_path / "cursors.json"
+    store = CursorStore(path, flush_delay=10)
+    store.advance("sess_1", 3)
+    store.flush()
+
+    assert json.loads(path.read_text()) == {"sess_1": 3}
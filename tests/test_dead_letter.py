@@ -0,0 +1,79 @@
+"""Tests for DeadLetterQueue backoff and bookkeeping."""
+
+import time
+
+from agent_tether.dead_letter import DeadLetterQueue
+from agent_tether.events import OutputEvent
+
+
+def test_add_schedules_first_retry():
+    """Test a new letter is due after the base delay."""
+    queue = DeadLetterQueue("telegram", base_delay=2.0)
+    before = time.monotonic()
+    letter = queue.add("sess_1", OutputEvent("hi"), RuntimeError("down"))
+
+    assert letter.attempts == 1
+    assert letter.error == "RuntimeError: down"
+    assert letter.platform == "telegram"
+    assert before + 2.0 <= letter.next_attempt_at <= time.monotonic() + 2.0
+    assert queue.due(before) == []
+    assert queue.due(before + 3) == [letter]
+
+
+def test_backoff_doubles_and_caps():
+    """Test each failure doubles the delay up to max_delay."""
+    queue = DeadLetterQueue("telegram", max_attempts=10, base_delay=1.0, max_delay=5.0)
+    letter = queue.add("sess_1", OutputEvent("hi"), "down")
+    delays = []
+    for _ in range(4):
+        now = time.monotonic()
+        queue.failed(letter, "down")
+        delays.append(round(letter.next_attempt_at - now))
+
+    assert delays == [2, 4, 5, 5]
+
+
+def test_exhausted_after_max_attempts():
+    """Test letters stop being scheduled once attempts run out."""
+    queue = DeadLetterQueue("telegram", max_attempts=2, base_delay=0)
+    letter = queue.add("sess_1", OutputEvent("hi"), "down")
+    assert not letter.exhausted
+
+    queue.failed(letter, "still down")
+
+    assert letter.exhausted
+    assert letter.attempts == 2
+    assert queue.due(time.monotonic() + 100) == []
+    assert queue.next_due_at() is None
+    assert queue.letters() == [letter]
+
+
+def test_oldest_exhausted_letters_are_dropped():
+    """Test only the most recent exhausted letters are kept."""
+    queue = DeadLetterQueue("telegram", max_attempts=1, max_exhausted=2)
+    a = queue.add("sess_1", OutputEvent("a"), "down")
+    b = queue.add("sess_1", OutputEvent("b"), "down")
+    c = queue.add("sess_1", OutputEvent("c"), "down")
+
+    assert queue.letters() == [b, c]
+    assert queue.dropped == 1
+    assert a.exhausted
+
+    queue.discard(ids=[b.id])
+    d = queue.add("sess_1", OutputEvent("d"), "down")
+    assert queue.letters() == [c, d]
+    assert queue.dropped == 1
+
+
+def test_delivered_and_discard():
+    """Test letters can be removed by delivery, session or id."""
+    queue = DeadLetterQueue("telegram")
+    a = queue.add("sess_1", OutputEvent("a"), "down")
+    b = queue.add("sess_1", OutputEvent("b"), "down")
+    c = queue.add("sess_2", OutputEvent("c"), "down")
+
+    queue.delivered(a)
+    assert queue.letters() == [b, c]
+    assert queue.discard(ids=[c.id]) == 1
+    assert queue.discard(session_id="sess_1") == 1
+    assert len(queue) == 0
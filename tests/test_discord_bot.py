@@ -0,0 +1,205 @@
+"""Tests for the Discord bridge's outbound sends."""
+
+import asyncio
+import time
+
+import pytest
+
+from agent_tether.base import BridgeConfig, DeliveryError
+from agent_tether.ratelimit import RateLimiter
+
+
+class RateLimited(Exception):
+    """Stand-in for a platform's 429 error."""
+
+    def __init__(self, retry_after):
+        super().__init__("Flood control exceeded")
+        self.retry_after = retry_after
+
+
+class FakeThread:
+    """Discord thread stand-in recording sends and typing."""
+
+    def __init__(self, thread_id, log, delay=0.0):
+        self.id = thread_id
+        self.log = log
+        self.delay = delay
+
+    async def send(self, content):
+        await asyncio.sleep(self.delay)
+        self.log.append(("send", self.id, content))
+
+    async def typing(self):
+        self.log.append(("typing", self.id, None))
+
+
+def _make_discord_bridge(tmp_path, threads, **kwargs):
+    pytest.importorskip("discord")
+    from agent_tether.discord.bot import DiscordBridge
+
+    class FakeClient:
+        def get_channel(self, channel_id):
+            return threads.get(channel_id)
+
+    bridge = DiscordBridge(
+        bot_token="token", channel_id=1, config=BridgeConfig(data_dir=str(tmp_path)), **kwargs
+    )
+    bridge._client = FakeClient()
+    return bridge
+
+
+# ========== Sending ==========
+
+
+@pytest.mark.asyncio
+async def test_discord_long_output_is_not_interleaved(tmp_path):
+    """Test a multi-part output reaches the thread contiguously and in order."""
+    log = []
+    thread = FakeThread(10, log, delay=0.001)
+    bridge = _make_discord_bridge(tmp_path, {10: thread}, rate_limiter=RateLimiter())
+    bridge._thread_ids["sess_1"] = 10
+
+    long_text = "a" * 2000 + "b" * 2000 + "c" * 10
+    await asyncio.gather(
+        bridge.on_output("sess_1", long_text),
+        bridge.on_status_change("sess_1", "done"),
+    )
+
+    contents = [content[:1] for _, _, content in log]
+    assert contents == ["a", "b", "c", "✅"]
+
+
+@pytest.mark.asyncio
+async def test_discord_command_reply_waits_for_thread_output(tmp_path):
+    """Test a command reply doesn't land between the parts of a long output."""
+    log = []
+    thread = FakeThread(10, log, delay=0.001)
+    bridge = _make_discord_bridge(tmp_path, {10: thread}, rate_limiter=RateLimiter())
+    bridge._thread_ids["sess_1"] = 10
+    message = type("Message", (), {"channel": thread})()
+
+    output = asyncio.create_task(bridge.on_output("sess_1", "a" * 2000 + "b" * 10))
+    await asyncio.sleep(0)
+    await bridge._cmd_help(message)
+    await output
+
+    assert [content[:1] for _, _, content in log] == ["a", "b", "T"]
+
+
+@pytest.mark.asyncio
+async def test_discord_send_locks_are_dropped(tmp_path):
+    """Test a thread's send lock is forgotten once nothing is sending to it."""
+    log = []
+    threads = {thread_id: FakeThread(thread_id, log) for thread_id in range(10, 20)}
+    bridge = _make_discord_bridge(tmp_path, threads, rate_limiter=RateLimiter())
+    for thread_id in threads:
+        bridge._thread_ids[f"sess_{thread_id}"] = thread_id
+
+    await asyncio.gather(
+        *(bridge.on_output(f"sess_{thread_id}", "x" * 3000) for thread_id in threads),
+        bridge.on_output("sess_10", "hello"),
+    )
+
+    assert len(log) == 21
+    assert bridge._send_locks == {}
+    assert not bridge._is_sending(10)
+
+
+@pytest.mark.asyncio
+async def test_discord_long_code_block_is_split_between_fences(tmp_path):
+    """Test each part of a long code block is a complete block of its own."""
+    log = []
+    bridge = _make_discord_bridge(tmp_path, {10: FakeThread(10, log)}, rate_limiter=RateLimiter())
+    bridge._thread_ids["sess_1"] = 10
+
+    await bridge.on_output("sess_1", "```python\n" + "print('hello')\n" * 300 + "```")
+
+    parts = [content for _, _, content in log]
+    assert len(parts) == 3
+    for part in parts:
+        assert len(part) <= 2000
+        assert part.startswith("```python\n")
+        assert part.endswith("\n```")
+
+
+@pytest.mark.asyncio
+async def test_discord_paces_per_thread_bucket(tmp_path):
+    """Test sends beyond the thread's burst wait for its bucket."""
+    log = []
+    bridge = _make_discord_bridge(tmp_path, {10: FakeThread(10, log), 20: FakeThread(20, log)})
+    bridge._thread_ids.update({"sess_1": 10, "sess_2": 20})
+
+    start = time.monotonic()
+    await bridge.on_output("sess_1", "x" * 2000 * 5)
+    await bridge.on_output("sess_2", "hello")
+
+    assert time.monotonic() - start < 0.5
+    assert len(log) == 6
+    assert bridge._limiter.busy(10) is False
+
+    task = asyncio.create_task(bridge.on_output("sess_1", "one more"))
+    await asyncio.sleep(0.05)
+    assert bridge.send_stats.waiting == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert bridge.send_stats.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_discord_typing_yields_to_messages(tmp_path):
+    """Test the typing loop skips a refresh while a message is queued."""
+    log = []
+    thread = FakeThread(10, log, delay=0.05)
+    bridge = _make_discord_bridge(tmp_path, {10: thread})
+    bridge._thread_ids["sess_1"] = 10
+
+    send = asyncio.create_task(bridge.on_output("sess_1", "hello"))
+    await asyncio.sleep(0)
+    await bridge.on_typing("sess_1")
+    await asyncio.sleep(0.01)
+    bridge._stop_typing("sess_1")
+    await send
+
+    assert log == [("send", 10, "hello")]
+
+
+def test_discord_retry_after_parsing():
+    """Test 429s are recognised from discord.py exceptions."""
+    pytest.importorskip("discord")
+    from agent_tether.discord.bot import _discord_retry_after
+
+    class FakeHTTPException(Exception):
+        def __init__(self, status, headers):
+            self.status = status
+            self.response = type("Response", (), {"headers": headers})()
+
+    assert _discord_retry_after(FakeHTTPException(429, {"Retry-After": "2.5"})) == 2.5
+    assert _discord_retry_after(FakeHTTPException(403, {})) is None
+    assert _discord_retry_after(RateLimited(4)) == 4.0
+
+
+@pytest.mark.asyncio
+async def test_discord_redelivery_skips_sent_parts(tmp_path):
+    """Test replaying an output after a failed part only sends the missing parts."""
+    log = []
+    thread = FakeThread(10, log)
+    bridge = _make_discord_bridge(tmp_path, {10: thread}, rate_limiter=RateLimiter())
+    bridge._thread_ids["sess_1"] = 10
+    original_send = thread.send
+    failures = [1]
+
+    async def flaky_send(content):
+        if content.startswith("y") and failures[0]:
+            failures[0] -= 1
+            raise ValueError("rejected")
+        await original_send(content)
+
+    thread.send = flaky_send
+    text = "x" * 2000 + "y" * 10
+
+    with pytest.raises(DeliveryError):
+        await bridge.on_output("sess_1", text, {"seq": 9})
+    await bridge.on_output("sess_1", text, {"seq": 9})
+
+    assert [content[0] for _, _, content in log] == ["x", "y"]
@@ -0,0 +1,58 @@
+"""Tests for Discord formatting utilities."""
+
+from agent_tether.discord.formatting import split_message
+
+# ========== split_message ==========
+
+
+def test_split_message_short():
+    """Test short message is a single part."""
+    assert list(split_message("Short message")) == ["Short message"]
+
+
+def test_split_message_empty():
+    """Test empty text yields no parts."""
+    assert list(split_message("")) == []
+
+
+def test_split_message_is_lazy():
+    """Test parts are produced on demand."""
+    parts = split_message("a" * 10_000, limit=2000)
+    assert next(parts) == "a" * 2000
+
+
+def test_split_message_hard_cut_is_lossless():
+    """Test text without breaks is cut at the limit and nothing is lost."""
+    text = "a" * 5000
+    parts = list(split_message(text))
+    assert [len(p) for p in parts] == [2000, 2000, 1000]
+    assert "".join(parts) == text
+
+
+def test_split_message_prefers_line_breaks():
+    """Test parts end after a newline, else a space, when one is late enough."""
+    assert list(split_message("a" * 15 + "\n" + "b b " * 5, limit=20)) == [
+        "a" * 15 + "\n",
+        "b b " * 5,
+    ]
+    assert list(split_message("a" * 15 + " " + "b" * 15, limit=20)) == ["a" * 15 + " ", "b" * 15]
+    assert list(split_message("ab\n" + "c" * 30, limit=20)) == ["ab\n" + "c" * 17, "c" * 13]
+
+
+def test_split_message_closes_and_reopens_fences():
+    """Test a code block spanning a cut is closed and reopened with its language."""
+    text = "Intro\n```python\n" + "x = 1\n" * 6 + "```\nDone"
+    parts = list(split_message(text, limit=40))
+    assert parts == [
+        "Intro\n```python\nx = 1\nx = 1\nx = 1\n```",
+        "```python\nx = 1\nx = 1\nx = 1\n```\nDone",
+    ]
+    assert all(len(p) <= 40 for p in parts)
+
+
+def test_split_message_ignores_fence_lines_inside_code():
+    """Test a fence with a language inside a code block doesn't close it."""
+    text = "```\n```python\n" + "y\n" * 20 + "```"
+    parts = list(split_message(text, limit=20))
+    assert all(p.startswith("```\n") for p in parts)
+    assert all(p.endswith("```") for p in parts)
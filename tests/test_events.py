@@ -0,0 +1,146 @@
+"""Tests for store event decoding."""
+
+from dataclasses import dataclass
+from typing import ClassVar
+
+from agent_tether.events import (
+    _DECODERS,
+    ApprovalEvent,
+    ErrorEvent,
+    Event,
+    OutputEvent,
+    StateEvent,
+    decode_event,
+    delivery_key,
+    output_metadata,
+    register_decoder,
+)
+
+
+def test_decode_final_output():
+    """Test a final output decodes to its text."""
+    event = decode_event({"type": "output", "data": {"text": "Hello", "final": True}})
+    assert event == OutputEvent("Hello")
+    assert event.type == "output"
+
+
+def test_decode_skips_intermediate_and_empty_output():
+    """Test non-final and empty outputs decode to None."""
+    assert decode_event({"type": "output", "data": {"text": "step", "final": False}}) is None
+    assert decode_event({"type": "output", "data": {"text": "", "final": True}}) is None
+    assert decode_event({"type": "output_final", "data": {"text": "blob"}}) is None
+
+
+def test_decode_skips_history():
+    """Test history replay events decode to None."""
+    raw = {"type": "error", "data": {"message": "old", "is_history": True}}
+    assert decode_event(raw) is None
+
+
+def test_decode_unknown_type():
+    """Test types without a decoder decode to None."""
+    assert decode_event({"type": "mystery", "data": {}}) is None
+    assert decode_event({"data": {}}) is None
+
+
+def test_decode_permission_request():
+    """Test a permission request decodes to an approval."""
+    event = decode_event(
+        {
+            "type": "permission_request",
+            "data": {"request_id": "req_1", "tool_name": "Bash", "tool_input": {"cmd": "ls"}},
+        }
+    )
+    assert isinstance(event, ApprovalEvent)
+    assert event.request.kind == "permission"
+    assert event.request.request_id == "req_1"
+    assert event.request.options == ["Allow", "Deny"]
+
+
+def test_decode_ask_user_question():
+    """Test AskUserQuestion decodes to a choice approval."""
+    event = decode_event(
+        {
+            "type": "permission_request",
+            "data": {
+                "request_id": "req_2",
+                "tool_name": "AskUserQuestion",
+                "tool_input": {
+                    "questions": [
+                        {
+                            "header": "Pick",
+                            "question": "Which?",
+                            "options": [{"label": "A"}, {"label": "B", "description": "bee"}],
+                        }
+                    ]
+                },
+            },
+        }
+    )
+    assert event.request.kind == "choice"
+    assert event.request.title == "Pick"
+    assert event.request.options == ["A", "B"]
+    assert event.request.description == "Which?\n1. A\n2. B - bee"
+
+
+def test_decode_state_and_error():
+    """Test state and error events decode with defaults."""
+    assert decode_event({"type": "session_state", "data": {"state": "RUNNING"}}) == StateEvent(
+        "RUNNING"
+    )
+    assert decode_event({"type": "error", "data": {}}) == ErrorEvent("Unknown error")
+
+
+def test_records_are_slotted():
+    """Test decoded records carry no per-instance dict."""
+    assert not hasattr(OutputEvent("Hello"), "__dict__")
+    assert not hasattr(StateEvent("RUNNING"), "__dict__")
+
+
+def test_register_decoder():
+    """Test custom event types can be decoded."""
+
+    @dataclass(slots=True)
+    class PingEvent(Event):
+        type: ClassVar[str] = "ping"
+        payload: str
+
+    register_decoder("ping", lambda data: PingEvent(data.get("payload", "")))
+    try:
+        assert decode_event({"type": "ping", "data": {"payload": "pong"}}) == PingEvent("pong")
+    finally:
+        del _DECODERS["ping"]
+
+
+def test_decode_copies_seq():
+    """Test a top-level seq is carried on the record."""
+    event = decode_event({"type": "error", "seq": 12, "data": {"message": "boom"}})
+    assert event == ErrorEvent("boom", seq=12)
+
+
+def test_decode_since_skips_delivered_and_keeps_newer_history():
+    """Test a resume cursor drops old events and admits newer history."""
+    old = {"type": "output", "seq": 3, "data": {"text": "old", "final": True}}
+    replayed = {
+        "type": "output",
+        "seq": 4,
+        "data": {"text": "new", "final": True, "is_history": True},
+    }
+    unsequenced = {"type": "output", "data": {"text": "x", "final": True, "is_history": True}}
+
+    assert decode_event(old, since=3) is None
+    assert decode_event(replayed, since=3) == OutputEvent("new", seq=4)
+    assert decode_event(unsequenced, since=3) is None
+    assert decode_event(replayed) is None
+
+
+def test_delivery_key_prefers_seq_and_is_stable_without_one():
+    """Test the idempotency key uses seq, else the record's own delivery id."""
+    sequenced = OutputEvent("x", seq=7)
+    unsequenced = OutputEvent("x")
+
+    assert delivery_key("sess_1", sequenced) == "sess_1:7"
+    assert delivery_key("sess_1", unsequenced) == delivery_key("sess_1", unsequenced)
+    assert delivery_key("sess_1", unsequenced) != delivery_key("sess_1", OutputEvent("x"))
+    assert output_metadata("sess_1", sequenced) == {"idempotency_key": "sess_1:7", "seq": 7}
+    assert output_metadata("sess_1", unsequenced, "k") == {"idempotency_key": "k"}
@@ -0,0 +1,78 @@
+"""Tests for BridgeHealth stats and circuit breaker."""
+
+import time
+
+from agent_tether.health import BridgeHealth
+
+
+def test_error_rate_and_percentiles():
+    """Test the rolling window reports error rate and latency percentiles."""
+    health = BridgeHealth("telegram", window=10)
+    for i in range(1, 21):
+        health.record(i % 5 != 0, i / 100)
+
+    snapshot = health.snapshot()
+
+    assert snapshot.calls == 10
+    assert snapshot.error_rate == 0.2
+    assert snapshot.p50 == 0.15
+    assert snapshot.p95 == 0.2
+    assert snapshot.p99 == 0.2
+
+
+def test_empty_window():
+    """Test a bridge without deliveries reports zeros."""
+    snapshot = BridgeHealth("telegram").snapshot()
+
+    assert snapshot.state == "closed"
+    assert snapshot.error_rate == 0.0
+    assert snapshot.p99 == 0.0
+
+
+def test_breaker_disabled_by_default():
+    """Test failures never open the breaker without a threshold."""
+    health = BridgeHealth("telegram", min_calls=1)
+    for _ in range(20):
+        health.record(False, 0.1)
+
+    assert health.state == "closed"
+    assert health.allow()
+
+
+def test_breaker_needs_min_calls():
+    """Test the breaker waits for enough calls before opening."""
+    health = BridgeHealth("telegram", failure_threshold=0.5, min_calls=4)
+    for _ in range(3):
+        health.record(False, 0.1)
+    assert health.state == "closed"
+
+    health.record(False, 0.1)
+    assert health.state == "open"
+    assert not health.allow()
+
+
+def test_half_open_probe_closes_on_success():
+    """Test an open breaker lets one probe through after the reset timeout."""
+    health = BridgeHealth("telegram", failure_threshold=0.5, min_calls=1, reset_timeout=10)
+    health.record(False, 0.1)
+    assert 9 < health.retry_in() <= 10
+
+    later = time.monotonic() + 11
+    assert health.allow(later)
+    assert health.state == "half_open"
+    assert not health.allow(later)
+
+    health.record(True, 0.1)
+    assert health.state == "closed"
+    assert health.error_rate == 0.0
+
+
+def test_half_open_probe_reopens_on_failure():
+    """Test a failed probe opens the breaker again."""
+    health = BridgeHealth("telegram", failure_threshold=0.5, min_calls=1, reset_timeout=0)
+    health.record(False, 0.1)
+    assert health.allow()
+
+    health.record(False, 0.1)
+
+    assert health.state == "open"
@@ -1,5 +1,9 @@
 """Tests for BridgeManager."""
 
+import asyncio
+import json
+import time
+
 import pytest
 
 from agent_tether.base import ApprovalRequest, BridgeInterface, BridgeConfig
@@ -220,6 +224,20 @@ async def test_create_thread():
     assert bridge.threads[0] == ("sess_1", "My Session", "telegram_thread_0")
 
 
+@pytest.mark.asyncio
+async def test_create_thread_binds_session(tmp_path):
+    """Test a thread created through the manager binds and persists the session."""
+    manager = BridgeManager(BridgeConfig(data_dir=str(tmp_path)))
+    manager.register_bridge("telegram", MockBridge("telegram"))
+
+    await manager.create_thread("sess_1", "My Session", "telegram")
+
+    assert manager.get_platforms("sess_1") == ["telegram"]
+    assert BridgeManager(BridgeConfig(data_dir=str(tmp_path))).get_platforms("sess_1") == [
+        "telegram"
+    ]
+
+
 @pytest.mark.asyncio
 async def test_create_thread_unknown_platform():
     """Test creating thread on unknown platform raises ValueError."""
@@ -227,3 +245,580 @@ async def test_create_thread_unknown_platform():
 
     with pytest.raises(ValueError, match="No bridge registered for platform: unknown"):
         await manager.create_thread("sess_1", "My Session", "unknown")
+
+
+# ========== Multi-platform fan-out ==========
+
+
+class SlowBridge(MockBridge):
+    """Mock bridge whose sends take a while."""
+
+    def __init__(self, name: str, delay: float):
+        super().__init__(name)
+        self.delay = delay
+
+    async def on_output(self, session_id: str, text: str, metadata=None):
+        await asyncio.sleep(self.delay)
+        await super().on_output(session_id, text, metadata)
+
+
+class DispatchingSlowBridge(SlowBridge):
+    """Slow bridge that makes its platform call through the dispatcher."""
+
+    async def on_output(self, session_id: str, text: str, metadata=None):
+        await self._dispatch(lambda: asyncio.sleep(self.delay), session_id=session_id)
+        await MockBridge.on_output(self, session_id, text, metadata)
+
+
+class FailingBridge(MockBridge):
+    """Mock bridge whose sends always fail."""
+
+    async def on_output(self, session_id: str, text: str, metadata=None):
+        raise ConnectionError("platform unavailable")
+
+
+def test_bind_and_unbind_session():
+    """Test binding a session to platforms and removing them."""
+    manager = BridgeManager()
+
+    manager.bind_session("sess_1", ["telegram", "slack", "telegram"])
+    assert manager.get_platforms("sess_1") == ["telegram", "slack"]
+
+    manager.unbind_session("sess_1", "telegram")
+    assert manager.get_platforms("sess_1") == ["slack"]
+
+    manager.unbind_session("sess_1")
+    assert manager.get_platforms("sess_1") == []
+
+
+@pytest.mark.asyncio
+async def test_route_output_fans_out_to_bound_platforms():
+    """Test output without a platform reaches every bound bridge."""
+    manager = BridgeManager()
+    telegram = MockBridge("telegram")
+    slack = MockBridge("slack")
+    manager.register_bridge("telegram", telegram)
+    manager.register_bridge("slack", slack)
+    manager.bind_session("sess_1", ["telegram", "slack"])
+
+    results = await manager.route_output("sess_1", "Hello")
+
+    assert [(r.platform, r.ok) for r in results] == [("telegram", True), ("slack", True)]
+    assert telegram.outputs == [("sess_1", "Hello", None)]
+    assert slack.outputs == [("sess_1", "Hello", None)]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_is_concurrent():
+    """Test a slow bridge does not delay delivery to the others."""
+    manager = BridgeManager()
+    manager.register_bridge("telegram", SlowBridge("telegram", 0.05))
+    manager.register_bridge("slack", SlowBridge("slack", 0.05))
+    manager.register_bridge("discord", SlowBridge("discord", 0.05))
+    manager.bind_session("sess_1", ["telegram", "slack", "discord"])
+
+    start = time.perf_counter()
+    results = await manager.route_output("sess_1", "Hello")
+    elapsed = time.perf_counter() - start
+
+    assert all(r.ok for r in results)
+    assert all(r.latency >= 0.05 for r in results)
+    assert elapsed < 0.12
+
+
+@pytest.mark.asyncio
+async def test_fan_out_isolates_failures():
+    """Test a failing or missing bridge is reported without affecting the others."""
+    manager = BridgeManager()
+    telegram = MockBridge("telegram")
+    manager.register_bridge("telegram", telegram)
+    manager.register_bridge("slack", FailingBridge("slack"))
+    manager.bind_session("sess_1", ["slack", "telegram", "discord"])
+
+    results = await manager.route_output("sess_1", "Hello")
+
+    by_platform = {r.platform: r for r in results}
+    assert by_platform["telegram"].ok
+    assert not by_platform["slack"].ok
+    assert "ConnectionError" in by_platform["slack"].error
+    assert by_platform["discord"].error == "No bridge registered"
+    assert telegram.outputs == [("sess_1", "Hello", None)]
+
+
+@pytest.mark.asyncio
+async def test_route_approval_and_status_fan_out():
+    """Test approvals and status changes follow the session binding."""
+    manager = BridgeManager()
+    telegram = MockBridge("telegram")
+    slack = MockBridge("slack")
+    manager.register_bridge("telegram", telegram)
+    manager.register_bridge("slack", slack)
+    manager.bind_session("sess_1", ["telegram", "slack"])
+    request = ApprovalRequest(request_id="req_1", title="Bash", description="ls", options=[])
+
+    await manager.route_approval("sess_1", request)
+    await manager.route_status("sess_1", "running")
+
+    assert telegram.approvals == slack.approvals == [("sess_1", request)]
+    assert telegram.statuses == slack.statuses == [("sess_1", "running", None)]
+
+
+@pytest.mark.asyncio
+async def test_explicit_platform_ignores_binding():
+    """Test passing a platform targets only that bridge."""
+    manager = BridgeManager()
+    telegram = MockBridge("telegram")
+    slack = MockBridge("slack")
+    manager.register_bridge("telegram", telegram)
+    manager.register_bridge("slack", slack)
+    manager.bind_session("sess_1", ["telegram", "slack"])
+
+    results = await manager.route_output("sess_1", "Hello", "slack")
+
+    assert [r.platform for r in results] == ["slack"]
+    assert telegram.outputs == []
+
+
+@pytest.mark.asyncio
+async def test_route_unbound_session():
+    """Test routing for an unbound session without a platform delivers nothing."""
+    manager = BridgeManager()
+    manager.register_bridge("telegram", MockBridge("telegram"))
+
+    assert await manager.route_output("sess_1", "Hello") == []
+
+
+# ========== Routing index ==========
+
+
+def test_get_platform():
+    """Test get_platform returns the first bound platform."""
+    manager = BridgeManager()
+    assert manager.get_platform("sess_1") is None
+
+    manager.bind_session("sess_1", ["slack", "telegram"])
+    assert manager.get_platform("sess_1") == "slack"
+
+
+@pytest.mark.asyncio
+async def test_on_session_bound_adds_platform():
+    """Test on_session_bound extends the session's binding."""
+    manager = BridgeManager()
+
+    await manager.on_session_bound("sess_1", "telegram", "42")
+    await manager.on_session_bound("sess_1", "slack", "C1")
+    await manager.on_session_bound("sess_1", "telegram", "43")
+
+    assert manager.get_platforms("sess_1") == ["telegram", "slack"]
+
+
+@pytest.mark.asyncio
+async def test_bridge_bind_callback_updates_routes():
+    """Test a registered bridge's OnSessionBound feeds the index and the host."""
+    host_calls = []
+
+    async def host_callback(session_id, platform, thread_id):
+        host_calls.append((session_id, platform, thread_id))
+
+    manager = BridgeManager()
+    bridge = MockBridge("telegram")
+    bridge._on_session_bound = host_callback
+    manager.register_bridge("telegram", bridge)
+
+    assert bridge._on_session_bound is host_callback
+    await bridge._session_bound("sess_1", "telegram", "42")
+    await manager.route_output("sess_1", "Hello")
+
+    assert manager.get_platforms("sess_1") == ["telegram"]
+    assert host_calls == [("sess_1", "telegram", "42")]
+    assert bridge.outputs == [("sess_1", "Hello", None)]
+
+
+@pytest.mark.asyncio
+async def test_routes_persist_across_restarts(tmp_path):
+    """Test bindings are saved to data_dir and loaded by a new manager."""
+    config = BridgeConfig(data_dir=str(tmp_path))
+    manager = BridgeManager(config)
+    manager.bind_session("sess_1", ["telegram", "slack"])
+    await manager.on_session_bound("sess_2", "discord", None)
+    manager.bind_session("sess_3", ["slack"])
+    manager.unbind_session("sess_3")
+
+    assert json.loads((tmp_path / "routes.json").read_text()) == {
+        "sess_1": ["telegram", "slack"],
+        "sess_2": ["discord"],
+    }
+
+    reloaded = BridgeManager(config)
+    assert reloaded.get_platforms("sess_1") == ["telegram", "slack"]
+    assert reloaded.get_platform("sess_2") == "discord"
+    assert reloaded.get_platforms("sess_3") == []
+
+
+def test_routes_not_persisted_without_data_dir(tmp_path, monkeypatch):
+    """Test a manager without data_dir keeps routes in memory only."""
+    monkeypatch.chdir(tmp_path)
+    manager = BridgeManager()
+    manager.bind_session("sess_1", ["telegram"])
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_corrupt_routes_file_is_ignored(tmp_path):
+    """Test an unreadable routes file starts with an empty index."""
+    (tmp_path / "routes.json").write_text("{not json")
+
+    manager = BridgeManager(BridgeConfig(data_dir=str(tmp_path)))
+
+    assert manager.get_platforms("sess_1") == []
+
+
+# ========== Health and circuit breaking ==========
+
+
+class ToggleBridge(MockBridge):
+    """Mock bridge that fails while ``down`` is set."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.down = False
+        self.calls = 0
+
+    async def on_output(self, session_id: str, text: str, metadata=None):
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("platform unavailable")
+        await super().on_output(session_id, text, metadata)
+
+
+def _make_breaker_manager(**kwargs):
+    """Create a manager with a ToggleBridge behind a sensitive breaker."""
+    manager = BridgeManager(
+        failure_threshold=0.5,
+        breaker_min_calls=kwargs.pop("breaker_min_calls", 2),
+        breaker_reset_timeout=kwargs.pop("breaker_reset_timeout", 0.05),
+        **kwargs,
+    )
+    bridge = ToggleBridge("telegram")
+    manager.register_bridge("telegram", bridge)
+    return manager, bridge
+
+
+@pytest.mark.asyncio
+async def test_get_health_tracks_deliveries():
+    """Test deliveries are recorded in the bridge's health."""
+    manager = BridgeManager()
+    manager.register_bridge("telegram", MockBridge("telegram"))
+    manager.register_bridge("slack", FailingBridge("slack"))
+
+    await manager.route_output("sess_1", "Hello", "telegram")
+    await manager.route_output("sess_1", "Hello", "slack")
+
+    assert manager.get_health("telegram").calls == 1
+    assert manager.get_health("telegram").error_rate == 0.0
+    assert manager.get_health("slack").error_rate == 1.0
+    assert manager.get_health("slack").state == "closed"
+    assert manager.get_health("discord") is None
+
+
+@pytest.mark.asyncio
+async def test_send_timeout_counts_as_failure():
+    """Test a bridge call exceeding send_timeout is cancelled and failed."""
+    manager = BridgeManager(send_timeout=0.02)
+    manager.register_bridge("telegram", DispatchingSlowBridge("telegram", 1.0))
+
+    start = time.perf_counter()
+    [result] = await manager.route_output("sess_1", "Hello", "telegram")
+
+    assert time.perf_counter() - start < 0.5
+    assert not result.ok
+    assert "TimeoutError" in result.error
+    assert manager.get_health("telegram").error_rate == 1.0
+
+
+class PacedBridge(MockBridge):
+    """Mock bridge whose sends wait on a rate limiter before a quick call."""
+
+    def __init__(self, name: str, wait: float):
+        super().__init__(name)
+        self.wait = wait
+
+    async def run(self, key, call, *, flow=None, weight=1.0):
+        await asyncio.sleep(self.wait)
+        return await call()
+
+    async def on_output(self, session_id: str, text: str, metadata=None):
+        await self._dispatch(lambda: asyncio.sleep(0), session_id=session_id, policy=self)
+        await super().on_output(session_id, text, metadata)
+
+
+@pytest.mark.asyncio
+async def test_send_timeout_excludes_pacing():
+    """Test waiting on a bridge's rate limits doesn't count toward send_timeout."""
+    manager = BridgeManager(send_timeout=0.02)
+    manager.register_bridge("telegram", PacedBridge("telegram", 0.1))
+
+    [result] = await manager.route_output("sess_1", "Hello", "telegram")
+
+    assert result.ok
+    assert manager.get_health("telegram").error_rate == 0.0
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_buffers_without_calling_bridge():
+    """Test an open circuit returns immediately and holds the event."""
+    manager, bridge = _make_breaker_manager(breaker_reset_timeout=10)
+    bridge.down = True
+    await manager.route_output("sess_1", "one", "telegram")
+    await manager.route_output("sess_1", "two", "telegram")
+    assert manager.get_health("telegram").state == "open"
+
+    [result] = await manager.route_output("sess_1", "three", "telegram")
+
+    assert result.buffered
+    assert not result.ok
+    assert bridge.calls == 2
+    assert manager.get_health("telegram").buffered == 1
+
+
+@pytest.mark.asyncio
+async def test_is_holding_follows_breaker_and_backlog():
+    """Test is_holding is set while the breaker is open or a backlog drains."""
+    manager, bridge = _make_breaker_manager()
+    assert not manager.is_holding("telegram")
+    assert not manager.is_holding("discord")
+
+    bridge.down = True
+    await manager.route_output("sess_1", "lost_1", "telegram")
+    await manager.route_output("sess_1", "lost_2", "telegram")
+    assert manager.is_holding("telegram")
+
+    await manager.route_output("sess_1", "one", "telegram")
+    bridge.down = False
+    await asyncio.sleep(0.1)
+
+    assert not manager.is_holding("telegram")
+
+
+@pytest.mark.asyncio
+async def test_backlog_drains_in_order_after_recovery():
+    """Test held events are delivered in order once a probe succeeds."""
+    manager, bridge = _make_breaker_manager()
+    bridge.down = True
+    await manager.route_output("sess_1", "lost_1", "telegram")
+    await manager.route_output("sess_1", "lost_2", "telegram")
+    await manager.route_output("sess_1", "one", "telegram")
+    await manager.route_output("sess_1", "two", "telegram")
+
+    bridge.down = False
+    await asyncio.sleep(0.1)
+
+    assert [text for _, text, _ in bridge.outputs] == ["one", "two"]
+    health = manager.get_health("telegram")
+    assert health.state == "closed"
+    assert health.buffered == 0
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_sheds_without_buffer():
+    """Test max_buffered=0 drops events while the circuit is open."""
+    manager, bridge = _make_breaker_manager(max_buffered=0, breaker_reset_timeout=10)
+    bridge.down = True
+    await manager.route_output("sess_1", "one", "telegram")
+    await manager.route_output("sess_1", "two", "telegram")
+
+    [result] = await manager.route_output("sess_1", "three", "telegram")
+
+    assert not result.ok and not result.buffered
+    assert manager.get_health("telegram").shed == 1
+
+
+@pytest.mark.asyncio
+async def test_full_backlog_sheds_oldest():
+    """Test the backlog keeps the newest events when full."""
+    manager, bridge = _make_breaker_manager(max_buffered=2, breaker_reset_timeout=10)
+    bridge.down = True
+    await manager.route_output("sess_1", "lost_1", "telegram")
+    await manager.route_output("sess_1", "lost_2", "telegram")
+    for text in ("one", "two", "three"):
+        await manager.route_output("sess_1", text, "telegram")
+
+    health = manager.get_health("telegram")
+    assert health.buffered == 2
+    assert health.shed == 1
+
+
+# ========== Lifecycle ==========
+
+
+class LifecycleBridge(MockBridge):
+    """Mock bridge with configurable start and stop behaviour."""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False):
+        super().__init__(name)
+        self.delay = delay
+        self.fail = fail
+        self.started = False
+        self.stopped = False
+
+    async def start(self):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("bad token")
+        self.started = True
+
+    async def stop(self):
+        await asyncio.sleep(self.delay)
+        self.stopped = True
+
+
+@pytest.mark.asyncio
+async def test_start_all_is_concurrent():
+    """Test bridges start in parallel and report their readiness time."""
+    manager = BridgeManager()
+    bridges = [LifecycleBridge(name, delay=0.05) for name in ("telegram", "slack", "discord")]
+    for bridge in bridges:
+        manager.register_bridge(bridge.name, bridge)
+
+    start = time.perf_counter()
+    results = await manager.start_all()
+
+    assert time.perf_counter() - start < 0.12
+    assert all(bridge.started for bridge in bridges)
+    assert [r.platform for r in results] == ["telegram", "slack", "discord"]
+    assert all(r.ok and r.latency >= 0.05 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_start_all_isolates_failures_and_timeouts():
+    """Test a failing or hanging bridge does not block the others."""
+    manager = BridgeManager()
+    telegram = LifecycleBridge("telegram", delay=10)
+    slack = LifecycleBridge("slack", fail=True)
+    discord = LifecycleBridge("discord")
+    for bridge in (telegram, slack, discord):
+        manager.register_bridge(bridge.name, bridge)
+
+    results = {r.platform: r for r in await manager.start_all(timeout=0.05)}
+
+    assert "TimeoutError" in results["telegram"].error
+    assert "bad token" in results["slack"].error
+    assert results["discord"].ok
+    assert discord.started
+
+
+@pytest.mark.asyncio
+async def test_failed_start_is_stopped():
+    """Test a bridge that fails or times out while starting is stopped again."""
+    manager = BridgeManager()
+    slack = LifecycleBridge("slack", fail=True)
+    discord = LifecycleBridge("discord")
+    for bridge in (slack, discord):
+        manager.register_bridge(bridge.name, bridge)
+
+    await manager.start_all(timeout=0.05)
+
+    assert slack.stopped
+    assert not discord.stopped
+
+
+def _fake_discord_client(login_delay: float = 0.0, error: Exception | None = None):
+    """Stand-in for ``discord.Client`` that connects after a delay or fails to log in."""
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            self.user = "bot"
+            self.closed = False
+            self.handlers = {}
+            clients.append(self)
+
+        def event(self, fn):
+            self.handlers[fn.__name__] = fn
+            return fn
+
+        async def start(self, token):
+            await asyncio.sleep(login_delay)
+            if error is not None:
+                raise error
+            await self.handlers["on_ready"]()
+            while not self.closed:
+                await asyncio.sleep(0.01)
+
+        async def close(self):
+            self.closed = True
+
+    clients: list[FakeClient] = []
+    return FakeClient, clients
+
+
+@pytest.mark.asyncio
+async def test_discord_start_waits_until_ready(tmp_path, monkeypatch):
+    """Test DiscordBridge.start returns once the client is connected, not before."""
+    discord = pytest.importorskip("discord")
+    from agent_tether.discord.bot import DiscordBridge
+
+    client_cls, clients = _fake_discord_client(login_delay=0.05)
+    monkeypatch.setattr(discord, "Client", client_cls)
+    manager = BridgeManager()
+    manager.register_bridge(
+        "discord",
+        DiscordBridge(
+            bot_token="token", channel_id=1, config=BridgeConfig(data_dir=str(tmp_path))
+        ),
+    )
+
+    [result] = await manager.start_all()
+
+    assert result.ok and result.latency >= 0.05
+    await manager.stop_all()
+    assert clients[0].closed
+
+
+@pytest.mark.asyncio
+async def test_discord_login_failure_is_reported(tmp_path, monkeypatch):
+    """Test a Discord login failure fails start and closes the client."""
+    discord = pytest.importorskip("discord")
+    from agent_tether.discord.bot import DiscordBridge
+
+    client_cls, clients = _fake_discord_client(error=discord.LoginFailure("Improper token"))
+    monkeypatch.setattr(discord, "Client", client_cls)
+    manager = BridgeManager()
+    manager.register_bridge(
+        "discord",
+        DiscordBridge(
+            bot_token="token", channel_id=1, config=BridgeConfig(data_dir=str(tmp_path))
+        ),
+    )
+
+    [result] = await manager.start_all()
+
+    assert not result.ok
+    assert "LoginFailure" in result.error
+    assert clients[0].closed
+
+
+@pytest.mark.asyncio
+async def test_stop_all():
+    """Test stop_all stops every bridge and drops held deliveries."""
+    manager, bridge = _make_breaker_manager(breaker_reset_timeout=10)
+    bridge.down = True
+    for text in ("lost_1", "lost_2", "held"):
+        await manager.route_output("sess_1", text, "telegram")
+    slack = LifecycleBridge("slack")
+    manager.register_bridge("slack", slack)
+
+    results = await manager.stop_all()
+
+    assert all(r.ok for r in results)
+    assert slack.stopped
+    assert manager.get_health("telegram").buffered == 0
+
+
+@pytest.mark.asyncio
+async def test_default_lifecycle_hooks_are_noops():
+    """Test bridges without start/stop overrides start and stop cleanly."""
+    manager = BridgeManager()
+    manager.register_bridge("telegram", MockBridge("telegram"))
+
+    assert [r.ok for r in await manager.start_all()] == [True]
+    assert [r.ok for r in await manager.stop_all()] == [True]
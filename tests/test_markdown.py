@@ -0,0 +1,142 @@
+"""Tests for the shared Markdown tokenizer."""
+
+from agent_tether import markdown as md
+
+# ========== tokenize ==========
+
+
+def test_tokenize_plain_text():
+    """Test text without markup is one token."""
+    assert md.tokenize("just text") == [(md.TEXT, "just text")]
+    assert md.tokenize("") == []
+
+
+def test_tokenize_emphasis_and_links():
+    """Test paired markers wrap the tokens between them."""
+    assert md.tokenize("a **b** [c](http://x)") == [
+        (md.TEXT, "a "),
+        (md.STRONG, None),
+        (md.TEXT, "b"),
+        (md.STRONG_END, None),
+        (md.TEXT, " "),
+        (md.LINK, "http://x"),
+        (md.TEXT, "c"),
+        (md.LINK_END, None),
+    ]
+
+
+def test_tokenize_nested_markers():
+    """Test markup inside emphasis and links is tokenized too."""
+    assert md.tokenize("**a *b* `c`**") == [
+        (md.STRONG, None),
+        (md.TEXT, "a "),
+        (md.EM, None),
+        (md.TEXT, "b"),
+        (md.EM_END, None),
+        (md.TEXT, " "),
+        (md.CODE, "c"),
+        (md.STRONG_END, None),
+    ]
+
+
+def test_tokenize_intraword_underscores_are_text():
+    """Test underscores inside words don't open emphasis."""
+    assert md.tokenize("snake_case_name") == [(md.TEXT, "snake_case_name")]
+
+
+def test_tokenize_bold_stays_on_one_line():
+    """Test ** doesn't pair across a newline."""
+    assert md.tokenize("**a\nb**") == [(md.TEXT, "**"), (md.TEXT, "a\nb"), (md.TEXT, "**")]
+
+
+def test_tokenize_code_block():
+    """Test fences produce one token with the code, trailing space removed."""
+    assert md.tokenize("x\n```py\n*a*\n\n```") == [(md.TEXT, "x\n"), (md.CODE_BLOCK, "*a*")]
+
+
+def test_tokenize_heading_ends_at_newline():
+    """Test a heading covers the rest of its line only."""
+    assert md.tokenize("## Title *x*\nbody") == [
+        (md.HEADING, 2),
+        (md.TEXT, "Title "),
+        (md.EM, None),
+        (md.TEXT, "x"),
+        (md.EM_END, None),
+        (md.HEADING_END, None),
+        (md.TEXT, "\nbody"),
+    ]
+
+
+def test_tokenize_marker_cannot_cross_heading():
+    """Test a delimiter opened in a heading doesn't pair past its end."""
+    tokens = md.tokenize("# a *b\nc* d")
+    assert (md.EM, None) not in tokens
+    assert tokens[-1] == (md.TEXT, "\nc* d")
+
+
+def test_tokenize_table():
+    """Test pipe tables become rows of cells without the separator."""
+    assert md.tokenize("| a | b |\n|---|:-:|\n| 1 | 2 |\n# h") == [
+        (md.TABLE, [["a", "b"], ["1", "2"]]),
+        (md.TEXT, "# h"),
+    ]
+
+
+# ========== table_rows ==========
+
+
+def test_table_rows_keeps_cell_counts():
+    """Test rows keep their own cell count."""
+    assert md.table_rows("| a | b |\n| c |\n") == [["a", "b"], ["c"]]
+
+
+# ========== parse / render_markdown ==========
+
+
+def test_parse_is_shared_across_dialects(monkeypatch):
+    """Test rendering one output for several platforms parses it once."""
+    from agent_tether.slack.formatting import markdown_to_mrkdwn
+    from agent_tether.telegram.formatting import markdown_to_telegram_html
+
+    calls = []
+    tokenize = md.tokenize
+    monkeypatch.setattr(md, "tokenize", lambda text: calls.append(text) or tokenize(text))
+    text = "## Shared parse\n**once** for *every* bridge"
+
+    assert (
+        markdown_to_telegram_html(text)
+        == "<b>Shared parse</b>\n<b>once</b> for <i>every</i> bridge"
+    )
+    assert markdown_to_mrkdwn(text) == "*Shared parse*\n*once* for _every_ bridge"
+    assert md.parse(text).source == text
+    assert calls == [text]
+
+
+def test_render_markdown_parsed_is_source():
+    """Test a parsed document renders as its own source."""
+    text = "a **b** [c](http://x)"
+    assert md.render_markdown(md.parse(text)) == text
+
+
+def test_render_markdown_built_document():
+    """Test a built document renders as Markdown with fences kept closed."""
+    doc = md.Document(
+        (
+            (md.HEADING, 2),
+            (md.TEXT, "Title"),
+            (md.HEADING_END, None),
+            (md.TEXT, "\n"),
+            (md.LINK, "http://x"),
+            (md.STRONG, None),
+            (md.TEXT, "see"),
+            (md.STRONG_END, None),
+            (md.LINK_END, None),
+            (md.TEXT, ":\n"),
+            (md.CODE_BLOCK, "echo ```"),
+            (md.TEXT, "\n"),
+            (md.TABLE, [["a", "b"], ["1", "2"]]),
+        )
+    )
+    assert md.render_markdown(doc) == (
+        "## Title\n[**see**](http://x):\n```\necho ``\\`\n```\n| a | b |\n|---|---|\n| 1 | 2 |"
+    )
@@ -0,0 +1,299 @@
+"""Tests for OutboundDispatcher."""
+
+import asyncio
+
+import pytest
+
+from agent_tether.base import BridgeConfig, BridgeInterface
+from agent_tether.manager import BridgeManager
+from agent_tether.outbound import APPROVAL_WEIGHT, OutboundDispatcher, is_transient
+from agent_tether.ratelimit import RateLimiter
+
+
+class MinimalBridge(BridgeInterface):
+    """Bridge with no-op required hooks."""
+
+    async def on_output(self, session_id, text, metadata=None):
+        pass
+
+    async def on_approval_request(self, session_id, request):
+        pass
+
+    async def on_status_change(self, session_id, status, metadata=None):
+        pass
+
+    async def create_thread(self, session_id, session_name):
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_global_concurrency_cap():
+    """Test no more than max_in_flight calls run at once."""
+    dispatcher = OutboundDispatcher(max_in_flight=3)
+    running = 0
+    peak = 0
+
+    async def call():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    await asyncio.gather(*(dispatcher.submit(call, session_id=f"s{i}") for i in range(20)))
+
+    assert peak == 3
+    assert dispatcher.stats.peak_in_flight == 3
+    assert dispatcher.stats.submitted == dispatcher.stats.completed == 20
+    assert dispatcher.stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_per_session_fifo():
+    """Test a session's calls complete in submission order."""
+    dispatcher = OutboundDispatcher(max_in_flight=10)
+    sent = []
+
+    def call(session_id, i, delay):
+        async def send():
+            await asyncio.sleep(delay)
+            sent.append((session_id, i))
+
+        return send
+
+    await asyncio.gather(
+        *(
+            dispatcher.submit(call(sid, i, 0.01 * (3 - i)), session_id=sid)
+            for i in range(3)
+            for sid in ("a", "b")
+        )
+    )
+
+    assert [i for sid, i in sent if sid == "a"] == [0, 1, 2]
+    assert [i for sid, i in sent if sid == "b"] == [0, 1, 2]
+    assert dispatcher._lanes == {}
+
+
+@pytest.mark.asyncio
+async def test_sessions_do_not_block_each_other():
+    """Test a slow session doesn't delay another session's calls."""
+    dispatcher = OutboundDispatcher(max_in_flight=10)
+    done = []
+
+    async def slow():
+        await asyncio.sleep(0.1)
+        done.append("slow")
+
+    async def fast():
+        done.append("fast")
+
+    slow_task = asyncio.create_task(dispatcher.submit(slow, session_id="a"))
+    await asyncio.sleep(0)
+    await dispatcher.submit(fast, session_id="b")
+
+    assert done == ["fast"]
+    await slow_task
+
+
+@pytest.mark.asyncio
+async def test_pacing_policy_is_applied():
+    """Test calls go through the submitted pacing policy."""
+    dispatcher = OutboundDispatcher()
+    limiter = RateLimiter(key_rate=1000)
+
+    async def call():
+        return "ok"
+
+    assert await dispatcher.submit(call, key="chat", policy=limiter) == "ok"
+    assert limiter.stats.sent == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_are_counted_and_raised():
+    """Test a failing call propagates and frees its slot."""
+    dispatcher = OutboundDispatcher(max_in_flight=1, max_attempts=1)
+
+    async def fail():
+        raise ConnectionError("down")
+
+    async def ok():
+        return "ok"
+
+    with pytest.raises(ConnectionError):
+        await dispatcher.submit(fail, session_id="a")
+    assert await dispatcher.submit(ok, session_id="a") == "ok"
+    assert dispatcher.stats.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_approval_overtakes_other_sessions_output():
+    """Test an approval weighted by APPROVAL_WEIGHT jumps a flooding session's queue."""
+    dispatcher = OutboundDispatcher()
+    limiter = RateLimiter()
+    gate = asyncio.Event()
+    order = []
+
+    async def block():
+        await gate.wait()
+
+    async def send(label):
+        order.append(label)
+
+    blocker = asyncio.create_task(
+        dispatcher.submit(block, session_id="other", key="chat", policy=limiter)
+    )
+    await asyncio.sleep(0)
+    flood = [
+        asyncio.create_task(limiter.run("chat", lambda i=i: send(f"out{i}"), flow=f"flood{i % 3}"))
+        for i in range(9)
+    ]
+    await asyncio.sleep(0)
+    approval = asyncio.create_task(
+        dispatcher.submit(
+            lambda: send("approval"),
+            session_id="quiet",
+            key="chat",
+            policy=limiter,
+            weight=APPROVAL_WEIGHT,
+        )
+    )
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(blocker, approval, *flood)
+
+    assert order[0] == "approval"
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried():
+    """Test connection errors are retried and attempts per message are counted."""
+    dispatcher = OutboundDispatcher(backoff_base=0.001)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("reset")
+        return "ok"
+
+    assert await dispatcher.submit(flaky, session_id="a") == "ok"
+    assert dispatcher.stats.retried == 2
+    assert dispatcher.stats.attempts == {3: 1}
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_at_max_attempts():
+    """Test a persistent transient failure raises after max_attempts."""
+    dispatcher = OutboundDispatcher(max_attempts=3, backoff_base=0.001)
+    attempts = []
+
+    async def down():
+        attempts.append(1)
+        raise ConnectionRefusedError()
+
+    with pytest.raises(ConnectionRefusedError):
+        await dispatcher.submit(down, session_id="a")
+    assert len(attempts) == 3
+    assert dispatcher.stats.attempts == {3: 1}
+
+
+@pytest.mark.asyncio
+async def test_timeouts_are_not_retried():
+    """Test a timed-out send is raised at once, since it may already have been posted."""
+    dispatcher = OutboundDispatcher(backoff_base=0.001)
+    attempts = []
+
+    async def slow():
+        attempts.append(1)
+        raise TimeoutError()
+
+    with pytest.raises(TimeoutError):
+        await dispatcher.submit(slow, session_id="a")
+    assert len(attempts) == 1
+    assert dispatcher.stats.retried == 0
+    assert not is_transient(asyncio.TimeoutError())
+
+
+@pytest.mark.asyncio
+async def test_permanent_failures_are_not_retried():
+    """Test errors that aren't transient fail on the first attempt."""
+    dispatcher = OutboundDispatcher(backoff_base=0.001)
+
+    class ServerError(Exception):
+        status = 503
+
+    async def bad_request():
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        await dispatcher.submit(bad_request)
+    assert dispatcher.stats.retried == 0
+    assert is_transient(ServerError())
+    assert not is_transient(ValueError())
+
+
+@pytest.mark.asyncio
+async def test_idempotency_key_prevents_duplicates():
+    """Test a message submitted again under the same key isn't sent twice."""
+    dispatcher = OutboundDispatcher()
+    sent = []
+
+    async def send():
+        sent.append(1)
+        await asyncio.sleep(0.01)
+        return len(sent)
+
+    first, concurrent = await asyncio.gather(
+        dispatcher.submit(send, session_id="a", idempotency_key="sess:1:0"),
+        dispatcher.submit(send, session_id="a", idempotency_key="sess:1:0"),
+    )
+    again = await dispatcher.submit(send, session_id="a", idempotency_key="sess:1:0")
+    other = await dispatcher.submit(send, session_id="a", idempotency_key="sess:2:0")
+
+    assert first == concurrent == again == 1
+    assert other == 2
+    assert dispatcher.stats.deduplicated == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_idempotency_key_can_be_resent():
+    """Test a key whose delivery failed is tried again on the next submit."""
+    dispatcher = OutboundDispatcher(max_attempts=1)
+    results = [ValueError("rejected"), "ok"]
+
+    async def send():
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    with pytest.raises(ValueError):
+        await dispatcher.submit(send, idempotency_key="k")
+    assert await dispatcher.submit(send, idempotency_key="k") == "ok"
+
+
+def test_session_weight():
+    """Test session weights default to 1.0 and can be set and cleared."""
+    dispatcher = OutboundDispatcher()
+    assert dispatcher.session_weight("a") == 1.0
+
+    dispatcher.set_session_weight("a", 2.0)
+    assert dispatcher.session_weight("a") == 2.0
+    dispatcher.set_session_weight("a", None)
+    assert dispatcher.session_weight("a") == 1.0
+    with pytest.raises(ValueError):
+        dispatcher.set_session_weight("a", 0)
+
+
+def test_manager_shares_dispatcher():
+    """Test registered bridges use the manager's dispatcher."""
+    manager = BridgeManager(max_in_flight=4)
+    first = MinimalBridge(BridgeConfig())
+    second = MinimalBridge(BridgeConfig())
+    assert first._dispatcher is not second._dispatcher
+
+    manager.register_bridge("telegram", first)
+    manager.register_bridge("slack", second)
+
+    assert first._dispatcher is second._dispatcher is manager.dispatcher
+    assert manager.dispatcher.max_in_flight == 4
@@ -0,0 +1,266 @@
+"""Tests for outbound rate limiting."""
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+
+from agent_tether.ratelimit import RateLimiter, TokenBucket, default_retry_after
+
+
+class RateLimited(Exception):
+    """Stand-in for a platform's 429 error."""
+
+    def __init__(self, retry_after):
+        super().__init__("Flood control exceeded")
+        self.retry_after = retry_after
+
+
+# ========== Token bucket ==========
+
+
+def test_bucket_allows_burst_then_paces():
+    """Test a bucket hands out its capacity, then one token per 1/rate."""
+    bucket = TokenBucket(rate=2, capacity=3)
+    now = time.monotonic()
+
+    for _ in range(3):
+        assert bucket.delay(now) == 0
+        bucket.take()
+
+    assert bucket.delay(now) == pytest.approx(0.5)
+    assert bucket.delay(now + 0.5) == pytest.approx(0, abs=1e-6)
+
+
+def test_bucket_pause():
+    """Test a paused bucket hands out nothing until the pause ends."""
+    bucket = TokenBucket(rate=100, capacity=100)
+    now = time.monotonic()
+
+    bucket.pause(2.0, now)
+
+    assert bucket.delay(now + 1) == pytest.approx(1.0)
+    assert bucket.delay(now + 2.1) == 0
+
+
+def test_bucket_idle():
+    """Test a bucket is idle once it has refilled and any pause has ended."""
+    bucket = TokenBucket(rate=10, capacity=2)
+    now = time.monotonic()
+    bucket.take()
+
+    assert not bucket.idle(now)
+    assert bucket.idle(now + 0.1)
+
+    bucket.pause(1.0, now + 0.1)
+
+    assert not bucket.idle(now + 0.5)
+    assert bucket.idle(now + 1.3)
+
+
+def test_default_retry_after():
+    """Test retry hints are read as seconds or timedeltas."""
+    assert default_retry_after(RateLimited(3)) == 3.0
+    assert default_retry_after(RateLimited(timedelta(milliseconds=1500))) == 1.5
+    assert default_retry_after(ValueError("nope")) is None
+
+
+# ========== Rate limiter ==========
+
+
+@pytest.mark.asyncio
+async def test_limiter_paces_per_key():
+    """Test calls beyond a key's burst wait for tokens."""
+    limiter = RateLimiter(key_rate=50, key_burst=2)
+    sent = []
+
+    async def send(i):
+        sent.append((i, time.monotonic()))
+
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.run("chat", lambda i=i: send(i)) for i in range(5)))
+
+    assert [i for i, _ in sent] == [0, 1, 2, 3, 4]
+    # Two immediate, three more at 20ms intervals.
+    assert sent[-1][1] - start >= 0.05
+    assert limiter.stats.sent == 5
+    assert limiter.stats.peak_waiting == 3
+    assert limiter.stats.waiting == 0
+    assert limiter.stats.max_wait >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_limiter_keys_are_independent():
+    """Test one busy key doesn't consume another key's budget."""
+    limiter = RateLimiter(key_rate=1, key_burst=1)
+
+    async def send():
+        return "ok"
+
+    await limiter.run("a", send)
+    start = time.monotonic()
+    assert await limiter.run("b", send) == "ok"
+
+    assert time.monotonic() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_limiter_evicts_idle_buckets():
+    """Test buckets of keys that went quiet are dropped as new keys arrive."""
+    limiter = RateLimiter(key_rate=1000, key_burst=1)
+
+    async def send():
+        pass
+
+    await limiter.run("paused", send)
+    limiter._bucket("paused").pause(60)
+    for i in range(2000):
+        await limiter.run(i, send)
+        if i % 100 == 0:
+            await asyncio.sleep(0.002)
+
+    assert len(limiter._buckets) < 600
+    assert "paused" in limiter._buckets
+    assert limiter._bucket("paused").delay() > 50
+
+
+@pytest.mark.asyncio
+async def test_limiter_global_bucket():
+    """Test the global bucket applies across keys."""
+    limiter = RateLimiter(rate=50, burst=1)
+
+    async def send():
+        pass
+
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.run(key, send) for key in ("a", "b", "c")))
+
+    assert time.monotonic() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_limiter_retries_after_rate_limit():
+    """Test a 429 pauses the key and the call is retried, not failed."""
+    limiter = RateLimiter()
+    attempts = []
+
+    async def send():
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise RateLimited(0.05)
+        return "sent"
+
+    assert await limiter.run("chat", send) == "sent"
+    assert len(attempts) == 2
+    assert attempts[1] - attempts[0] >= 0.05
+    assert limiter.stats.retried == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_gives_up_after_max_retries():
+    """Test persistent rate limiting eventually raises."""
+    limiter = RateLimiter(max_retries=2)
+
+    async def send():
+        raise RateLimited(0)
+
+    with pytest.raises(RateLimited):
+        await limiter.run("chat", send)
+    assert limiter.stats.retried == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_raises_other_errors():
+    """Test errors that aren't rate limits propagate immediately."""
+    limiter = RateLimiter()
+
+    async def send():
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        await limiter.run("chat", send)
+    assert limiter.stats.retried == 0
+    assert limiter.stats.waiting == 0
+
+
+# ========== Fair queueing ==========
+
+
+async def _queue_behind_blocker(limiter, calls):
+    """Queue ``calls`` ((flow, weight, label) tuples) behind a blocked call.
+
+    Returns the order labels were sent in, the blocked call excluded.
+    """
+    gate = asyncio.Event()
+    order = []
+
+    async def block():
+        await gate.wait()
+
+    async def send(label):
+        order.append(label)
+
+    blocker = asyncio.create_task(limiter.run("chat", block, flow="blocker"))
+    await asyncio.sleep(0)
+    tasks = []
+    for flow, weight, label in calls:
+        tasks.append(
+            asyncio.create_task(
+                limiter.run("chat", lambda label=label: send(label), flow=flow, weight=weight)
+            )
+        )
+        await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(blocker, *tasks)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_flooding_flow_does_not_starve_others():
+    """Test a late call from a quiet flow overtakes a flood queued before it."""
+    limiter = RateLimiter()
+    flood = [("a", 1.0, f"a{i}") for i in range(20)]
+
+    order = await _queue_behind_blocker(limiter, flood + [("b", 1.0, "b")])
+
+    assert order.index("b") <= 1
+    assert [label for label in order if label != "b"] == [f"a{i}" for i in range(20)]
+
+
+@pytest.mark.asyncio
+async def test_weights_set_share():
+    """Test a flow with three times the weight gets three times the sends."""
+    limiter = RateLimiter()
+    calls = [("a", 1.0, "a") for _ in range(8)] + [("b", 3.0, "b") for _ in range(8)]
+
+    order = await _queue_behind_blocker(limiter, calls)
+
+    assert order[:8].count("b") == 6
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_frees_its_turn():
+    """Test cancelling a queued call doesn't stall the calls behind it."""
+    limiter = RateLimiter()
+    gate = asyncio.Event()
+
+    async def block():
+        await gate.wait()
+
+    async def send():
+        return "sent"
+
+    blocker = asyncio.create_task(limiter.run("chat", block))
+    await asyncio.sleep(0)
+    doomed = asyncio.create_task(limiter.run("chat", send, flow="a"))
+    survivor = asyncio.create_task(limiter.run("chat", send, flow="b"))
+    await asyncio.sleep(0)
+    doomed.cancel()
+    gate.set()
+
+    assert await asyncio.wait_for(survivor, 1) == "sent"
+    await blocker
+    assert doomed.cancelled()
+    assert not limiter.busy("chat")
+    assert limiter.stats.waiting == 0
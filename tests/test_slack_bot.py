@@ -0,0 +1,174 @@
+"""Tests for the Slack bridge's outbound posts."""
+
+import asyncio
+
+import pytest
+
+from agent_tether.base import BridgeConfig, DeliveryError
+from agent_tether.ratelimit import RateLimiter
+
+
+class FakeSlackResponse(dict):
+    """Minimal stand-in for slack_sdk's SlackResponse."""
+
+    def __init__(self, data, status_code=200, headers=None):
+        super().__init__(data)
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def _make_slack_bridge(tmp_path, client, **kwargs):
+    from agent_tether.slack.bot import SlackBridge
+
+    bridge = SlackBridge(
+        bot_token="token", channel_id="C1", config=BridgeConfig(data_dir=str(tmp_path)), **kwargs
+    )
+    bridge._client = client
+    return bridge
+
+
+# ========== Sending ==========
+
+
+@pytest.mark.asyncio
+async def test_slack_retries_ratelimited_post(tmp_path):
+    """Test a 429 from chat.postMessage waits for Retry-After and retries."""
+    pytest.importorskip("slack_sdk")
+    from slack_sdk.errors import SlackApiError
+
+    class FakeClient:
+        def __init__(self):
+            self.posts = []
+            self.failures = 1
+
+        async def chat_postMessage(self, **kwargs):
+            if self.failures:
+                self.failures -= 1
+                raise SlackApiError(
+                    "ratelimited",
+                    FakeSlackResponse(
+                        {"ok": False, "error": "ratelimited"},
+                        status_code=429,
+                        headers={"Retry-After": "0"},
+                    ),
+                )
+            self.posts.append(kwargs)
+            return FakeSlackResponse({"ok": True})
+
+    bridge = _make_slack_bridge(tmp_path, FakeClient())
+    bridge._thread_ts["sess_1"] = "111.222"
+
+    await bridge.on_output("sess_1", "hello")
+
+    assert [(p["thread_ts"], p["text"]) for p in bridge._client.posts] == [("111.222", "hello")]
+    assert bridge.send_stats.retried == 1
+
+
+@pytest.mark.asyncio
+async def test_slack_posts_keep_thread_order(tmp_path):
+    """Test concurrent posts to a thread arrive in call order despite a 429."""
+    pytest.importorskip("slack_sdk")
+    from slack_sdk.errors import SlackApiError
+
+    class FakeClient:
+        def __init__(self):
+            self.posts = []
+            self.failed = False
+
+        async def chat_postMessage(self, **kwargs):
+            if kwargs["text"] == "one" and not self.failed:
+                self.failed = True
+                raise SlackApiError(
+                    "ratelimited",
+                    FakeSlackResponse({"ok": False, "error": "ratelimited"}, status_code=429),
+                )
+            self.posts.append(kwargs["text"])
+            return FakeSlackResponse({"ok": True})
+
+    # Keep the test fast: no pacing, and retry immediately.
+    limiter = RateLimiter(retry_after=lambda exc: 0.0)
+    bridge = _make_slack_bridge(tmp_path, FakeClient(), rate_limiter=limiter)
+    bridge._thread_ts["sess_1"] = "111.222"
+
+    await asyncio.gather(*(bridge.on_output("sess_1", text) for text in ("one", "two", "three")))
+
+    assert bridge._client.posts == ["one", "two", "three"]
+
+
+@pytest.mark.asyncio
+async def test_slack_long_output_is_split_into_thread_replies(tmp_path):
+    """Test long output is converted to mrkdwn and posted as ordered replies."""
+    pytest.importorskip("slack_sdk")
+
+    class FakeClient:
+        def __init__(self):
+            self.posts = []
+
+        async def chat_postMessage(self, **kwargs):
+            self.posts.append(kwargs)
+            return FakeSlackResponse({"ok": True})
+
+    bridge = _make_slack_bridge(tmp_path, FakeClient(), rate_limiter=RateLimiter())
+    bridge._thread_ts["sess_1"] = "111.222"
+
+    text = "## Result\n\n" + "**done** line\n" * 700
+    await bridge.on_output("sess_1", text, {"seq": 3})
+    await bridge.on_output("sess_1", text, {"seq": 3})
+
+    posts = bridge._client.posts
+    assert len(posts) == 3
+    assert all(p["thread_ts"] == "111.222" and len(p["text"]) <= 4000 for p in posts)
+    assert posts[0]["text"].startswith("*Result*\n\n*done* line\n")
+    assert "".join(p["text"] for p in posts) == "*Result*\n\n" + "*done* line\n" * 700
+
+
+@pytest.mark.asyncio
+async def test_slack_failed_part_is_raised_and_redelivered(tmp_path):
+    """Test a failed part raises DeliveryError and a redelivery sends only what's missing."""
+    pytest.importorskip("slack_sdk")
+    from slack_sdk.errors import SlackApiError
+
+    class FakeClient:
+        def __init__(self):
+            self.posts = []
+            self.failures = 1
+
+        async def chat_postMessage(self, **kwargs):
+            if len(self.posts) == 1 and self.failures:
+                self.failures -= 1
+                raise SlackApiError(
+                    "channel_not_found",
+                    FakeSlackResponse({"ok": False, "error": "channel_not_found"}),
+                )
+            self.posts.append(kwargs["text"])
+            return FakeSlackResponse({"ok": True})
+
+    bridge = _make_slack_bridge(tmp_path, FakeClient(), rate_limiter=RateLimiter())
+    bridge._thread_ts["sess_1"] = "111.222"
+    text = "line\n" * 2000
+
+    with pytest.raises(DeliveryError, match="part 2"):
+        await bridge.on_output("sess_1", text, {"seq": 4})
+    assert len(bridge._client.posts) == 1
+
+    await bridge.on_output("sess_1", text, {"seq": 4})
+
+    assert "".join(bridge._client.posts) == text
+
+
+def test_slack_retry_after_parsing():
+    """Test Retry-After is read from ratelimited Slack errors only."""
+    pytest.importorskip("slack_sdk")
+    from slack_sdk.errors import SlackApiError
+
+    from agent_tether.slack.bot import _slack_retry_after
+
+    limited = SlackApiError(
+        "ratelimited",
+        FakeSlackResponse({"ok": False}, status_code=429, headers={"Retry-After": "7"}),
+    )
+    other = SlackApiError("bad", FakeSlackResponse({"ok": False, "error": "channel_not_found"}))
+
+    assert _slack_retry_after(limited) == 7.0
+    assert _slack_retry_after(other) is None
+    assert _slack_retry_after(ValueError("x")) is None
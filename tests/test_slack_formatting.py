@@ -0,0 +1,72 @@
+"""Tests for Slack formatting utilities."""
+
+from agent_tether.slack.formatting import escape_mrkdwn, markdown_to_mrkdwn, split_message
+
+# ========== markdown_to_mrkdwn ==========
+
+
+def test_mrkdwn_emphasis():
+    """Test bold and italic use Slack's markers."""
+    assert markdown_to_mrkdwn("**bold** and __bold__") == "*bold* and *bold*"
+    assert markdown_to_mrkdwn("*italic* and _italic_") == "_italic_ and _italic_"
+    assert markdown_to_mrkdwn("***both***") == "*_both_*"
+
+
+def test_mrkdwn_headings_are_bold():
+    """Test headings render as bold lines, without nested bold markers."""
+    assert markdown_to_mrkdwn("# Title\n## With **bold**\ntext") == "*Title*\n*With bold*\ntext"
+
+
+def test_mrkdwn_links():
+    """Test links use Slack's <url|label> syntax with a plain label."""
+    assert markdown_to_mrkdwn("See [the *docs*](https://x.y/a?b=1&c=2)") == (
+        "See <https://x.y/a?b=1&amp;c=2|the docs>"
+    )
+
+
+def test_mrkdwn_code():
+    """Test inline code and code blocks keep their contents verbatim."""
+    assert markdown_to_mrkdwn("Run `a **b**`") == "Run `a **b**`"
+    assert markdown_to_mrkdwn("Code:\n```python\nx = 1 < 2\n```\nDone") == (
+        "Code:\n```\nx = 1 &lt; 2\n```\nDone"
+    )
+
+
+def test_mrkdwn_code_block_on_its_own_lines():
+    """Test a code block is separated from surrounding text by newlines."""
+    assert markdown_to_mrkdwn("see ```\nx\n```after") == "see \n```\nx\n```\nafter"
+
+
+def test_mrkdwn_table_is_aligned_code_block():
+    """Test tables render as aligned text inside a code block."""
+    text = "| Name | Age |\n|------|-----|\n| Alice | 30 |\n\nEnd"
+    assert markdown_to_mrkdwn(text) == "```\nName   Age\nAlice  30 \n```\nEnd"
+
+
+def test_mrkdwn_escapes_control_characters():
+    """Test &, < and > are escaped everywhere."""
+    assert markdown_to_mrkdwn("a < b & c > d") == "a &lt; b &amp; c &gt; d"
+    assert escape_mrkdwn("<@U123>") == "&lt;@U123&gt;"
+
+
+# ========== split_message ==========
+
+
+def test_split_message_short():
+    """Test a short message is one part."""
+    assert list(split_message("hello")) == ["hello"]
+
+
+def test_split_message_keeps_links_whole():
+    """Test a cut never falls inside a link."""
+    text = "x " * 10 + "<http://a|link label here>" + " y" * 10
+    parts = list(split_message(text, limit=30))
+    assert parts == ["x " * 10, "<http://a|link label here> y ", "y " * 8 + "y"]
+
+
+def test_split_message_keeps_entities_whole():
+    """Test a hard cut moves back before an entity it would split."""
+    assert list(split_message("a" * 8 + "&amp;" + "b" * 5, limit=10)) == [
+        "a" * 8,
+        "&amp;" + "b" * 5,
+    ]
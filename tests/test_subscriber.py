@@ -1,11 +1,15 @@
 """Tests for BridgeSubscriber event routing."""
 
 import asyncio
+import functools
 import json
+import time
 
 import pytest
 
 from agent_tether.base import ApprovalRequest, BridgeConfig, BridgeInterface
+from agent_tether.cursors import CursorStore
+from agent_tether.events import OutputEvent
 from agent_tether.manager import BridgeManager
 from agent_tether.subscriber import BridgeSubscriber
 
@@ -64,13 +68,20 @@ class FakeStore:
                 pass
 
 
-def _make_subscriber():
-    """Create a BridgeSubscriber with a fake bridge and store."""
-    bridge = FakeBridge()
-    manager = BridgeManager()
-    manager.register_bridge("test", bridge)
+def _make_subscriber(bridge=None, *, manager=None, new_subscriber=None, **kwargs):
+    """Create a BridgeSubscriber with a fake store.
+
+    ``bridge`` (a FakeBridge by default) is registered as "test" unless a
+    ready ``manager`` is given. Other keyword arguments go to BridgeSubscriber.
+    """
+    bridge = bridge or FakeBridge()
+    if manager is None:
+        manager = BridgeManager()
+        manager.register_bridge("test", bridge)
     store = FakeStore()
-    subscriber = BridgeSubscriber(manager, store.new_subscriber, store.remove_subscriber)
+    subscriber = BridgeSubscriber(
+        manager, new_subscriber or store.new_subscriber, store.remove_subscriber, **kwargs
+    )
     return subscriber, bridge, store
 
 
@@ -394,3 +405,1683 @@ async def test_bridge_error_doesnt_crash_consumer():
     assert "sess_1" in bridge.typing_stopped
 
     await subscriber.unsubscribe("sess_1", platform="test")
+
+
+# ========== Worker pool ==========
+
+
+@pytest.mark.asyncio
+async def test_pool_does_not_create_per_session_tasks():
+    """Test pool mode serves sessions without a task per session."""
+    subscriber, bridge, store = _make_subscriber(workers=2)
+
+    for i in range(10):
+        subscriber.subscribe(f"sess_{i}", "test")
+
+    assert subscriber._tasks == {}
+    assert len(subscriber._pool) == 2
+    assert len(subscriber._queues) == 10
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_pool_routes_events():
+    """Test pooled workers route events to the bridge."""
+    subscriber, bridge, store = _make_subscriber(workers=2)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+
+    queue.put_nowait({"type": "output", "data": {"text": "Hello!", "final": True}})
+    await queue.put({"type": "session_state", "data": {"state": "AWAITING_INPUT"}})
+    await asyncio.sleep(0.05)
+
+    assert bridge.outputs == [("sess_1", "Hello!")]
+    assert bridge.typing_stopped == ["sess_1"]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_pool_preserves_per_session_order():
+    """Test events for one session are delivered in order across workers."""
+    subscriber, bridge, store = _make_subscriber(workers=4)
+
+    subscriber.subscribe("sess_1", "test")
+    subscriber.subscribe("sess_2", "test")
+    for i in range(50):
+        for sid in ("sess_1", "sess_2"):
+            subscriber._queues[sid].put_nowait(
+                {"type": "output", "data": {"text": f"{sid}:{i}", "final": True}}
+            )
+    await asyncio.sleep(0.1)
+
+    for sid in ("sess_1", "sess_2"):
+        texts = [t for s, t in bridge.outputs if s == sid]
+        assert texts == [f"{sid}:{i}" for i in range(50)]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_pool_round_robin_between_sessions():
+    """Test a busy session doesn't starve another on a single worker."""
+    subscriber, bridge, store = _make_subscriber(workers=1)
+
+    subscriber.subscribe("busy", "test")
+    subscriber.subscribe("quiet", "test")
+    for i in range(100):
+        subscriber._queues["busy"].put_nowait(
+            {"type": "output", "data": {"text": f"b{i}", "final": True}}
+        )
+    subscriber._queues["quiet"].put_nowait(
+        {"type": "output", "data": {"text": "q", "final": True}}
+    )
+    await asyncio.sleep(0.1)
+
+    position = bridge.outputs.index(("quiet", "q"))
+    assert position < 50
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_pool_unsubscribe_releases_queue():
+    """Test unsubscribe in pool mode unregisters the store queue."""
+    subscriber, bridge, store = _make_subscriber(workers=2)
+
+    subscriber.subscribe("sess_1", "test")
+    assert len(store.queues["sess_1"]) == 1
+
+    await subscriber.unsubscribe("sess_1", platform="test")
+
+    assert store.queues["sess_1"] == []
+    assert "sess_1" not in subscriber._queues
+    assert "sess_1" in bridge.sessions_removed
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_pool_unknown_platform_not_subscribed():
+    """Test pool mode refuses sessions without a registered bridge."""
+    subscriber, bridge, store = _make_subscriber(workers=2)
+
+    subscriber.subscribe("sess_1", "missing")
+
+    assert "sess_1" not in subscriber._queues
+    assert store.queues == {}
+
+    await subscriber.stop()
+
+
+# ========== Output coalescing ==========
+
+
+def _final(text: str) -> dict:
+    return {"type": "output", "data": {"text": text, "final": True}}
+
+
+@pytest.mark.asyncio
+async def test_coalesce_merges_outputs_within_window():
+    """Test outputs inside the window are delivered as one message."""
+    subscriber, bridge, store = _make_subscriber(coalesce_delay=0.05)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    for text in ("one", "two", "three"):
+        queue.put_nowait(_final(text))
+
+    await asyncio.sleep(0.01)
+    assert bridge.outputs == []
+
+    await asyncio.sleep(0.1)
+    assert bridge.outputs == [("sess_1", "one\n\ntwo\n\nthree")]
+
+    await subscriber.unsubscribe("sess_1", platform="test")
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_at_byte_budget():
+    """Test the buffer is flushed before it would exceed the byte budget."""
+    subscriber, bridge, store = _make_subscriber(coalesce_delay=10, coalesce_max_bytes=10)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_final("aaaa"))
+    queue.put_nowait(_final("bbbb"))
+    queue.put_nowait(_final("cccccccccc"))
+    await asyncio.sleep(0.05)
+
+    assert bridge.outputs == [("sess_1", "aaaa\n\nbbbb"), ("sess_1", "cccccccccc")]
+
+    await subscriber.unsubscribe("sess_1", platform="test")
+
+
+@pytest.mark.asyncio
+async def test_coalesce_permission_request_flushes_first():
+    """Test a permission request flushes buffered output immediately."""
+    subscriber, bridge, store = _make_subscriber(coalesce_delay=10)
+
+    calls: list[str] = []
+    original_output = bridge.on_output
+    original_approval = bridge.on_approval_request
+
+    async def record_output(session_id, text, metadata=None):
+        calls.append("output")
+        await original_output(session_id, text, metadata)
+
+    async def record_approval(session_id, request):
+        calls.append("approval")
+        await original_approval(session_id, request)
+
+    bridge.on_output = record_output
+    bridge.on_approval_request = record_approval
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_final("Let me run this."))
+    queue.put_nowait(
+        {
+            "type": "permission_request",
+            "data": {"request_id": "req_1", "tool_name": "Bash", "tool_input": {}},
+        }
+    )
+    await asyncio.sleep(0.05)
+
+    assert calls == ["output", "approval"]
+    assert bridge.outputs == [("sess_1", "Let me run this.")]
+
+    await subscriber.unsubscribe("sess_1", platform="test")
+
+
+@pytest.mark.asyncio
+async def test_coalesce_with_worker_pool():
+    """Test the coalescing timer flushes sessions served by the pool."""
+    subscriber, bridge, store = _make_subscriber(workers=1, coalesce_delay=0.05)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_final("one"))
+    queue.put_nowait(_final("two"))
+    await asyncio.sleep(0.15)
+
+    assert bridge.outputs == [("sess_1", "one\n\ntwo")]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_coalesce_unsubscribe_cancels_timer():
+    """Test unsubscribing drops the buffer and its pending flush."""
+    subscriber, bridge, store = _make_subscriber(coalesce_delay=0.05)
+
+    subscriber.subscribe("sess_1", "test")
+    subscriber._queues["sess_1"].put_nowait(_final("one"))
+    await asyncio.sleep(0.01)
+
+    await subscriber.unsubscribe("sess_1", platform="test")
+    await asyncio.sleep(0.1)
+
+    assert subscriber._pending_output == {}
+    assert bridge.outputs == []
+
+
+# ========== Bounded queues ==========
+
+
+def _state(state: str) -> dict:
+    return {"type": "session_state", "data": {"state": state}}
+
+
+@pytest.mark.asyncio
+async def test_bounded_drops_oldest_output_with_notice():
+    """Test overflowing outputs are replaced by a single skip notice."""
+    subscriber, bridge, store = _make_subscriber(max_queue_size=3)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    for i in range(5):
+        queue.put_nowait(_final(f"msg {i}"))
+    assert subscriber.queue_depth("sess_1") == 4  # 3 events + notice
+    await asyncio.sleep(0.05)
+
+    assert [text for _, text in bridge.outputs] == [
+        "(2 messages skipped)",
+        "msg 2",
+        "msg 3",
+        "msg 4",
+    ]
+    assert subscriber.stats.received == 5
+    assert subscriber.stats.outputs_skipped == 2
+    assert subscriber.stats.peak_depth == 3
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_bounded_never_drops_permission_requests():
+    """Test permission requests are admitted past the limit."""
+    subscriber, bridge, store = _make_subscriber(max_queue_size=2)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    for i in range(4):
+        queue.put_nowait(
+            {
+                "type": "permission_request",
+                "data": {"request_id": f"req_{i}", "tool_name": "Bash", "tool_input": {}},
+            }
+        )
+    await asyncio.sleep(0.05)
+
+    assert [req.request_id for _, req in bridge.approvals] == [f"req_{i}" for i in range(4)]
+    assert subscriber.stats.over_limit == 2
+    assert subscriber.stats.outputs_skipped == 0
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_bounded_permission_request_evicts_output():
+    """Test a permission request arriving at a full buffer displaces old output."""
+    subscriber, bridge, store = _make_subscriber(max_queue_size=2)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_final("one"))
+    queue.put_nowait(_final("two"))
+    queue.put_nowait(
+        {"type": "permission_request", "data": {"request_id": "req_1", "tool_name": "Bash"}}
+    )
+    await asyncio.sleep(0.05)
+
+    assert [text for _, text in bridge.outputs] == ["(1 message skipped)", "two"]
+    assert len(bridge.approvals) == 1
+    assert subscriber.stats.over_limit == 0
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_bounded_collapses_session_state():
+    """Test a full buffer keeps only the latest session state."""
+    subscriber, bridge, store = _make_subscriber(max_queue_size=1)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_state("RUNNING"))
+    queue.put_nowait(_state("RUNNING"))
+    queue.put_nowait(_state("AWAITING_INPUT"))
+    await asyncio.sleep(0.05)
+
+    assert bridge.typing_started == []
+    assert bridge.typing_stopped == ["sess_1"]
+    assert subscriber.stats.states_collapsed == 2
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_bounded_with_worker_pool():
+    """Test the overflow policies also apply to pooled sessions."""
+    subscriber, bridge, store = _make_subscriber(max_queue_size=2, workers=1)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    for i in range(4):
+        queue.put_nowait(_final(f"msg {i}"))
+    await asyncio.sleep(0.05)
+
+    assert [text for _, text in bridge.outputs] == ["(2 messages skipped)", "msg 2", "msg 3"]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_unbounded_by_default():
+    """Test nothing is dropped without max_queue_size."""
+    subscriber, bridge, store = _make_subscriber()
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    for i in range(100):
+        queue.put_nowait(_final(f"msg {i}"))
+    await asyncio.sleep(0.05)
+
+    assert len(bridge.outputs) == 100
+    assert subscriber.stats.outputs_skipped == 0
+
+    await subscriber.stop()
+
+
+# ========== Priority lanes ==========
+
+
+class SlowOutputBridge(FakeBridge):
+    """Fake bridge whose sends take time and are logged in call order."""
+
+    def __init__(self):
+        super().__init__()
+        self.log: list[str] = []
+        self.sending = asyncio.Event()
+
+    async def on_output(self, session_id, text, metadata=None):
+        self.sending.set()
+        await asyncio.sleep(0.01)
+        self.log.append(text)
+        await super().on_output(session_id, text, metadata)
+
+    async def on_approval_request(self, session_id, request):
+        self.log.append(f"approval:{request.request_id}")
+        await super().on_approval_request(session_id, request)
+
+    async def on_status_change(self, session_id, status, metadata=None):
+        self.log.append(f"status:{status}")
+        await super().on_status_change(session_id, status, metadata)
+
+
+def _permission(request_id: str) -> dict:
+    return {
+        "type": "permission_request",
+        "data": {"request_id": request_id, "tool_name": "Bash", "tool_input": {}},
+    }
+
+
+@pytest.mark.asyncio
+async def test_priority_approval_overtakes_queued_output():
+    """Test a permission request is delivered before output queued ahead of it."""
+    subscriber, bridge, store = _make_subscriber(SlowOutputBridge(), prioritize_approvals=True)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    for i in range(3):
+        queue.put_nowait(_final(f"msg {i}"))
+    queue.put_nowait(_permission("req_1"))
+    queue.put_nowait({"type": "error", "data": {"message": "boom"}})
+    await asyncio.sleep(0.1)
+
+    assert bridge.log == ["approval:req_1", "status:error", "msg 0", "msg 1", "msg 2"]
+    assert subscriber.stats.prioritized == 2
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_priority_preserves_output_order_after_running_send():
+    """Test an approval arriving mid-send goes next, then output resumes in order."""
+    subscriber, bridge, store = _make_subscriber(
+        SlowOutputBridge(), prioritize_approvals=True, workers=1
+    )
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    for i in range(3):
+        queue.put_nowait(_final(f"msg {i}"))
+    await bridge.sending.wait()  # msg 0 is being sent
+    queue.put_nowait(_permission("req_1"))
+    await asyncio.sleep(0.1)
+
+    assert bridge.log == ["msg 0", "approval:req_1", "msg 1", "msg 2"]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_priority_off_by_default():
+    """Test events are delivered in arrival order without priority lanes."""
+    bridge = SlowOutputBridge()
+    manager = BridgeManager()
+    manager.register_bridge("test", bridge)
+    store = FakeStore()
+    subscriber = BridgeSubscriber(manager, store.new_subscriber, store.remove_subscriber)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_final("msg 0"))
+    queue.put_nowait(_permission("req_1"))
+    await asyncio.sleep(0.05)
+
+    assert bridge.log == ["msg 0", "approval:req_1"]
+
+    await subscriber.stop()
+
+
+# ========== Event decoding ==========
+
+
+@pytest.mark.asyncio
+async def test_ignored_events_are_not_buffered():
+    """Test events with nothing to deliver are dropped on arrival."""
+    subscriber, bridge, store = _make_subscriber()
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait({"type": "output", "data": {"text": "step", "final": False}})
+    queue.put_nowait(
+        {"type": "output", "data": {"text": "old", "final": True, "is_history": True}}
+    )
+    queue.put_nowait({"type": "mystery", "data": {}})
+
+    assert subscriber.queue_depth("sess_1") == 0
+    assert subscriber.stats.ignored == 3
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_malformed_event_doesnt_break_queue():
+    """Test an event that fails to decode is dropped without raising."""
+    subscriber, bridge, store = _make_subscriber()
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait({"type": "output", "data": None})
+    queue.put_nowait(_final("ok"))
+    await asyncio.sleep(0.05)
+
+    assert bridge.outputs == [("sess_1", "ok")]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_add_handler_overrides_dispatch():
+    """Test a custom handler replaces the built-in one for its record type."""
+    subscriber, bridge, store = _make_subscriber()
+    seen: list[tuple[str, str]] = []
+
+    async def shout(session_id, bridge, event):
+        await bridge.on_output(session_id, event.text.upper())
+        seen.append((session_id, event.text))
+
+    subscriber.add_handler(OutputEvent, shout)
+    subscriber.subscribe("sess_1", "test")
+    subscriber._queues["sess_1"].put_nowait(_final("hi"))
+    await asyncio.sleep(0.05)
+
+    assert bridge.outputs == [("sess_1", "HI")]
+    assert seen == [("sess_1", "hi")]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_publish_defers_decoding_to_the_subscriber():
+    """Test the store's publish only enqueues; the inbox admits events later."""
+    subscriber, bridge, store = _make_subscriber(max_queue_size=10)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = store.queues["sess_1"][0]
+    assert queue is subscriber._queues["sess_1"]
+    assert "put_nowait" not in vars(queue)
+    queue.put_nowait(_final("a"))
+    queue.put_nowait(_final("b"))
+
+    assert subscriber.stats.received == 0
+    assert queue.qsize() == 2
+
+    await asyncio.sleep(0.05)
+
+    assert subscriber.stats.received == 2
+    assert bridge.outputs == [("sess_1", "a"), ("sess_1", "b")]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_queue_size_counts_buffered_events():
+    """Test the store sees events buffered in the inbox as queued."""
+    queues: dict[str, asyncio.Queue] = {}
+
+    def new_subscriber(session_id: str, queue: asyncio.Queue) -> asyncio.Queue:
+        return queues.setdefault(session_id, queue)
+
+    manager = BridgeManager()
+    manager.register_bridge("test", FakeBridge())
+    subscriber = BridgeSubscriber(manager, new_subscriber, lambda sid, q: None)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    for i in range(3):
+        queue.put_nowait(_final(f"m{i}"))
+
+    assert subscriber.queue_depth("sess_1") == 3
+    assert queue.qsize() == 3
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_store_owned_queue_needs_no_task():
+    """Test a queue the store created is read without a task per session."""
+    subscriber, bridge, store = _make_subscriber()
+
+    subscriber.subscribe("sess_1", "test")
+    queue = store.queues["sess_1"][0]
+    await queue.put(_final("hello"))
+    await asyncio.sleep(0.05)
+
+    assert bridge.outputs == [("sess_1", "hello")]
+    assert subscriber._pumps == {}
+    assert len(asyncio.all_tasks()) == 2  # this test and the consumer
+
+    await subscriber.unsubscribe("sess_1")
+    assert "_put" not in vars(queue)
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_store_owned_queues_in_pool_mode_need_only_workers():
+    """Test pool mode runs only its workers for stores that create their queues."""
+    subscriber, bridge, store = _make_subscriber(workers=4)
+
+    for i in range(100):
+        subscriber.subscribe(f"sess_{i}", "test")
+    for queues in store.queues.values():
+        queues[0].put_nowait(_final("hello"))
+    await asyncio.sleep(0.05)
+
+    assert len(bridge.outputs) == 100
+    assert len(asyncio.all_tasks()) == 5  # this test and the workers
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_unhookable_store_queue_is_pumped():
+    """Test a queue that can't be hooked is read by a subscriber task."""
+
+    class DuckQueue:
+        __slots__ = ("_queue",)
+
+        def __init__(self):
+            self._queue = asyncio.Queue()
+
+        def empty(self):
+            return self._queue.empty()
+
+        def get_nowait(self):
+            return self._queue.get_nowait()
+
+        async def get(self):
+            return await self._queue.get()
+
+        def put_nowait(self, item):
+            self._queue.put_nowait(item)
+
+    queues: dict[str, DuckQueue] = {}
+
+    def new_subscriber(session_id: str) -> DuckQueue:
+        return queues.setdefault(session_id, DuckQueue())
+
+    bridge = FakeBridge()
+    manager = BridgeManager()
+    manager.register_bridge("test", bridge)
+    subscriber = BridgeSubscriber(manager, new_subscriber, lambda sid, q: None)
+
+    subscriber.subscribe("sess_1", "test")
+    queues["sess_1"].put_nowait(_final("hello"))
+    await asyncio.sleep(0.05)
+
+    assert bridge.outputs == [("sess_1", "hello")]
+
+    await subscriber.unsubscribe("sess_1")
+    assert subscriber._pumps == {}
+
+    await subscriber.stop()
+
+
+# ========== Batch draining ==========
+
+
+class BatchingBridge(FakeBridge):
+    """Fake bridge that takes bursts through on_events."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches: list[tuple[str, list]] = []
+
+    async def on_events(self, session_id, events):
+        self.batches.append((session_id, list(events)))
+
+
+@pytest.mark.asyncio
+async def test_batch_drains_ready_events_in_one_call():
+    """Test everything ready for a session reaches on_events at once."""
+    bridge = BatchingBridge()
+    subscriber, bridge, store = _make_subscriber(bridge, max_batch=10)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    for i in range(3):
+        queue.put_nowait(_final(f"msg {i}"))
+    queue.put_nowait({"type": "session_state", "data": {"state": "AWAITING_INPUT"}})
+    await asyncio.sleep(0.05)
+
+    assert len(bridge.batches) == 1
+    session_id, events = bridge.batches[0]
+    assert session_id == "sess_1"
+    assert [type(e).__name__ for e in events] == ["OutputEvent"] * 3 + ["StateEvent"]
+    assert [e.text for e in events[:3]] == ["msg 0", "msg 1", "msg 2"]
+    assert bridge.outputs == []
+    assert subscriber.stats.batches == 1
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_respects_max_batch():
+    """Test bursts larger than max_batch are split in order."""
+    bridge = BatchingBridge()
+    subscriber, bridge, store = _make_subscriber(bridge, max_batch=4)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    for i in range(10):
+        queue.put_nowait(_final(f"msg {i}"))
+    await asyncio.sleep(0.05)
+
+    assert [len(events) for _, events in bridge.batches] == [4, 4, 2]
+    texts = [e.text for _, events in bridge.batches for e in events]
+    assert texts == [f"msg {i}" for i in range(10)]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_with_worker_pool():
+    """Test pool workers drain bursts too."""
+    bridge = BatchingBridge()
+    subscriber, bridge, store = _make_subscriber(bridge, max_batch=8, workers=1)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    for i in range(5):
+        queue.put_nowait(_final(f"msg {i}"))
+    await asyncio.sleep(0.05)
+
+    assert [len(events) for _, events in bridge.batches] == [5]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_falls_back_to_per_event_routing():
+    """Test bridges without on_events still get per-event calls."""
+    bridge = FakeBridge()
+    subscriber, bridge, store = _make_subscriber(bridge, max_batch=10)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_final("one"))
+    queue.put_nowait({"type": "error", "data": {"message": "boom"}})
+    await asyncio.sleep(0.05)
+
+    assert bridge.outputs == [("sess_1", "one")]
+    assert bridge.statuses == [("sess_1", "error", {"message": "boom"})]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_bridge_error_doesnt_crash_consumer():
+    """Test a failing on_events call is logged and consumption continues."""
+
+    class FlakyBatchingBridge(BatchingBridge):
+        async def on_events(self, session_id, events):
+            if not self.batches:
+                self.batches.append((session_id, []))
+                raise RuntimeError("boom")
+            await super().on_events(session_id, events)
+
+    bridge = FlakyBatchingBridge()
+    subscriber, bridge, store = _make_subscriber(bridge, max_batch=10)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_final("lost"))
+    await asyncio.sleep(0.02)
+    queue.put_nowait(_final("kept"))
+    await asyncio.sleep(0.02)
+
+    assert [e.text for e in bridge.batches[-1][1]] == ["kept"]
+
+    await subscriber.stop()
+
+
+# ========== Resumable subscriptions ==========
+
+
+def _seq_final(seq: int, text: str, *, history: bool = False) -> dict:
+    data = {"text": text, "final": True}
+    if history:
+        data["is_history"] = True
+    return {"type": "output", "seq": seq, "data": data}
+
+
+@pytest.mark.asyncio
+async def test_cursor_advances_on_delivery(tmp_path):
+    """Test each delivered event moves the session's cursor."""
+    cursors = CursorStore(tmp_path / "cursors.json", flush_delay=0)
+    subscriber, bridge, store = _make_subscriber(cursors=cursors)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_seq_final(1, "one"))
+    queue.put_nowait({"type": "session_state", "seq": 2, "data": {"state": "RUNNING"}})
+    await asyncio.sleep(0.05)
+
+    assert cursors.get("sess_1") == 2
+
+    await subscriber.stop()
+    assert json.loads((tmp_path / "cursors.json").read_text()) == {"sess_1": 2}
+
+
+@pytest.mark.asyncio
+async def test_resume_from_stored_cursor(tmp_path):
+    """Test a restart skips delivered events and delivers missed history."""
+    cursors = CursorStore(tmp_path / "cursors.json", flush_delay=0)
+    subscriber, bridge, store = _make_subscriber(cursors=cursors)
+    cursors.advance("sess_1", 2)
+
+    def replaying_subscriber(session_id: str) -> asyncio.Queue:
+        queue = store.new_subscriber(session_id)
+        for seq in range(1, 5):
+            queue.put_nowait(_seq_final(seq, f"msg {seq}", history=True))
+        return queue
+
+    subscriber._new_subscriber = replaying_subscriber
+    subscriber.subscribe("sess_1", "test")
+    subscriber._queues["sess_1"].put_nowait(_seq_final(5, "live"))
+    await asyncio.sleep(0.05)
+
+    assert [text for _, text in bridge.outputs] == ["msg 3", "msg 4", "live"]
+    assert cursors.get("sess_1") == 5
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_resume_passes_since_to_store(tmp_path):
+    """Test stores that accept since are asked to replay from the cursor."""
+    calls: list[tuple[str, int | None]] = []
+
+    def new_subscriber(session_id: str, since: int | None = None) -> asyncio.Queue:
+        calls.append((session_id, since))
+        return asyncio.Queue()
+
+    cursors = CursorStore(tmp_path / "cursors.json", flush_delay=0)
+    subscriber, bridge, store = _make_subscriber(new_subscriber=new_subscriber, cursors=cursors)
+
+    subscriber.subscribe("sess_1", "test", since=41)
+    subscriber.subscribe("sess_2", "test")
+
+    assert calls == [("sess_1", 41), ("sess_2", None)]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_cursor_waits_for_coalesced_flush(tmp_path):
+    """Test buffered output only moves the cursor once it is sent."""
+    cursors = CursorStore(tmp_path / "cursors.json", flush_delay=0)
+    subscriber, bridge, store = _make_subscriber(coalesce_delay=0.05, cursors=cursors)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_seq_final(1, "one"))
+    queue.put_nowait(_seq_final(2, "two"))
+    await asyncio.sleep(0.01)
+    assert cursors.get("sess_1") is None
+
+    await asyncio.sleep(0.1)
+    assert bridge.outputs == [("sess_1", "one\n\ntwo")]
+    assert cursors.get("sess_1") == 2
+
+    await subscriber.stop()
+
+
+class GatedBridge(FakeBridge):
+    """Fake bridge whose outputs wait until ``gate`` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = asyncio.Event()
+
+    async def on_output(self, session_id, text, metadata=None):
+        await self.gate.wait()
+        await super().on_output(session_id, text, metadata)
+
+
+class PickyBridge(FakeBridge):
+    """Fake bridge that fails outputs containing any of ``rejected``."""
+
+    def __init__(self, *rejected: str):
+        super().__init__()
+        self.rejected = set(rejected)
+
+    async def on_output(self, session_id, text, metadata=None):
+        if any(word in text for word in self.rejected):
+            raise ConnectionError("rejected")
+        await super().on_output(session_id, text, metadata)
+
+
+@pytest.mark.asyncio
+async def test_cursor_stays_behind_queued_output_when_approval_jumps(tmp_path):
+    """Test a prioritized approval doesn't move the cursor past queued output."""
+    bridge = GatedBridge()
+    cursors = CursorStore(tmp_path / "cursors.json", flush_delay=0)
+    subscriber, bridge, store = _make_subscriber(
+        bridge=bridge, prioritize_approvals=True, cursors=cursors
+    )
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    for seq in range(1, 6):
+        queue.put_nowait(_seq_final(seq, f"o{seq}"))
+    queue.put_nowait(
+        {
+            "type": "permission_request",
+            "seq": 6,
+            "data": {"request_id": "req_1", "tool_name": "Bash", "tool_input": {}},
+        }
+    )
+    await asyncio.sleep(0.02)
+
+    assert [request.request_id for _, request in bridge.approvals] == ["req_1"]
+    assert cursors.get("sess_1") is None
+
+    bridge.gate.set()
+    await asyncio.sleep(0.02)
+
+    assert len(bridge.outputs) == 5
+    assert cursors.get("sess_1") == 6
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_cursor_stays_behind_dead_letter(tmp_path):
+    """Test a delivery after a failed one doesn't move the cursor past it."""
+    cursors = CursorStore(tmp_path / "cursors.json", flush_delay=0)
+    subscriber, bridge, store = _make_subscriber(
+        bridge=PickyBridge("one"), max_delivery_attempts=3, retry_base_delay=10, cursors=cursors
+    )
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_seq_final(1, "one"))
+    queue.put_nowait(_seq_final(2, "two"))
+    await asyncio.sleep(0.02)
+
+    assert bridge.outputs == [("sess_1", "two")]
+    assert cursors.get("sess_1") is None
+
+    bridge.rejected.clear()
+    assert await subscriber.replay_dead_letters() == 1
+    assert cursors.get("sess_1") == 2
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_cursor_moves_past_exhausted_dead_letter(tmp_path):
+    """Test a letter that ran out of retries stops holding the cursor back."""
+    cursors = CursorStore(tmp_path / "cursors.json", flush_delay=0)
+    subscriber, bridge, store = _make_subscriber(
+        bridge=PickyBridge("one"), max_delivery_attempts=2, retry_base_delay=0.01, cursors=cursors
+    )
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_seq_final(1, "one"))
+    queue.put_nowait(_seq_final(2, "two"))
+    await asyncio.sleep(0.1)
+
+    [letter] = subscriber.dead_letters()
+    assert letter.exhausted
+    assert cursors.get("sess_1") == 2
+
+    bridge.rejected.clear()
+    assert await subscriber.replay_dead_letters() == 1
+    assert cursors.get("sess_1") == 2
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_cursor_moves_past_discarded_dead_letter(tmp_path):
+    """Test discarding a pending letter releases its hold on the cursor."""
+    cursors = CursorStore(tmp_path / "cursors.json", flush_delay=0)
+    subscriber, bridge, store = _make_subscriber(
+        bridge=PickyBridge("one"), max_delivery_attempts=3, retry_base_delay=10, cursors=cursors
+    )
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_seq_final(1, "one"))
+    queue.put_nowait(_seq_final(2, "two"))
+    await asyncio.sleep(0.02)
+    assert cursors.get("sess_1") is None
+
+    assert subscriber.discard_dead_letters() == 1
+    assert cursors.get("sess_1") == 2
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_cursor_stays_behind_failed_coalesced_flush(tmp_path):
+    """Test every output in a failed flush holds the cursor until discarded."""
+    cursors = CursorStore(tmp_path / "cursors.json", flush_delay=0)
+    subscriber, bridge, store = _make_subscriber(
+        bridge=PickyBridge("one"),
+        coalesce_delay=0.01,
+        max_delivery_attempts=3,
+        retry_base_delay=10,
+        cursors=cursors,
+    )
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_seq_final(1, "one"))
+    queue.put_nowait(_seq_final(2, "two"))
+    await asyncio.sleep(0.05)
+    queue.put_nowait(_seq_final(3, "three"))
+    await asyncio.sleep(0.05)
+
+    assert bridge.outputs == [("sess_1", "three")]
+    assert [letter.seqs for letter in subscriber.dead_letters()] == [(1, 2)]
+    assert cursors.get("sess_1") is None
+
+    assert subscriber.discard_dead_letters() == 1
+    assert cursors.get("sess_1") == 3
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_with_platform_forgets_cursor(tmp_path):
+    """Test removing a session's binding drops its cursor."""
+    cursors = CursorStore(tmp_path / "cursors.json", flush_delay=0)
+    subscriber, bridge, store = _make_subscriber(cursors=cursors)
+    cursors.advance("sess_1", 3)
+
+    subscriber.subscribe("sess_1", "test")
+    await subscriber.unsubscribe("sess_1", platform="test")
+
+    assert cursors.get("sess_1") is None
+
+
+# ========== Idle reaping ==========
+
+
+@pytest.mark.asyncio
+async def test_idle_session_is_reaped():
+    """Test a quiet session's queue and task are released."""
+    subscriber, bridge, store = _make_subscriber(idle_timeout=0.05)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    await asyncio.sleep(0.15)
+
+    assert "sess_1" not in subscriber._tasks
+    assert "sess_1" not in subscriber._queues
+    assert store.queues["sess_1"] == []
+    assert subscriber.is_dormant("sess_1")
+    assert subscriber.stats.reaped == 1
+    assert "put_nowait" not in queue.__dict__
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_active_session_is_not_reaped():
+    """Test sessions with recent store activity stay subscribed."""
+    subscriber, bridge, store = _make_subscriber(idle_timeout=10)
+
+    subscriber.subscribe("sess_1", "test")
+    subscriber.subscribe("sess_2", "test")
+    await asyncio.sleep(0)
+    now = subscriber._inboxes["sess_1"].last_active
+    subscriber._inboxes["sess_1"].last_active = now - 11
+
+    assert subscriber._reap_idle(now) == 1
+    assert subscriber.is_dormant("sess_1")
+    assert "sess_2" in subscriber._queues
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_busy_session_is_not_reaped():
+    """Test a session with buffered output is kept even past the timeout."""
+    subscriber, bridge, store = _make_subscriber(idle_timeout=10, coalesce_delay=10)
+
+    subscriber.subscribe("sess_1", "test")
+    subscriber._queues["sess_1"].put_nowait(_final("held"))
+    await asyncio.sleep(0.01)
+
+    assert subscriber._reap_idle(time.monotonic() + 60) == 0
+    assert "sess_1" in subscriber._queues
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_wake_resubscribes_dormant_session():
+    """Test wake() brings a reaped session back and delivers new events."""
+    subscriber, bridge, store = _make_subscriber(idle_timeout=10)
+
+    subscriber.subscribe("sess_1", "test")
+    await asyncio.sleep(0)
+    subscriber._reap_idle(time.monotonic() + 60)
+    assert subscriber.is_dormant("sess_1")
+
+    assert subscriber.wake("sess_1") is True
+    assert subscriber.wake("sess_1") is False
+    subscriber._queues["sess_1"].put_nowait(_final("back"))
+    await asyncio.sleep(0.05)
+
+    assert bridge.outputs == [("sess_1", "back")]
+    assert subscriber.stats.woken == 1
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_idle_reaping_with_worker_pool():
+    """Test pooled sessions are reaped and woken too."""
+    subscriber, bridge, store = _make_subscriber(idle_timeout=10, workers=2)
+
+    for i in range(5):
+        subscriber.subscribe(f"sess_{i}", "test")
+    subscriber._queues["sess_0"].put_nowait(_final("hi"))
+    await asyncio.sleep(0.05)
+
+    assert subscriber._reap_idle(time.monotonic() + 60) == 5
+    assert subscriber._queues == {}
+
+    subscriber.wake("sess_3")
+    subscriber._queues["sess_3"].put_nowait(_final("again"))
+    await asyncio.sleep(0.05)
+
+    assert bridge.outputs == [("sess_0", "hi"), ("sess_3", "again")]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_forgets_dormant_session():
+    """Test unsubscribing a dormant session stops wake() from reviving it."""
+    subscriber, bridge, store = _make_subscriber(idle_timeout=10)
+
+    subscriber.subscribe("sess_1", "test")
+    await asyncio.sleep(0)
+    subscriber._reap_idle(time.monotonic() + 60)
+    await subscriber.unsubscribe("sess_1", platform="test")
+
+    assert subscriber.wake("sess_1") is False
+    assert bridge.sessions_removed == ["sess_1"]
+
+    await subscriber.stop()
+
+
+# ========== Bulk subscribe ==========
+
+
+@pytest.mark.asyncio
+async def test_subscribe_many_registers_all_queues_up_front():
+    """Test every store queue exists before any consumer starts."""
+    subscriber, bridge, store = _make_subscriber()
+    seen_queues: list[int] = []
+
+    def progress(ready, total):
+        seen_queues.append(len(store.queues))
+
+    result = await subscriber.subscribe_many(
+        [(f"sess_{i}", "test") for i in range(10)], concurrency=3, on_progress=progress
+    )
+
+    assert result.subscribed == [f"sess_{i}" for i in range(10)]
+    assert result.skipped == []
+    assert result.timed_out == []
+    assert result.time_to_ready >= 0
+    assert seen_queues == [10, 10, 10, 10]
+    assert len(subscriber._tasks) == 10
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_many_staggers_consumers():
+    """Test later groups only start once earlier groups drained their backlog."""
+    bridge = SlowOutputBridge()
+    manager = BridgeManager()
+    manager.register_bridge("test", bridge)
+    store = FakeStore()
+
+    def replaying_subscriber(session_id: str) -> asyncio.Queue:
+        queue = store.new_subscriber(session_id)
+        queue.put_nowait(_final(session_id))
+        return queue
+
+    subscriber = BridgeSubscriber(manager, replaying_subscriber, store.remove_subscriber)
+    progress: list[tuple[int, int]] = []
+
+    await subscriber.subscribe_many(
+        [(f"sess_{i}", "test") for i in range(5)],
+        concurrency=2,
+        on_progress=lambda ready, total: progress.append((ready, total)),
+    )
+
+    assert progress == [(2, 5), (4, 5), (5, 5)]
+    assert sorted(bridge.log[:2]) == ["sess_0", "sess_1"]
+    assert sorted(bridge.log[2:4]) == ["sess_2", "sess_3"]
+    assert bridge.log[4] == "sess_4"
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("workers", [0, 4])
+async def test_subscribe_many_idle_groups_are_ready_without_polling(workers):
+    """Test each group is released as soon as its consumers drain, not on a timer."""
+    subscriber, bridge, store = _make_subscriber(workers=workers)
+
+    # 25 groups; polling every 10 ms per group would take at least 0.25 s.
+    result = await subscriber.subscribe_many(
+        [(f"sess_{i}", "test") for i in range(800)], concurrency=32
+    )
+
+    assert result.timed_out == []
+    assert result.time_to_ready < 0.2
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_many_skips_known_and_unroutable_sessions():
+    """Test already-subscribed sessions and unknown platforms are skipped."""
+    subscriber, bridge, store = _make_subscriber()
+    subscriber.subscribe("sess_1", "test")
+
+    result = await subscriber.subscribe_many(
+        [("sess_1", "test"), ("sess_2", "test"), ("sess_3", "nonexistent")]
+    )
+
+    assert result.subscribed == ["sess_2"]
+    assert result.skipped == ["sess_1", "sess_3"]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_many_with_worker_pool():
+    """Test pooled sessions are held until their group starts."""
+    subscriber, bridge, store = _make_subscriber(workers=2)
+
+    result = await subscriber.subscribe_many([(f"sess_{i}", "test") for i in range(4)])
+    for i in range(4):
+        subscriber._queues[f"sess_{i}"].put_nowait(_final(f"msg {i}"))
+    await asyncio.sleep(0.05)
+
+    assert result.subscribed == [f"sess_{i}" for i in range(4)]
+    assert len(bridge.outputs) == 4
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_many_reports_slow_sessions():
+    """Test sessions that don't catch up in time are reported and the ramp continues."""
+
+    class StuckBridge(FakeBridge):
+        async def on_output(self, session_id, text, metadata=None):
+            await asyncio.sleep(10)
+
+    bridge = StuckBridge()
+    manager = BridgeManager()
+    manager.register_bridge("test", bridge)
+    store = FakeStore()
+
+    def replaying_subscriber(session_id: str) -> asyncio.Queue:
+        queue = store.new_subscriber(session_id)
+        if session_id == "sess_0":
+            queue.put_nowait(_final("stuck"))
+        return queue
+
+    subscriber = BridgeSubscriber(manager, replaying_subscriber, store.remove_subscriber)
+
+    result = await subscriber.subscribe_many(
+        [("sess_0", "test"), ("sess_1", "test")], concurrency=1, ready_timeout=0.05
+    )
+
+    assert result.timed_out == ["sess_0"]
+    assert "sess_1" in subscriber._tasks
+
+    await subscriber.stop()
+
+
+# ========== Dead letters ==========
+
+
+class FlakyBridge(FakeBridge):
+    """Fake bridge whose sends fail while ``down`` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.down = True
+        self.attempts = 0
+
+    async def on_output(self, session_id, text, metadata=None):
+        self.attempts += 1
+        if self.down:
+            raise ConnectionError("platform unavailable")
+        await super().on_output(session_id, text, metadata)
+
+
+@pytest.mark.asyncio
+async def test_failed_delivery_is_retried():
+    """Test a transient failure delays the message instead of losing it."""
+    bridge = FlakyBridge()
+    subscriber, bridge, store = _make_subscriber(
+        bridge, max_delivery_attempts=5, retry_base_delay=0.02
+    )
+
+    subscriber.subscribe("sess_1", "test")
+    subscriber._queues["sess_1"].put_nowait(_final("hello"))
+    await asyncio.sleep(0.01)
+
+    [letter] = subscriber.dead_letters("test")
+    assert letter.session_id == "sess_1"
+    assert "ConnectionError" in letter.error
+
+    bridge.down = False
+    await asyncio.sleep(0.1)
+
+    assert bridge.outputs == [("sess_1", "hello")]
+    assert subscriber.dead_letters() == []
+    assert subscriber.stats.dead_lettered == 1
+    assert subscriber.stats.redelivered == 1
+
+    await subscriber.stop()
+
+
+class PartsBridge(FakeBridge):
+    """Fake bridge that sends each line as its own message, keyed like the real bridges."""
+
+    def __init__(self):
+        super().__init__()
+        self.sent: list[str] = []
+        self.fail_once = {"two"}
+
+    async def on_output(self, session_id, text, metadata=None):
+        message_key = self._message_key(session_id, metadata)
+        for index, line in enumerate(text.splitlines()):
+            await self._dispatch(
+                functools.partial(self._send_part, line),
+                session_id=session_id,
+                idempotency_key=f"{message_key}:{index}",
+            )
+
+    async def _send_part(self, line: str) -> None:
+        if line in self.fail_once:
+            self.fail_once.discard(line)
+            raise RuntimeError("rejected")
+        self.sent.append(line)
+
+
+@pytest.mark.asyncio
+async def test_redelivery_without_seq_skips_sent_parts():
+    """Test a retried output the store gave no seq doesn't repost its sent parts."""
+    bridge = PartsBridge()
+    subscriber, bridge, store = _make_subscriber(
+        bridge, max_delivery_attempts=5, retry_base_delay=0.02
+    )
+
+    subscriber.subscribe("sess_1", "test")
+    subscriber._queues["sess_1"].put_nowait(_final("one\ntwo\nthree"))
+    await asyncio.sleep(0.1)
+
+    assert bridge.sent == ["one", "two", "three"]
+    assert subscriber.dead_letters() == []
+    assert subscriber.stats.redelivered == 1
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_dead_letter_exhausts_and_can_be_replayed():
+    """Test letters stop retrying after max attempts but remain replayable."""
+    bridge = FlakyBridge()
+    subscriber, bridge, store = _make_subscriber(
+        bridge, max_delivery_attempts=3, retry_base_delay=0.02
+    )
+
+    subscriber.subscribe("sess_1", "test")
+    subscriber._queues["sess_1"].put_nowait(_final("hello"))
+    await asyncio.sleep(0.2)
+
+    [letter] = subscriber.dead_letters()
+    assert letter.exhausted
+    assert bridge.attempts == 3
+    assert subscriber.stats.exhausted == 1
+
+    bridge.down = False
+    assert await subscriber.replay_dead_letters("test", ids=[letter.id]) == 1
+    assert bridge.outputs == [("sess_1", "hello")]
+    assert subscriber.dead_letters() == []
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_discard_dead_letters():
+    """Test dead letters can be dropped without delivery."""
+    bridge = FlakyBridge()
+    subscriber, bridge, store = _make_subscriber(
+        bridge, max_delivery_attempts=5, retry_base_delay=10
+    )
+
+    subscriber.subscribe("sess_1", "test")
+    subscriber._queues["sess_1"].put_nowait(_final("one"))
+    subscriber._queues["sess_1"].put_nowait(_final("two"))
+    await asyncio.sleep(0.01)
+
+    assert len(subscriber.dead_letters(session_id="sess_1")) == 2
+    assert subscriber.discard_dead_letters("test") == 2
+    assert subscriber.dead_letters() == []
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_coalesced_flush_is_dead_lettered():
+    """Test a merged message that fails to send is retried as a whole."""
+    bridge = FlakyBridge()
+    subscriber, bridge, store = _make_subscriber(
+        bridge, max_delivery_attempts=5, retry_base_delay=0.02, coalesce_delay=0.01
+    )
+
+    subscriber.subscribe("sess_1", "test")
+    subscriber._queues["sess_1"].put_nowait(_final("one"))
+    subscriber._queues["sess_1"].put_nowait(_final("two"))
+    await asyncio.sleep(0.03)
+    bridge.down = False
+    await asyncio.sleep(0.1)
+
+    assert bridge.outputs == [("sess_1", "one\n\ntwo")]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_approval_is_retried():
+    """Test approvals are dead-lettered and redelivered like outputs."""
+
+    class FlakyApprovalBridge(FakeBridge):
+        def __init__(self):
+            super().__init__()
+            self.failures = 1
+
+        async def on_approval_request(self, session_id, request):
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("platform unavailable")
+            await super().on_approval_request(session_id, request)
+
+    bridge = FlakyApprovalBridge()
+    subscriber, bridge, store = _make_subscriber(
+        bridge, max_delivery_attempts=5, retry_base_delay=0.02
+    )
+
+    subscriber.subscribe("sess_1", "test")
+    subscriber._queues["sess_1"].put_nowait(
+        {"type": "permission_request", "data": {"request_id": "req_1", "tool_name": "Bash"}}
+    )
+    await asyncio.sleep(0.1)
+
+    assert [req.request_id for _, req in bridge.approvals] == ["req_1"]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_platform_bridge_failure_is_dead_lettered(tmp_path):
+    """Test a real bridge whose sends keep failing has the event dead-lettered."""
+    pytest.importorskip("telegram")
+    from telegram.error import NetworkError
+
+    from agent_tether.outbound import OutboundDispatcher
+    from agent_tether.telegram.bot import TelegramBridge
+
+    class FakeBot:
+        def __init__(self):
+            self.down = True
+            self.sent = []
+
+        async def send_message(self, **kwargs):
+            if self.down:
+                raise NetworkError("Bad Gateway")
+            self.sent.append(kwargs["text"])
+
+    bridge = TelegramBridge(
+        bot_token="token", forum_group_id=-100, config=BridgeConfig(data_dir=str(tmp_path))
+    )
+    bridge._app = type("FakeApp", (), {"bot": FakeBot()})()
+    bridge._state.set_topic_for_session("sess_1", 7, "Session")
+    subscriber, bridge, store = _make_subscriber(
+        bridge, max_delivery_attempts=5, retry_base_delay=0.05
+    )
+    bridge.set_dispatcher(OutboundDispatcher(max_attempts=2, backoff_base=0.001))
+
+    subscriber.subscribe("sess_1", "test")
+    subscriber._queues["sess_1"].put_nowait(_final("hello"))
+    await asyncio.sleep(0.03)
+
+    [letter] = subscriber.dead_letters("test")
+    assert "DeliveryError" in letter.error
+    assert "Bad Gateway" in letter.error
+
+    bridge._app.bot.down = False
+    await asyncio.sleep(0.2)
+
+    assert bridge._app.bot.sent == ["hello"]
+    assert subscriber.dead_letters() == []
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_failures_dropped_without_dead_lettering():
+    """Test failed deliveries are only logged by default."""
+    bridge = FlakyBridge()
+    manager = BridgeManager()
+    manager.register_bridge("test", bridge)
+    store = FakeStore()
+    subscriber = BridgeSubscriber(manager, store.new_subscriber, store.remove_subscriber)
+
+    subscriber.subscribe("sess_1", "test")
+    subscriber._queues["sess_1"].put_nowait(_final("hello"))
+    await asyncio.sleep(0.05)
+
+    assert subscriber.dead_letters() == []
+    assert subscriber.stats.dead_lettered == 0
+
+    await subscriber.stop()
+
+
+# ========== Routing index ==========
+
+
+@pytest.mark.asyncio
+async def test_subscribe_uses_bound_platform():
+    """Test subscribe without a platform routes to the session's binding."""
+    bridge = FakeBridge()
+    manager = BridgeManager()
+    manager.register_bridge("test", bridge)
+    manager.bind_session("sess_1", ["test"])
+    store = FakeStore()
+    subscriber = BridgeSubscriber(manager, store.new_subscriber, store.remove_subscriber)
+
+    subscriber.subscribe("sess_1")
+    subscriber.subscribe("sess_2")
+    subscriber._queues["sess_1"].put_nowait(_final("hello"))
+    await asyncio.sleep(0.01)
+
+    assert bridge.outputs == [("sess_1", "hello")]
+    assert "sess_2" not in subscriber._queues
+
+    await subscriber.unsubscribe("sess_1", platform="test")
+    assert manager.get_platforms("sess_1") == []
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_fans_out_to_every_bound_platform():
+    """Test a session bound to two platforms has its events delivered to both."""
+    first, second = FakeBridge(), FakeBridge()
+    manager = BridgeManager()
+    manager.register_bridge("first", first)
+    manager.register_bridge("second", second)
+    subscriber, _, store = _make_subscriber(manager=manager)
+    manager.bind_session("sess_1", ["first", "second"])
+
+    subscriber.subscribe("sess_1")
+    subscriber._queues["sess_1"].put_nowait(_final("hello"))
+    await asyncio.sleep(0.01)
+
+    assert first.outputs == [("sess_1", "hello")]
+    assert second.outputs == [("sess_1", "hello")]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_again_adds_platform():
+    """Test subscribing a session with a second platform mirrors it there too."""
+    first, second = FakeBridge(), FakeBridge()
+    manager = BridgeManager()
+    manager.register_bridge("first", first)
+    manager.register_bridge("second", second)
+    subscriber, _, store = _make_subscriber(manager=manager)
+
+    subscriber.subscribe("sess_1", "first")
+    subscriber.subscribe("sess_1", "second")
+    subscriber._queues["sess_1"].put_nowait(_final("hello"))
+    await asyncio.sleep(0.01)
+
+    assert first.outputs == [("sess_1", "hello")]
+    assert second.outputs == [("sess_1", "hello")]
+
+    await subscriber.unsubscribe("sess_1", platform="second")
+    subscriber._queues["sess_1"].put_nowait(_final("again"))
+    await asyncio.sleep(0.01)
+
+    assert first.outputs == [("sess_1", "hello"), ("sess_1", "again")]
+    assert second.outputs == [("sess_1", "hello")]
+    assert "sess_1" in second.sessions_removed
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_mirrored_failure_is_dead_lettered_per_platform(tmp_path):
+    """Test a platform that fails gets its own dead letter and holds the cursor."""
+    first, second = FakeBridge(), PickyBridge("hello")
+    manager = BridgeManager()
+    manager.register_bridge("first", first)
+    manager.register_bridge("second", second)
+    store = FakeStore()
+    cursors = CursorStore(tmp_path / "cursors.json", flush_delay=0)
+    subscriber = BridgeSubscriber(
+        manager,
+        store.new_subscriber,
+        store.remove_subscriber,
+        cursors=cursors,
+        max_delivery_attempts=3,
+        retry_base_delay=10,
+    )
+    manager.bind_session("sess_1", ["first", "second"])
+
+    subscriber.subscribe("sess_1")
+    subscriber._queues["sess_1"].put_nowait(_seq_final(1, "hello"))
+    await asyncio.sleep(0.01)
+
+    assert first.outputs == [("sess_1", "hello")]
+    assert [letter.platform for letter in subscriber.dead_letters()] == ["second"]
+    assert cursors.get("sess_1") is None
+
+    second.rejected.clear()
+    assert await subscriber.replay_dead_letters("second") == 1
+    assert second.outputs == [("sess_1", "hello")]
+    assert cursors.get("sess_1") == 1
+
+    await subscriber.stop()
+
+
+# ========== Manager delivery ==========
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_holds_subscriber_deliveries():
+    """Test subscriber deliveries go through the bridge's circuit breaker."""
+    bridge = FlakyBridge()
+    manager = BridgeManager(failure_threshold=0.5, breaker_min_calls=2, breaker_reset_timeout=0.05)
+    manager.register_bridge("test", bridge)
+    store = FakeStore()
+    subscriber = BridgeSubscriber(manager, store.new_subscriber, store.remove_subscriber)
+
+    subscriber.subscribe("sess_1", "test")
+    queue = subscriber._queues["sess_1"]
+    queue.put_nowait(_final("one"))
+    queue.put_nowait(_final("two"))
+    await asyncio.sleep(0.01)
+    queue.put_nowait(_final("three"))
+    await asyncio.sleep(0.01)
+
+    assert bridge.attempts == 2
+    assert manager.get_health("test").state == "open"
+    assert manager.get_health("test").buffered == 1
+
+    bridge.down = False
+    await asyncio.sleep(0.1)
+
+    assert bridge.outputs == [("sess_1", "three")]
+
+    await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_send_timeout_applies_to_subscriber_deliveries():
+    """Test a hung bridge call is cut off by the manager and dead-lettered."""
+
+    class HangingBridge(FakeBridge):
+        async def on_output(self, session_id, text, metadata=None):
+            await self._dispatch(lambda: asyncio.sleep(10), session_id=session_id)
+
+    manager = BridgeManager(send_timeout=0.01)
+    manager.register_bridge("test", HangingBridge())
+    store = FakeStore()
+    subscriber = BridgeSubscriber(
+        manager,
+        store.new_subscriber,
+        store.remove_subscriber,
+        max_delivery_attempts=3,
+        retry_base_delay=10,
+    )
+
+    subscriber.subscribe("sess_1", "test")
+    subscriber._queues["sess_1"].put_nowait(_final("hello"))
+    await asyncio.sleep(0.2)
+
+    [letter] = subscriber.dead_letters()
+    assert letter.error.startswith("TimeoutError")
+    assert manager.get_health("test").error_rate == 1.0
+
+    await subscriber.stop()
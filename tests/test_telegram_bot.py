@@ -0,0 +1,210 @@
+"""Tests for the Telegram bridge's outbound sends."""
+
+import pytest
+
+from agent_tether.base import BridgeConfig, DeliveryError
+
+# ========== Sending ==========
+
+
+@pytest.mark.asyncio
+async def test_telegram_send_retries_flood_control(tmp_path):
+    """Test TelegramBridge retries RetryAfter instead of dropping the message."""
+    pytest.importorskip("telegram")
+    from telegram.error import RetryAfter
+
+    from agent_tether.telegram.bot import TelegramBridge
+
+    class FakeBot:
+        def __init__(self):
+            self.sent = []
+            self.failures = 1
+
+        async def send_message(self, **kwargs):
+            if self.failures:
+                self.failures -= 1
+                raise RetryAfter(0)
+            self.sent.append(kwargs)
+
+    class FakeApp:
+        def __init__(self):
+            self.bot = FakeBot()
+
+    bridge = TelegramBridge(
+        bot_token="token", forum_group_id=-100, config=BridgeConfig(data_dir=str(tmp_path))
+    )
+    bridge._app = FakeApp()
+    bridge._state.set_topic_for_session("sess_1", 7, "Session")
+
+    await bridge.on_output("sess_1", "hello")
+
+    assert [m["text"] for m in bridge._app.bot.sent] == ["hello"]
+    assert bridge.send_stats.retried == 1
+
+
+@pytest.mark.asyncio
+async def test_telegram_retries_network_errors(tmp_path):
+    """Test a transient network error is retried with backoff, once per message."""
+    pytest.importorskip("telegram")
+    from telegram.error import NetworkError
+
+    from agent_tether.outbound import OutboundDispatcher
+    from agent_tether.telegram.bot import TelegramBridge
+
+    class FakeBot:
+        def __init__(self):
+            self.sent = []
+            self.failures = 2
+
+        async def send_message(self, **kwargs):
+            if self.failures:
+                self.failures -= 1
+                raise NetworkError("Bad Gateway")
+            self.sent.append(kwargs)
+
+    bridge = TelegramBridge(
+        bot_token="token", forum_group_id=-100, config=BridgeConfig(data_dir=str(tmp_path))
+    )
+    bridge._app = type("FakeApp", (), {"bot": FakeBot()})()
+    bridge.set_dispatcher(OutboundDispatcher(backoff_base=0.001))
+    bridge._state.set_topic_for_session("sess_1", 7, "Session")
+
+    await bridge.on_output("sess_1", "hello", {"seq": 3})
+    await bridge.on_output("sess_1", "hello", {"seq": 3})
+
+    assert [m["text"] for m in bridge._app.bot.sent] == ["hello"]
+    assert bridge._dispatcher.stats.attempts == {3: 1}
+    assert bridge._dispatcher.stats.deduplicated == 1
+
+
+@pytest.mark.asyncio
+async def test_telegram_command_replies_and_topics_go_through_dispatcher(tmp_path):
+    """Test command replies and topic creation are retried on flood control like sends."""
+    pytest.importorskip("telegram")
+    from telegram.error import RetryAfter
+
+    from agent_tether.telegram.bot import TelegramBridge
+
+    calls = []
+
+    class FakeMessage:
+        chat_id = -100
+        message_thread_id = None
+
+        async def reply_text(self, text, **kwargs):
+            calls.append(("reply", text))
+            if len(calls) == 1:
+                raise RetryAfter(0)
+
+    class FakeBot:
+        async def create_forum_topic(self, **kwargs):
+            calls.append(("topic", kwargs["name"]))
+            if len(calls) == 3:
+                raise RetryAfter(0)
+            return type("Topic", (), {"message_thread_id": 7})()
+
+    bridge = TelegramBridge(
+        bot_token="token", forum_group_id=-100, config=BridgeConfig(data_dir=str(tmp_path))
+    )
+    bridge._app = type("FakeApp", (), {"bot": FakeBot()})()
+
+    await bridge._cmd_stop(type("Update", (), {"message": FakeMessage()})(), None)
+    thread = await bridge.create_thread("sess_1", "Session")
+
+    assert calls == [
+        ("reply", "Use this command inside a session topic."),
+        ("reply", "Use this command inside a session topic."),
+        ("topic", "Session"),
+        ("topic", "Session"),
+    ]
+    assert thread["topic_id"] == 7
+    assert bridge.send_stats.retried == 2
+
+
+@pytest.mark.asyncio
+async def test_telegram_plain_fallback_keeps_every_chunk(tmp_path):
+    """Test the plain-text fallback sends each rejected chunk, not a truncated original."""
+    pytest.importorskip("telegram")
+    from telegram.error import BadRequest
+
+    from agent_tether.telegram.bot import TelegramBridge
+
+    class FakeBot:
+        def __init__(self):
+            self.sent = []
+
+        async def send_message(self, **kwargs):
+            if kwargs.get("parse_mode") == "HTML":
+                raise BadRequest("Can't parse entities")
+            self.sent.append(kwargs)
+
+    bridge = TelegramBridge(
+        bot_token="token", forum_group_id=-100, config=BridgeConfig(data_dir=str(tmp_path))
+    )
+    bridge._app = type("FakeApp", (), {"bot": FakeBot()})()
+    bridge._state.set_topic_for_session("sess_1", 7, "Session")
+    text = "line of **output**\n" * 600
+
+    await bridge.on_output("sess_1", text)
+
+    sent = [m["text"] for m in bridge._app.bot.sent]
+    assert len(sent) > 1
+    assert "".join(sent) == text.replace("**", "")
+    assert bridge._dispatcher.stats.retried == 0
+
+
+@pytest.mark.asyncio
+async def test_telegram_timeout_is_not_resent(tmp_path):
+    """Test a timed-out send is neither retried nor resent as plain text."""
+    pytest.importorskip("telegram")
+    from telegram.error import TimedOut
+
+    from agent_tether.telegram.bot import TelegramBridge
+
+    class FakeBot:
+        def __init__(self):
+            self.calls = []
+
+        async def send_message(self, **kwargs):
+            self.calls.append(kwargs)
+            raise TimedOut()
+
+    bridge = TelegramBridge(
+        bot_token="token", forum_group_id=-100, config=BridgeConfig(data_dir=str(tmp_path))
+    )
+    bridge._app = type("FakeApp", (), {"bot": FakeBot()})()
+    bridge._state.set_topic_for_session("sess_1", 7, "Session")
+
+    with pytest.raises(DeliveryError):
+        await bridge.on_output("sess_1", "hello")
+
+    assert [call.get("parse_mode") for call in bridge._app.bot.calls] == ["HTML"]
+    assert bridge._dispatcher.stats.retried == 0
+
+
+@pytest.mark.asyncio
+async def test_telegram_plain_fallback_only_for_bad_request(tmp_path):
+    """Test errors other than BadRequest don't trigger the plain-text resend."""
+    pytest.importorskip("telegram")
+    from telegram.error import Forbidden
+
+    from agent_tether.telegram.bot import TelegramBridge
+
+    class FakeBot:
+        def __init__(self):
+            self.calls = []
+
+        async def send_message(self, **kwargs):
+            self.calls.append(kwargs)
+            raise Forbidden("bot was kicked from the group")
+
+    bridge = TelegramBridge(
+        bot_token="token", forum_group_id=-100, config=BridgeConfig(data_dir=str(tmp_path))
+    )
+    bridge._app = type("FakeApp", (), {"bot": FakeBot()})()
+    bridge._state.set_topic_for_session("sess_1", 7, "Session")
+
+    with pytest.raises(DeliveryError, match="kicked"):
+        await bridge.on_output("sess_1", "**hello**")
+
+    assert len(bridge._app.bot.calls) == 1
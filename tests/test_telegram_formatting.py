@@ -1,13 +1,20 @@
 """Tests for Telegram formatting utilities."""
 
+from pathlib import Path
+
+import pytest
+
 from agent_tether.telegram.formatting import (
     chunk_message,
     escape_markdown,
+    html_to_plain_text,
     markdown_to_telegram_html,
     strip_tool_markers,
-    _markdown_table_to_pre,
 )
 
+# Sample replies (*.md) and the HTML they render to (*.html).
+GOLDEN = Path(__file__).parent / "golden" / "telegram_html"
+
 # ========== escape_markdown ==========
 
 
@@ -113,16 +120,45 @@ def test_markdown_to_html_escapes_html():
     assert "&lt;script&gt;" in result
 
 
-# ========== _markdown_table_to_pre ==========
+def test_markdown_to_html_code_is_verbatim():
+    """Test markup inside code spans and blocks is left alone."""
+    assert markdown_to_telegram_html("`**x**`") == "<code>**x**</code>"
+    result = markdown_to_telegram_html("```\n# not a heading\n**x** [a](b)\n```")
+    assert result == "<pre># not a heading\n**x** [a](b)</pre>"
+
+
+def test_markdown_to_html_table_cells_are_verbatim():
+    """Test table cells keep their Markdown instead of nesting tags in <pre>."""
+    result = markdown_to_telegram_html("| **a** | `b` |\n|---|---|\n| c | d |")
+    assert result == "<pre>**a**  `b`\nc      d  </pre>"
+
+
+def test_markdown_to_html_nests_tags():
+    """Test overlapping markers produce properly nested tags."""
+    assert markdown_to_telegram_html("***both***") == "<b><i>both</i></b>"
+    assert markdown_to_telegram_html("*a **b* c**") == "<i>a **b</i> c**"
+
+
+def test_markdown_to_html_unpaired_markers_stay_text():
+    """Test delimiters without a partner are kept as written."""
+    text = "A lone * star and an unclosed **bold marker"
+    assert markdown_to_telegram_html(text) == text
+
+
+@pytest.mark.parametrize("name", sorted(p.stem for p in GOLDEN.glob("*.md")))
+def test_markdown_to_html_golden(name):
+    """Test output matches the recorded HTML for sample agent replies."""
+    source = (GOLDEN / f"{name}.md").read_text()
+    assert markdown_to_telegram_html(source) == (GOLDEN / f"{name}.html").read_text()
+
+
+# ========== Tables ==========
 
 
 def test_markdown_table_to_pre():
     """Test markdown table converts to <pre> block."""
-    import html
-
     table = "| Name | Age |\n|------|-----|\n| Alice | 30 |\n| Bob | 25 |"
-    escaped = html.escape(table)
-    result = _markdown_table_to_pre(escaped)
+    result = markdown_to_telegram_html(table)
     assert "<pre>" in result
     assert "</pre>" in result
     assert "Alice" in result
@@ -131,11 +167,8 @@ def test_markdown_table_to_pre():
 
 def test_markdown_table_alignment():
     """Test table columns are aligned."""
-    import html
-
     table = "| A | B |\n|---|---|\n| short | longer value |\n| x | y |"
-    escaped = html.escape(table)
-    result = _markdown_table_to_pre(escaped)
+    result = markdown_to_telegram_html(table)
     assert "<pre>" in result
     # Separator row should be stripped
     assert "---" not in result
@@ -204,3 +237,63 @@ def test_chunk_message_custom_limit():
 def test_chunk_message_empty():
     """Test empty message returns single empty chunk."""
     assert chunk_message("") == [""]
+
+
+def test_chunk_message_prefers_paragraph_then_line_breaks():
+    """Test chunks end after a blank line, else a newline, when one is late enough."""
+    text = "a" * 20 + "\n\n" + "b" * 5 + "\n" + "c" * 20
+    assert chunk_message(text, limit=30) == ["a" * 20 + "\n\n", "b" * 5 + "\n" + "c" * 20]
+    text = "a" * 20 + "\n" + "b" * 20
+    assert chunk_message(text, limit=30) == ["a" * 20 + "\n", "b" * 20]
+
+
+def test_chunk_message_ignores_early_breaks():
+    """Test a break that would leave the chunk under half full isn't used."""
+    text = "ab\n" + "c" * 40
+    assert chunk_message(text, limit=30) == [text[:30], text[30:]]
+
+
+def test_chunk_message_reopens_tags():
+    """Test tags open at a cut are closed and reopened in the next chunk."""
+    text = '<b>bold <a href="https://x.y/a b">' + "w " * 20 + "</a></b> tail"
+    chunks = chunk_message(text, limit=30)
+    assert chunks[0].endswith("</a></b>")
+    assert chunks[1].startswith('<b><a href="https://x.y/a b">')
+    assert [html_to_plain_text(c) for c in chunks] == [
+        "bold " + "w " * 12,
+        "w " * 8 + " tail",
+    ]
+
+
+def test_chunk_message_splits_pre_blocks_at_lines():
+    """Test a long <pre> block is split between lines, each part a valid block."""
+    text = "<pre>" + "line\n" * 10 + "</pre>"
+    chunks = chunk_message(text, limit=22)
+    assert chunks == ["<pre>" + "line\n" * 4 + "</pre>"] * 2 + ["<pre>" + "line\n" * 2 + "</pre>"]
+
+
+def test_chunk_message_counts_entities_as_one_character():
+    """Test entities count as the character they stand for and are never split."""
+    text = "&lt;" * 10
+    assert chunk_message(text, limit=4) == ["&lt;" * 4, "&lt;" * 4, "&lt;" * 2]
+
+
+def test_chunk_message_counts_utf16_code_units():
+    """Test characters outside the BMP count twice and aren't split."""
+    assert chunk_message("😀" * 3, limit=5) == ["😀😀", "😀"]
+    assert chunk_message("a😀b", limit=2) == ["a", "😀", "b"]
+    assert chunk_message("<b>😀😀</b>", limit=1) == ["<b>😀</b>", "<b>😀</b>"]
+
+
+# ========== html_to_plain_text ==========
+
+
+def test_html_to_plain_text_strips_tags_and_entities():
+    """Test tags are dropped and entities unescaped."""
+    html_text = markdown_to_telegram_html("**a < b** and `x & y`")
+    assert html_to_plain_text(html_text) == "a < b and x & y"
+
+
+def test_html_to_plain_text_drops_cut_off_tag():
+    """Test a tag cut off at the end of a chunk is dropped."""
+    assert html_to_plain_text("done <b>bold</b> <pr") == "done bold "